@@ -0,0 +1,64 @@
+import streamlit as st
+from utils.record_log import get_log_store, LogWriter, LOG_ENCODING, get_log_dir
+
+PAGE_SIZE_OPTIONS = [20, 50, 100, 200]
+
+def show_change_log():
+    """
+    Change Log 페이지를 표시합니다.
+
+    SQLite 로그 저장소를 필터 조건으로 조회하고,
+    조회 결과는 서버에서 페이지 단위로 잘라 필요한 행만 가져옵니다.
+    """
+    st.header("🗂️ Change Log")
+
+    log_store = get_log_store()
+
+    filt_col1, filt_col2, filt_col3, filt_col4 = st.columns([1, 1, 2, 1])
+    with filt_col1 :
+        panel_filter = st.text_input("패널 번호", value="")
+    with filt_col2 :
+        answer_filter = st.text_input("응답 ID", value="")
+    with filt_col3 :
+        error_type_filter = st.multiselect("오류 유형", log_store.distinct('error_type'))
+    with filt_col4 :
+        method_filter = st.multiselect("처리 방식", log_store.distinct('method'))
+
+    date_col1, date_col2, date_col3 = st.columns([1, 1, 3])
+    with date_col1 :
+        date_from = st.date_input("수정 일자 (From)", value=None)
+    with date_col2 :
+        date_to = st.date_input("수정 일자 (To)", value=None)
+
+    filters = {
+        'panel_no': panel_filter,
+        'unique_id': answer_filter,
+        'error_type': error_type_filter,
+        'method': method_filter,
+        'date_from': date_from.strftime('%Y%m%d') if date_from else None,
+        'date_to': date_to.strftime('%Y%m%d') if date_to else None,
+    }
+
+    total = log_store.count(filters)
+
+    page_col1, page_col2, page_col3 = st.columns([1, 1, 4], vertical_alignment="bottom")
+    with page_col1 :
+        page_size = st.selectbox("페이지 크기", PAGE_SIZE_OPTIONS, index=1)
+    page_count = max((total - 1) // page_size + 1, 1)
+    with page_col2 :
+        page = st.number_input("페이지", min_value=1, max_value=page_count, value=1, step=1)
+    with page_col3 :
+        st.caption(f"총 {total:,}건 / {page_count:,} 페이지")
+
+    if total == 0 :
+        st.info("조회된 로그가 없습니다.")
+    else :
+        log_df = log_store.query(filters, limit=page_size, offset=(page - 1) * page_size)
+        st.dataframe(log_df, hide_index=True, width='stretch')
+
+    with st.expander("기존 로그 CSV 가져오기", expanded=False) :
+        st.caption("로그 폴더의 일자별 로그 CSV(log_*.csv)를 조회용 저장소로 가져옵니다. 이미 저장된 행은 건너뜁니다.")
+        if st.button("Import Log CSV", width=300) :
+            with st.spinner("로그를 가져오는 중입니다..."):
+                imported = log_store.import_csv_logs(get_log_dir(), LOG_ENCODING, LogWriter.hash_rows)
+            st.success(f"✅ {imported:,}건 저장")
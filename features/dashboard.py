@@ -2,8 +2,125 @@ import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
 from utils.data_loader import show_data_info
+from utils.dataset import get_dataset
+from utils.cache_stats import tracked_cache
 from features.setting import get_column_name, get_problem_columns, get_ui_color
 
+# 세션 간 공유되는 대시보드 캐시 크기 (가장 오래 사용되지 않은 항목부터 제거)
+DASHBOARD_CACHE_ENTRIES = 16
+
+
+def get_dashboard_settings() -> tuple:
+    """대시보드 집계에 영향을 주는 설정값을 캐시 키로 사용할 수 있는 튜플로 반환합니다."""
+    return (
+        get_column_name('panel_no'),
+        get_column_name('area'),
+        get_column_name('age_5'),
+        get_column_name('product_col'),
+        get_column_name('answer_date'),
+        tuple(get_problem_columns()),
+    )
+
+
+def build_problem_matrix(df: pd.DataFrame, problem_columns: list, product_col: str) -> dict:
+    """
+    Q6(문제점) 컬럼 전체의 응답값 x 제품 응답 수 행렬을 한 번의 그룹 집계로 생성합니다.
+
+    Q6 컬럼을 세로로 펼친(melt) 뒤 (문제 컬럼, 응답값, 제품) 단위로 한 번에 집계하므로,
+    컬럼마다 crosstab을 만들어 이어 붙이는 방식과 결과는 같고 전체 데이터는 한 번만 읽습니다.
+
+    Args:
+        df (DataFrame): 작업 데이터
+        problem_columns (list): 데이터에 존재하는 Q6 컬럼명 리스트 (표시 순서)
+        product_col (str): 제품 컬럼명
+
+    Returns:
+        dict: counts(응답 수), percent(제품별 응답 수 대비 %), totals(제품별 응답 수)
+    """
+    melted = df[problem_columns + [product_col]].melt(
+        id_vars=product_col, var_name='problem', value_name='value'
+    )
+    # 제품별 응답 수 (Q6 컬럼 수만큼 펼쳐졌으므로 컬럼 수로 나눔)
+    totals = melted.groupby(product_col, observed=True).size() // len(problem_columns)
+    # 범주형 제품 컬럼(CSV 타입 지정 읽기)도 일반 컬럼 헤더로 표시
+    totals.index = pd.Index(totals.index.tolist(), name=product_col)
+
+    melted = melted.dropna(subset=['value'])
+    melted['problem'] = pd.Categorical(melted['problem'], categories=problem_columns)
+    counts = (
+        melted.groupby(['problem', 'value', product_col], observed=True)
+        .size()
+        .unstack(product_col, fill_value=0)
+        .reindex(columns=totals.index, fill_value=0)
+    )
+    counts.index = counts.index.get_level_values('value')
+    counts.index.name = "Q6 By Q3"
+    counts.columns.name = product_col
+
+    percent = (counts / totals.replace(0, pd.NA) * 100).astype(float).round(1).fillna(0)
+    return {'counts': counts, 'percent': percent, 'totals': totals}
+
+
+@tracked_cache(max_entries=DASHBOARD_CACHE_ENTRIES, show_spinner=False)
+def build_dashboard_aggregates(_df: pd.DataFrame, data_token: str, settings: tuple) -> dict:
+    """
+    대시보드 집계를 계산합니다.
+
+    데이터 토큰(데이터셋 ID + 버전)과 설정값이 같으면 세션에 관계없이 캐시된 결과를 재사용합니다.
+
+    Args:
+        _df (DataFrame): 작업 데이터 (해시하지 않음)
+        data_token (str): 데이터셋 토큰
+        settings (tuple): get_dashboard_settings() 결과
+
+    Returns:
+        dict: date_count, area_by_age_5, q6_by_q3 집계 (컬럼이 없으면 None)
+    """
+    panel_no, area, age_5, product_col, answer_date, problem_columns = settings
+    df = _df
+    aggregates = {'date_count': None, 'area_by_age_5': None, 'q6_by_q3': None}
+
+    # 날짜별 응답 수
+    if answer_date in df.columns:
+        answer_day = pd.to_datetime(df[answer_date]).dt.normalize()
+        date_count = answer_day.value_counts().sort_index()
+        date_count.index = date_count.index.strftime('%m월 %d일')
+        aggregates['date_count'] = date_count
+
+    # AREA BY AGE_5 CROSSTABLE
+    if age_5 in df.columns and area in df.columns:
+        unique_df = df[[panel_no, age_5, area]].drop_duplicates()
+        area_by_age_5_crosstable = pd.crosstab(unique_df[age_5], unique_df[area])
+        area_by_age_5_crosstable.index.name = f"Total : {len(unique_df)}'s"
+        aggregates['area_by_age_5'] = area_by_age_5_crosstable
+
+    # Q6 by Q3 crosstab
+    existing_problem_columns = [col for col in problem_columns if col in df.columns]
+    if existing_problem_columns and product_col in df.columns:
+        aggregates['q6_by_q3'] = build_problem_matrix(df, existing_problem_columns, product_col)
+
+    return aggregates
+
+
+@tracked_cache(st.cache_resource, max_entries=DASHBOARD_CACHE_ENTRIES, show_spinner=False)
+def build_date_count_chart(_date_count: pd.Series, data_token: str, settings: tuple, chart_color: str) -> go.Figure:
+    """날짜별 응답 수 막대 차트를 생성합니다. (데이터 토큰/설정별로 한 번만 생성)"""
+    fig = go.Figure(data=go.Bar(
+        x=_date_count.index,
+        y=_date_count.values,
+        name='Response Count',
+        marker_color=chart_color
+    ))
+
+    fig.update_layout(
+        xaxis_title="Date",
+        yaxis_title="Response Count",
+        xaxis=dict(tickangle=45),
+        showlegend=False
+    )
+    return fig
+
+
 def show_dashboard():
     """Dashboard 페이지를 표시합니다."""
     st.header('📊 Dashboard')
@@ -11,53 +128,31 @@ def show_dashboard():
     # 데이터 정보 표시
     show_data_info()
 
-    # 세션 상태에서 데이터 가져오기
-    raw_data = st.session_state.get("raw_data")
+    # 세션 데이터셋에서 데이터 가져오기
+    dataset = get_dataset()
+    df = dataset.df
 
-    if raw_data is None:
+    if df is None:
         st.warning("먼저 데이터를 로드해주세요.")
         return
 
-    df = raw_data.copy()
-
     # Columns
-    panel_no = get_column_name('panel_no')
-    area = get_column_name('area')
-    age_5 = get_column_name('age_5')
-    product_col = get_column_name('product_col')
-    problem_columns = get_problem_columns()
-    answer_date = get_column_name('answer_date')
+    settings = get_dashboard_settings()
+    panel_no, area, age_5, product_col, answer_date, problem_columns = settings
 
-    # 날짜별 응답 수 차트
-    if answer_date in df.columns:
-        df_date_only = pd.to_datetime(df[answer_date]).dt.date
-        date_count = df_date_only.value_counts().sort_index()
-        date_count.index = pd.to_datetime(date_count.index).strftime('%m월 %d일')
-
-        fig = go.Figure(data=go.Bar(
-            x=date_count.index,
-            y=date_count.values,
-            name='Response Count',
-            marker_color=get_ui_color('chart_color')
-        ))
-
-        fig.update_layout(
-            xaxis_title="Date",
-            yaxis_title="Response Count",
-            xaxis=dict(tickangle=45),
-            showlegend=False
-        )
+    aggregates = build_dashboard_aggregates(df, dataset.token, settings)
 
+    # 날짜별 응답 수 차트
+    if aggregates['date_count'] is not None:
+        chart_color = get_ui_color('chart_color')
+        fig = build_date_count_chart(aggregates['date_count'], dataset.token, settings, chart_color)
         st.plotly_chart(fig, width='stretch')
     else:
         st.error(f"**Cannot create date count bar chart. The following columns do not exist in the data: {answer_date}**")
 
     # AREA BY AGE_5 CROSSTABLE
-    if age_5 in df.columns and area in df.columns:
-        unique_df = df[[panel_no, age_5, area]].drop_duplicates()
-        area_by_age_5_crosstable = pd.crosstab(unique_df[age_5], unique_df[area])
-        area_by_age_5_crosstable.index.name = f"Total : {len(unique_df)}'s"
-        st.dataframe(area_by_age_5_crosstable, width='stretch')
+    if aggregates['area_by_age_5'] is not None:
+        st.dataframe(aggregates['area_by_age_5'], width='stretch')
     else:
         missing_cols = []
         if age_5 not in df.columns:
@@ -68,19 +163,22 @@ def show_dashboard():
 
     # Q6 by Q3 crosstab
     existing_problem_columns = [col for col in problem_columns if col in df.columns]
-    if existing_problem_columns and product_col in df.columns:
-        crosstab_results = []
-
-        for q6_col in existing_problem_columns:
-            q6_by_q3_crosstab = pd.crosstab(df[q6_col], df[product_col], margins=False)
-            q6_by_q3_crosstab.index = [idx for idx in q6_by_q3_crosstab.index]
-            crosstab_results.append(q6_by_q3_crosstab)
-
-        if crosstab_results:
-            merged_crosstab = pd.concat(crosstab_results, axis=0)
-            merged_crosstab.fillna(0, inplace=True)
-            merged_crosstab.index.name = "Q6 By Q3"
-            st.dataframe(merged_crosstab, width='stretch')
+    if aggregates['q6_by_q3'] is not None:
+        problem_matrix = aggregates['q6_by_q3']
+        opt_col1, opt_col2 = st.columns([1, 5])
+        with opt_col1:
+            show_percent = st.toggle("퍼센트(%) 표시", value=False, key='q6_show_percent')
+        with opt_col2:
+            show_totals = st.toggle("제품별 응답 수(Total) 표시", value=False, key='q6_show_totals')
+
+        matrix_df = problem_matrix['percent'] if show_percent else problem_matrix['counts']
+        if show_totals:
+            totals_row = problem_matrix['totals'].to_frame('Total').T
+            totals_row.index.name = matrix_df.index.name
+            matrix_df = pd.concat([matrix_df, totals_row])
+            # 응답값(숫자)과 'Total' 라벨이 섞인 인덱스는 문자열로 표시
+            matrix_df.index = matrix_df.index.astype(str)
+        st.dataframe(matrix_df, width='stretch')
     elif not existing_problem_columns and product_col not in df.columns:
         st.error(f"**Cannot create Q6 by Q3 crosstab. Both Q6 columns and Q3 column ({product_col}) do not exist in the data.**")
     elif not existing_problem_columns:
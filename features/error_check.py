@@ -1,14 +1,99 @@
 import streamlit as st
 import pandas as pd
 from utils.data_loader import show_data_info
-from utils.record_log import record_log
+from utils.record_log import record_log, log_batch
 from datetime import datetime
 from utils.column_manager import (
     get_column_manager,
     get_log_column_names
 )
 from features.setting import get_product_list, get_max_answers, get_duration_max
-from utils.data_convert import convert_data
+from utils.data_convert import convert_data, revalidate_panels
+from utils.edit_journal import JournalEntry, get_edit_journal, delete_rows
+from utils.error_index import get_error_index
+from utils.dataset import get_dataset
+
+def get_change_mask(source_df: pd.DataFrame, edited_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    에디터 수정값과 원본 값을 비교하여 셀 단위 변경 여부를 반환합니다.
+
+    Args:
+        source_df (DataFrame): 원본 데이터 슬라이스
+        edited_df (DataFrame): data_editor 결과 (source_df와 같은 인덱스/컬럼)
+
+    Returns:
+        DataFrame: 변경된 셀이 True인 불린 데이터프레임
+    """
+    both_missing = source_df.isna() & edited_df.isna()
+    return edited_df.ne(source_df) & ~both_missing
+
+
+def build_modify_log(log_df: pd.DataFrame, source_df: pd.DataFrame, edited_df: pd.DataFrame, change_mask: pd.DataFrame) -> pd.DataFrame:
+    """
+    변경된 셀을 '이전값 > 수정값' 형태로 표시한 MODIFY 로그 행들을 생성합니다.
+
+    Args:
+        log_df (DataFrame): 변경된 행들의 로그 컬럼 (변경 전 값)
+        source_df (DataFrame): 변경된 행들의 원본 값
+        edited_df (DataFrame): 변경된 행들의 수정 값
+        change_mask (DataFrame): 셀 단위 변경 여부
+
+    Returns:
+        DataFrame: MODIFY 로그 데이터프레임
+    """
+    modify_log = log_df.copy()
+    for col in change_mask.columns:
+        if col not in modify_log.columns:
+            continue
+        col_mask = change_mask[col]
+        if col_mask.any():
+            modify_log[col] = modify_log[col].astype(object)
+            modify_log.loc[col_mask, col] = (
+                source_df.loc[col_mask, col].astype(str) + ' > ' + edited_df.loc[col_mask, col].astype(str)
+            )
+    return modify_log.reset_index(drop=True)
+
+
+def show_edit_history():
+    """
+    Error Check 저장 내역의 실행 취소/다시 실행 버튼을 표시합니다.
+
+    되돌리거나 다시 적용한 뒤에는 영향을 받은 패널만 다시 검사합니다.
+    """
+    journal = get_edit_journal()
+    if journal.undo_count == 0 and journal.redo_count == 0:
+        return
+
+    undo_col, redo_col, _ = st.columns([1, 1, 4])
+    with undo_col :
+        undo_btn = st.button(f"↩️ 실행 취소 ({journal.undo_count})", width='stretch', disabled=journal.undo_count == 0)
+    with redo_col :
+        redo_btn = st.button(f"↪️ 다시 실행 ({journal.redo_count})", width='stretch', disabled=journal.redo_count == 0)
+
+    if not (undo_btn or redo_btn):
+        return
+
+    method = 'UNDO' if undo_btn else 'REDO'
+    dataset = get_dataset()
+    if undo_btn :
+        raw_data, entry = journal.undo(dataset.df)
+    else :
+        raw_data, entry = journal.redo(dataset.df)
+
+    if entry is None:
+        return
+
+    # 영향을 받은 패널만 다시 검사
+    with st.spinner("수정된 패널을 다시 검사하는 중입니다..."):
+        raw_data = revalidate_panels(raw_data, entry.panels)
+
+    if entry.log_rows is not None:
+        record_log(entry.log_rows, datetime.now().strftime('%Y%m%d_%H%M%S'), method, entry.error_type)
+
+    dataset.replace(raw_data)
+    st.session_state['updated_data'] = True
+    st.rerun()
+
 
 def show_error_check():
     """
@@ -19,14 +104,32 @@ def show_error_check():
     """
     st.header('🔍 Error Check')
 
-    # 세션 상태에서 데이터 가져오기
-    raw_data = st.session_state.get("raw_data")
+    # 세션 데이터셋에서 데이터 가져오기
+    dataset = get_dataset()
+    raw_data = dataset.df
 
     if raw_data is None:
         st.warning("먼저 데이터를 로드해주세요.")
         return
 
-    df = raw_data.copy()
+    # 실행 취소 / 다시 실행
+    show_edit_history()
+
+    show_error_editor()
+
+
+@st.fragment
+def show_error_editor():
+    """
+    오류 유형/응답자 선택과 데이터 편집 영역을 표시합니다.
+
+    필터나 편집기를 조작하면 앱 전체가 아니라 이 영역만 다시 실행됩니다.
+    저장/Re-Convert로 데이터가 바뀌면 앱 전체를 다시 실행합니다.
+    """
+    dataset = get_dataset()
+    raw_data = dataset.df
+    if raw_data is None:
+        return
 
     # 컬럼 매니저를 통해 모든 컬럼명을 한 번에 가져옴
     column_manager = get_column_manager()
@@ -60,46 +163,41 @@ def show_error_check():
     error_structure = {
         "1. 중복 응답": {
             "col": start_end_duplicate,
-            "cond": df[start_end_duplicate]==True,
             "check_col": "**응답 모두 확인**"
         },
         "2. 응답 수 초과": {
             "col": answer_count_error,
-            "cond": df[answer_count_error]==True,
             "check_col": f"제품당 사용 수 초과(최대 {max_answers}개 가능) : **{product_col} 확인**"
         },
         "3. 중복 순번 확인": {
             "col": duplicate_error,
-            "cond": df[duplicate_error]==True,
             "check_col": f"착용 순서 중복 오류 : **{input_col}/{order_col} 확인**"
         },
         "4. 제품 순서 응답 확인": {
             "col": order_error,
-            "cond": df[order_error]==True,
             "check_col": f"제품 순서 오류 : **{input_col}/{order_col} 확인**"
         },
         "5. 직전 응답 시간 확인": {
             "col": time_error,
-            "cond": df[time_error]==True,
             "check_col": f"직전 응답 시간 오류 : **{input_col}/{start_col}/{end_col} 확인**"
         },
         "6. 날짜 순서 응답 확인": {
             "col": day_order_error,
-            "cond": df[day_order_error]==True,
             "check_col": f"날짜 순서 오류 : **{input_col} 확인**"
         },
         "7. 착용 시간 확인": {
             "col": duration_error,
-            "cond": df[duration_error]==True,
             "check_col": f"착용 시간 초과(최대 {duration_max}분 이상 리체크) : **{start_col}/{end_col} 확인**"
         }
     }
 
+    # 데이터가 바뀐 경우에만 오류/패널 인덱스를 다시 생성
+    error_index = get_error_index(raw_data, panel_no, product_col, [item["col"] for item in error_structure.values()])
+
     select_error_type = st.selectbox("📌 **오류 유형 선택**", error_structure.keys(), index=0, width=300)
-    error_condition = error_structure[select_error_type]["cond"]
     error_col = error_structure[select_error_type]["col"]
     error_check_col = error_structure[select_error_type]["check_col"]
-    has_error_panels = df[error_condition][panel_no].unique().tolist()
+    has_error_panels = error_index.get_error_panels(error_col)
 
     if has_error_panels :
         st.caption(f"⚠️ [{select_error_type}] 해당 응답자 수 : {len(has_error_panels)}'s\n\n⚒️{error_check_col}")
@@ -108,14 +206,14 @@ def show_error_check():
         with filt_col1 :
             error_panel = st.selectbox("응답자 선택", has_error_panels, index=None)
         with filt_col2 :
-            error_products = df[(df[panel_no]==error_panel) & (error_condition)][product_col].unique().tolist()
+            error_products = error_index.get_error_products(error_col, error_panel)
             product_filt = st.selectbox("에러 제품 필터", error_products, index=None)
 
         with filt_col3 :
             if error_panel :
                 # 데이터 필터링 조건 설정
-                condition = (df[panel_no]==error_panel) & (error_condition) if select_error_type in ["중복 응답", "순서 오류"] else (df[panel_no]==error_panel)
-                count_dict = df[condition][product_col].value_counts().to_dict()
+                count_error_col = error_col if select_error_type in ["중복 응답", "순서 오류"] else None
+                count_dict = error_index.get_product_counts(error_panel, count_error_col)
 
                 # 결과 표시
                 if count_dict:
@@ -132,12 +230,12 @@ def show_error_check():
         if error_panel is not None :
             # 필요한 컬럼들이 데이터프레임에 존재하는지 확인
             error_check_columns = [error_col, unique_id, panel_no, answer_combine, input_col, order_col, product_col, start_col, end_col, total_duration]
-            existing_columns = [col for col in error_check_columns if col in df.columns and col is not None and col != '']
+            existing_columns = [col for col in error_check_columns if col in raw_data.columns and col is not None and col != '']
 
+            error_df = raw_data.iloc[error_index.get_panel_rows(error_panel)][existing_columns]
             if product_filt :
-                error_df = df[(df[panel_no]==error_panel) & (df[product_col]==product_filt)][existing_columns]
-            else :
-                error_df = df[df[panel_no]==error_panel][existing_columns]
+                error_df = error_df[error_df[product_col]==product_filt]
+            error_df = error_df.copy()
 
             delete_col = 'delete_sample'
             error_df[delete_col] = False
@@ -239,41 +337,61 @@ def show_error_check():
 
                         # 그 다음 삭제 체크된 행들 처리
                         log_columns = get_log_column_names()
-                        log_columns = [col for col in log_columns if col in df.columns and col is not None and col != '']
+                        log_columns = [col for col in log_columns if col in raw_data.columns and col is not None and col != '']
                         curr_time = datetime.now().strftime('%Y%m%d_%H%M%S')
-                        modified_count = 0  # 수정된 데이터 개수 추적
-
-                        # 먼저 삭제 체크되지 않은 행들의 수정사항을 반영
-                        for idx, row in data_editor.iterrows():
-                            if not row[delete_col]:  # 삭제 체크되지 않은 행만 업데이트
-                                raw_data_row = st.session_state['raw_data'].loc[idx]
-                                modify_row = {col: raw_data_row[col] for col in log_columns}
-                                has_changes = False
-
-                                check_columns = [col for col in [input_col, order_col, product_col, start_col, end_col]
-                                               if col in data_editor.columns and col is not None and col != '']
-
-                                for chk in check_columns:
-                                    if row[chk] != st.session_state['raw_data'].loc[idx, chk] :
-                                        modify_row[chk] = f'{raw_data_row[chk]} > {row[chk]}'
-                                        has_changes = True
-                                    st.session_state['raw_data'].loc[idx, chk] = row[chk]
-
-                                # 변경사항이 있는 경우에만 로그 기록
-                                if has_changes:
-                                    modify_df = pd.DataFrame([modify_row])
-                                    record_log(modify_df, curr_time, 'MODIFY', select_error_type)
-                                    modified_count += 1
-
-                        # 수정된 데이터 개수 확인
-                        if modified_count > 0:
-                            st.warning(f"⚠️ {modified_count}개 데이터 수정")
-
-                        if rows_to_delete:
-                            st.session_state['raw_data'] = st.session_state['raw_data'].drop(rows_to_delete).reset_index(drop=True)
-                            delete_log = data_editor[data_editor[delete_col] == True][log_columns]
-                            record_log(delete_log, curr_time, 'DELETE', select_error_type)
-                            st.warning(f"⚠️ {len(rows_to_delete)}개 데이터 삭제")
+
+                        # 로그는 모아서 저장 시 한 번만 파일에 추가
+                        with log_batch():
+                            # 먼저 삭제 체크되지 않은 행들의 수정사항을 반영
+                            edit_columns = [col for col in [input_col, order_col, product_col, start_col, end_col]
+                                            if col in data_editor.columns and col is not None and col != '']
+                            edited_df = data_editor.loc[data_editor[delete_col] != True, edit_columns]
+                            source_df = raw_data.loc[edited_df.index, edit_columns]
+
+                            change_mask = get_change_mask(source_df, edited_df)
+                            changed_rows = change_mask.index[change_mask.any(axis=1)]
+                            modified_count = len(changed_rows)
+
+                            # Undo/Redo 저널에 기록할 델타 (저장 시점 행 위치 기준)
+                            journal_entry = JournalEntry(error_type=select_error_type, updated_date=curr_time)
+                            journal_log = []
+
+                            if modified_count > 0:
+                                journal_entry.cell_positions = raw_data.index.get_indexer(changed_rows)
+                                journal_entry.cells_before = source_df.loc[changed_rows].copy()
+                                journal_entry.cells_after = edited_df.loc[changed_rows].copy()
+
+                                # 변경 로그는 변경 전 값 기준으로 한 번에 생성
+                                modify_log = build_modify_log(
+                                    raw_data.loc[changed_rows, log_columns],
+                                    source_df.loc[changed_rows],
+                                    edited_df.loc[changed_rows],
+                                    change_mask.loc[changed_rows]
+                                )
+                                # 변경된 행들을 한 번의 블록 대입으로 반영
+                                raw_data.loc[changed_rows, edit_columns] = edited_df.loc[changed_rows]
+                                dataset.touch()
+                                record_log(modify_log, curr_time, 'MODIFY', select_error_type)
+                                journal_log.append(modify_log)
+
+                            # 수정된 데이터 개수 확인
+                            if modified_count > 0:
+                                st.warning(f"⚠️ {modified_count}개 데이터 수정")
+
+                            if rows_to_delete:
+                                delete_positions = raw_data.index.get_indexer(rows_to_delete)
+                                journal_entry.deleted_positions = delete_positions
+                                journal_entry.deleted_rows = raw_data.iloc[delete_positions].copy()
+                                dataset.replace(delete_rows(raw_data, delete_positions))
+                                delete_log = data_editor[data_editor[delete_col] == True][log_columns]
+                                record_log(delete_log, curr_time, 'DELETE', select_error_type)
+                                journal_log.append(delete_log)
+                                st.warning(f"⚠️ {len(rows_to_delete)}개 데이터 삭제")
+
+                        journal_entry.panels = [error_panel]
+                        if journal_log:
+                            journal_entry.log_rows = pd.concat(journal_log, ignore_index=True)
+                        get_edit_journal().record(journal_entry)
 
                         st.session_state['show_save_btn'] = True
                         st.success("✅ 저장 완료")
@@ -287,7 +405,8 @@ def show_error_check():
             re_convert_btn = st.button("🚀 Re-Convert", width='stretch', type='primary')
             if re_convert_btn:
                 st.session_state['show_save_btn'] = False
-                convert_data()
+                # 변환은 백그라운드에서 실행하고, 완료되면 결과가 세션에 반영됨
+                convert_data(background=True)
                 st.rerun()
 
     else :
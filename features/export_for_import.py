@@ -2,12 +2,39 @@ import streamlit as st
 import pandas as pd
 import os
 from datetime import datetime
+from utils.dataset import get_dataset
+from utils.column_store import get_full_columns, get_full_frame
+from utils.data_preview import show_paged_dataframe
+from utils.job_runner import get_job_registry
+from utils.output_files import is_download_mode, add_download
+from utils.export_writer import EXPORT_FORMATS, FORMAT_CSV, FORMAT_PARQUET, CSV_ENCODINGS, is_parquet_available, export_frame
+from features.setting import get_export_csv_encoding, get_export_chunk_rows
 from utils.column_manager import (
     get_column_manager, 
     get_required_export_columns,
     get_derived_column_names
 )
 
+def run_export(job, df, save_path, file_stem, export_format, chunk_rows, encoding) -> str:
+    """
+    선택한 형식으로 데이터를 chunk 단위로 저장합니다. (백그라운드 작업 함수)
+
+    Returns:
+        str: 저장된 파일 경로 (다운로드 모드에서는 (파일명, 파일 내용) 튜플)
+    """
+    def on_progress(done, total):
+        job.update(int(done / total * 100) if total else 100, f"{done:,}/{total:,} rows")
+
+    return export_frame(df, save_path, file_stem, export_format, chunk_rows, encoding, on_progress=on_progress)
+
+def on_export_complete(result) -> str:
+    """내보내기 완료 메시지를 반환합니다. (다운로드 모드는 결과 파일을 다운로드 목록에 추가)"""
+    if isinstance(result, tuple):
+        file_name, data = result
+        add_download('Export for Import', file_name, data)
+        return f"✅ Data Exported : {file_name} (사이드바에서 다운로드)"
+    return f"✅ Data Exported : {os.path.basename(result)}"
+
 def show_export_for_import():
     """
     Export for Import 페이지를 표시합니다.
@@ -24,33 +51,79 @@ def show_export_for_import():
     derived_columns = get_derived_column_names()
     
 
-    raw_data = st.session_state.get("raw_data")
+    raw_data = get_dataset().df
     base_dir = st.session_state.get("base_directory")
     
-    if raw_data is not None and base_dir is not None:
-        # 필수 포함 컬럼 - 컬럼 매니저에서 가져옴
-        required_columns = get_required_export_columns()
-        columns = raw_data.columns
+    if raw_data is not None and (base_dir is not None or is_download_mode()):
+        show_export_section()
+    else :
+        st.warning("먼저 데이터를 로드해주세요.")
 
-        select_columns = st.multiselect("**Include Columns**", columns, default=required_columns, width=500)
 
-        if select_columns :
+@st.fragment
+def show_export_section():
+    """
+    내보낼 컬럼 선택과 미리보기를 표시합니다.
+
+    컬럼 선택을 바꾸면 앱 전체가 아니라 이 영역만 다시 실행됩니다.
+    """
+    raw_data = get_dataset().df
+    base_dir = st.session_state.get("base_directory")
+    download_mode = is_download_mode()
+    if raw_data is None or (base_dir is None and not download_mode):
+        return
+
+    # 필수 포함 컬럼 - 컬럼 매니저에서 가져옴
+    required_columns = get_required_export_columns()
+    # 작업 데이터에서 분리 보관한 컬럼도 선택할 수 있도록 전체 컬럼 사용
+    columns = get_full_columns()
+
+    select_columns = st.multiselect("**Include Columns**", columns, default=required_columns, width=500)
+
+    if select_columns :
+        if download_mode :
+            save_path = None
+            st.caption("📥 내보낸 파일은 사이드바의 Downloads에서 받을 수 있습니다.")
+        else :
             import_path = os.path.join(base_dir, "import")
             if not os.path.exists(import_path):
                 os.makedirs(import_path, exist_ok=True)
 
             save_path = st.text_input("Save Path", value=import_path, disabled=True, width=500)
-            import_btn = st.button("Export for Import", width=500)
-            
-            if import_btn :
-                curr_datetime = datetime.now().strftime('%Y%m%d')
-                with st.spinner('Data Exporting...'):
-                    raw_data[select_columns].to_excel(os.path.join(save_path, f'import_data_{curr_datetime}.xlsx'), index=False, sheet_name='Raw Data')
-                    st.success('Data Exported', icon='✅')
 
-            preview = st.expander("Preview", expanded=False)
-            with preview :
-                st.dataframe(raw_data[select_columns], hide_index=True)
+        # 저장 형식 (pyarrow가 없으면 Parquet 제외)
+        format_options = [name for name, fmt in EXPORT_FORMATS.items() if fmt != FORMAT_PARQUET or is_parquet_available()]
+        fmt_col1, fmt_col2, fmt_col3 = st.columns([1, 1, 3], vertical_alignment="bottom")
+        with fmt_col1 :
+            format_name = st.selectbox("**Format**", format_options, index=0)
+        export_format = EXPORT_FORMATS[format_name]
+        encoding = get_export_csv_encoding()
+        if export_format == FORMAT_CSV :
+            with fmt_col2 :
+                encoding_options = CSV_ENCODINGS if encoding in CSV_ENCODINGS else [encoding, *CSV_ENCODINGS]
+                encoding = st.selectbox("**Encoding**", encoding_options, index=encoding_options.index(encoding))
 
-    else :
-        st.warning("먼저 데이터를 로드해주세요.")
\ No newline at end of file
+        # 분리 보관 컬럼 결합은 데이터 버전/선택 컬럼별로 한 번만 수행
+        export_df = get_dataset().memoize('export_frame', lambda: get_full_frame(select_columns), tuple(select_columns))
+
+        import_btn = st.button("Export for Import", width=500)
+        
+        if import_btn :
+            registry = get_job_registry()
+            if registry.is_running('Export for Import') :
+                st.warning("⚠️ 이미 내보내기가 진행 중입니다.")
+            else :
+                curr_datetime = datetime.now().strftime('%Y%m%d')
+                registry.submit(
+                    'Export for Import', run_export,
+                    export_df, save_path, f'import_data_{curr_datetime}',
+                    export_format, get_export_chunk_rows(), encoding,
+                    on_complete=on_export_complete
+                )
+                st.toast("⏳ 백그라운드에서 내보내기를 시작했습니다. 진행 상태는 사이드바에서 확인할 수 있습니다.")
+                # fragment만 다시 실행되면 사이드바 작업 상태가 표시되지 않으므로 앱 전체를 다시 실행
+                st.rerun(scope="app")
+
+        preview = st.expander("Preview", expanded=False)
+        with preview :
+            show_paged_dataframe(export_df, key='export_preview', hide_index=True)
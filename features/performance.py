@@ -0,0 +1,136 @@
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+from utils.dataset import get_dataset
+from utils.column_store import get_side_columns
+from utils.cache_stats import get_cache_stats, reset_cache_stats
+from utils.stage_timer import get_recent_timings, timing_frame
+from utils.job_runner import get_job_registry
+
+
+def build_column_memory(df: pd.DataFrame, side_frame: pd.DataFrame = None) -> pd.DataFrame:
+    """
+    작업 데이터(와 분리 보관 컬럼)의 컬럼별 메모리 사용량을 계산합니다.
+
+    Args:
+        df (DataFrame): 작업 데이터
+        side_frame (DataFrame, optional): 분리 보관 컬럼 테이블
+
+    Returns:
+        DataFrame: Table, Column, Dtype, Memory (MB) 컬럼 (메모리 큰 순)
+    """
+    frames = [('working', df)]
+    if side_frame is not None:
+        frames.append(('side', side_frame))
+
+    rows = []
+    for table, frame in frames:
+        usage = frame.memory_usage(deep=True, index=False)
+        for col, size in usage.items():
+            rows.append({'Table': table, 'Column': col, 'Dtype': str(frame[col].dtype),
+                         'Memory (MB)': size / 2 ** 20})
+    memory = pd.DataFrame(rows, columns=['Table', 'Column', 'Dtype', 'Memory (MB)'])
+    return memory.sort_values('Memory (MB)', ascending=False, ignore_index=True)
+
+
+def show_memory_usage():
+    """세션 데이터의 컬럼별 메모리 사용량을 표시합니다."""
+    st.subheader("🧠 Session Memory")
+
+    dataset = get_dataset()
+    df = dataset.df
+    if df is None:
+        st.info("로드된 데이터가 없습니다.")
+        return
+
+    side = get_side_columns()
+    side_frame = side.frame if side is not None else None
+    # deep 메모리 계산은 문자열 컬럼이 많으면 느리므로 데이터 버전별로 한 번만 계산
+    memory = dataset.memoize('column_memory', lambda: build_column_memory(df, side_frame), side_frame is not None)
+
+    totals = memory.groupby('Table')['Memory (MB)'].sum()
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("**Total**", f"{memory['Memory (MB)'].sum():,.1f} MB")
+    with col2:
+        st.metric("**Working Columns**", f"{totals.get('working', 0):,.1f} MB", help=f"{len(df):,} rows x {len(df.columns):,} columns")
+    with col3:
+        st.metric("**Side Columns**", f"{totals.get('side', 0):,.1f} MB")
+
+    st.dataframe(
+        memory, hide_index=True, width='stretch',
+        column_config={'Memory (MB)': st.column_config.NumberColumn(format="%.3f")}
+    )
+
+
+def show_cache_stats():
+    """캐시 함수와 세션 파생 결과 캐시의 적중률을 표시합니다."""
+    st.subheader("🗃️ Cache Statistics")
+    st.caption("process: 모든 세션이 공유하는 캐시 함수 (로더, 대시보드 집계) / session: 현재 세션의 데이터 버전별 파생 결과")
+
+    stats = get_cache_stats()
+    if stats.empty:
+        st.info("아직 캐시를 사용한 기록이 없습니다.")
+    else:
+        st.dataframe(stats, hide_index=True, width='stretch')
+
+    if st.button("🧹 Clear Caches", help="모든 세션이 공유하는 캐시와 현재 세션의 파생 결과 캐시를 비웁니다."):
+        st.cache_data.clear()
+        st.cache_resource.clear()
+        get_dataset().clear_cache()
+        reset_cache_stats()
+        st.toast("✅ 캐시를 비웠습니다.")
+        st.rerun()
+
+
+def show_recent_timings():
+    """최근 변환의 단계별 소요 시간과 백그라운드 작업 시간을 표시합니다."""
+    st.subheader("⏱️ Recent Timings")
+
+    runs = get_recent_timings()
+    if not runs:
+        st.info("이번 세션에서 실행한 변환이 없습니다.")
+    else:
+        summary = []
+        for run in runs:
+            stages = {record['stage']: record for record in run['records'] if record['parent'] is None}
+            total = stages.get('Total', {})
+            summary.append({
+                'Run': run['run'],
+                'Started': run['started_at'],
+                'Rows': total.get('rows'),
+                'Total (s)': total.get('wall_s'),
+                'Review panel data (s)': stages.get('Review panel data', {}).get('wall_s'),
+                'Apply Excel styles (s)': stages.get('Apply Excel styles', {}).get('wall_s'),
+                'Peak Memory (MB)': total.get('peak_mb'),
+            })
+        st.dataframe(pd.DataFrame(summary), hide_index=True, width='stretch')
+
+        run_names = [f"{run['run']} ({run['started_at']})" for run in runs]
+        selected = st.selectbox("Stage Detail", range(len(runs)), format_func=lambda i: run_names[i])
+        st.dataframe(timing_frame(runs[selected]), hide_index=True, width='stretch')
+
+    jobs = get_job_registry().jobs
+    if jobs:
+        st.markdown("**Background Jobs**")
+        st.dataframe(pd.DataFrame([{
+            'Job': job.name,
+            'Status': job.status,
+            'Started': datetime.fromtimestamp(job.started_at).strftime('%Y-%m-%d %H:%M:%S'),
+            'Elapsed (s)': round(job.elapsed, 2),
+        } for job in jobs]), hide_index=True, width='stretch')
+
+
+def show_performance():
+    """
+    Performance 페이지를 표시합니다.
+
+    공유 서버 운영자가 세션 메모리, 캐시 적중률, 최근 작업 소요 시간을 확인하고 캐시를 비울 수 있습니다.
+    """
+    st.header("🚦 Performance")
+
+    show_memory_usage()
+    st.divider()
+    show_cache_stats()
+    st.divider()
+    show_recent_timings()
@@ -283,6 +283,47 @@ def get_duration_max() -> int:
     """최대 소요시간을 반환합니다."""
     return get_setting_manager().get_value("data_validation", "duration_max", 500)
 
+def get_journal_max_entries() -> int:
+    """실행 취소 저널에 보관할 최대 저장 내역 수를 반환합니다."""
+    return get_setting_manager().get_value("edit_journal", "max_entries", 30)
+
+def get_export_csv_encoding() -> str:
+    """Export for Import CSV 기본 인코딩을 반환합니다."""
+    return get_setting_manager().get_value("export", "csv_encoding", "cp949")
+
+def get_export_chunk_rows() -> int:
+    """파일 내보내기 시 한 번에 쓰는 행 수를 반환합니다."""
+    return get_setting_manager().get_value("export", "chunk_rows", 50000)
+
+def get_output_mode() -> str:
+    """결과 파일 저장 방식(disk / download)을 반환합니다."""
+    return get_setting_manager().get_value("output", "mode", "disk")
+
+def get_column_projection() -> bool:
+    """검사/대시보드 컬럼만 작업 데이터로 사용하고 나머지는 별도 보관할지 여부를 반환합니다."""
+    return get_setting_manager().get_value("data_load", "column_projection", True)
+
+def get_csv_engine() -> str:
+    """CSV 읽기 엔진(pyarrow / c)을 반환합니다."""
+    return get_setting_manager().get_value("data_load", "csv_engine", "pyarrow")
+
+def get_stream_chunk_rows() -> int:
+    """스트리밍 변환 시 한 번에 읽는 행 수를 반환합니다."""
+    return get_setting_manager().get_value("data_load", "stream_chunk_rows", 200000)
+
+def get_trace_memory() -> bool:
+    """변환 단계별 최대 메모리를 tracemalloc으로 측정할지 여부를 반환합니다."""
+    return get_setting_manager().get_value("performance", "trace_memory", False)
+
+def get_csv_dtype_keys() -> Dict[str, List[str]]:
+    """CSV 읽기 시 타입을 지정할 컬럼 키([column_names] 키)를 타입별로 반환합니다."""
+    setting = get_setting_manager().get_section("data_load")
+    return {
+        'string': setting.get("csv_string_columns", ["input_col", "start_col", "end_col"]),
+        'integer': setting.get("csv_integer_columns", ["panel_no"]),
+        'category': setting.get("csv_category_columns", ["product_col"]),
+    }
+
 
 # class SavePathManager:
 #     """save_path.toml 파일을 관리하는 클래스"""
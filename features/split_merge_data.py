@@ -1,25 +1,217 @@
 import streamlit as st
 import os
+import io
 from utils.data_loader import show_data_info
 from datetime import datetime
 from utils.xl_layout import set_xl_layout
 import pandas as pd
 import numpy as np
-from utils.data_convert import convert_data
+from utils.data_convert import PROCESS_STEPS, resolve_convert_path, run_convert, apply_convert_result
+from utils.job_runner import get_job_registry
+from utils.output_files import ZipOutput, is_download_mode, add_download
 from utils.get_path import select_directory
 from utils.data_loader import sort_data
+from utils.dataset import get_dataset, get_panel_summary
+from utils.column_store import get_side_columns, load_projected
+from utils.csv_reader import read_csv_typed
+from utils.data_preview import show_paged_dataframe
+from utils.cache_stats import tracked_cache
 from utils.column_manager import (
     get_column_manager,
     get_all_error_columns,
     get_all_check_columns,
     get_all_boolean_columns,
     get_columns_to_remove,
-    get_derived_column_names
+    get_derived_column_names,
+    get_answer_key_column_names
 )
+from utils.merge_index import (
+    KEEP_FIRST, KEEP_LATEST,
+    build_merge_index, find_cross_file_duplicates, confirm_key_matches,
+    summarize_collisions, deduplicate_frames
+)
+
+# 병합 작업 단계 (이후 변환 단계 PROCESS_STEPS가 이어짐)
+MERGE_STEPS = ["Read files", "Remove duplicates", "Merge data"]
+
+# Split 패널 목록 미리보기 (한 줄에 표시할 패널 수 / 페이지당 줄 수)
+PANEL_LINE_SIZE = 10
+PANEL_LINES_PER_PAGE = 20
+
+# Merge 미리보기 캐시 크기 (업로드 파일 묶음 단위)
+MERGE_PREVIEW_CACHE_ENTRIES = 2
 
 def split_list(split_count, _list) :
     return [list(_list[i::split_count]) for i in range(split_count)]
 
+def read_merge_file(file_name: str, content: bytes) -> pd.DataFrame:
+    """업로드된 xlsx/csv 파일 내용을 데이터프레임으로 읽습니다."""
+    endwith = file_name.split('.')[-1].lower()
+    if endwith == 'xlsx':
+        return pd.read_excel(io.BytesIO(content))
+    return read_csv_typed(content)
+
+def prepare_merge_frame(file_name: str, content: bytes, columns_to_remove) -> pd.DataFrame:
+    """업로드 파일을 읽어 파생/오류 컬럼을 제거하고 정렬합니다. (병합 / 미리보기 공통)"""
+    df = read_merge_file(file_name, content)
+    # columns_to_remove에 해당하는 컬럼이 df에 존재하면 삭제
+    remove_cols = [col for col in columns_to_remove if col in df.columns]
+    if remove_cols:
+        df = df.drop(columns=remove_cols)
+    return sort_data(df)
+
+@tracked_cache(st.cache_resource, max_entries=MERGE_PREVIEW_CACHE_ENTRIES, show_spinner=False)
+def build_merge_preview(merge_files: tuple, columns_to_remove: tuple, key_columns: tuple) -> tuple:
+    """
+    업로드 파일 미리보기 데이터와 파일 간 중복 응답 리포트를 생성합니다.
+
+    미리보기 페이지/정렬을 바꿀 때마다 앱 전체가 다시 실행되므로, 업로드 파일 내용별로 한 번만 읽습니다.
+    (미리보기에서만 읽으므로 데이터를 복사하지 않는 cache_resource 사용)
+
+    Args:
+        merge_files (tuple): (파일명, 파일 내용 bytes) 튜플 (병합 순서)
+        columns_to_remove (tuple): 제거할 파생/오류 컬럼
+        key_columns (tuple): 중복 응답 판단 키 컬럼
+
+    Returns:
+        tuple: ((파일명, 데이터프레임) 리스트, 파일 간 중복 응답 리포트)
+    """
+    frames = [(file_name, prepare_merge_frame(file_name, content, columns_to_remove)) for file_name, content in merge_files]
+    merge_index = build_merge_index(frames, list(key_columns))
+    duplicates = confirm_key_matches(find_cross_file_duplicates(merge_index), frames, list(key_columns))
+    return frames, summarize_collisions(duplicates)
+
+def save_split_files(job, raw_data, split_files, save_path, panel_no, error_columns, check_columns, columns_to_remove,
+                     side_columns=None) -> tuple:
+    """
+    분할 파일들을 저장합니다. (백그라운드 작업 함수)
+
+    Args:
+        job (Job): 진행 상태 / 취소 확인용 작업
+        raw_data (DataFrame): 작업 데이터 복사본
+        split_files (list): (파일명, 패널 번호 리스트) 리스트
+        save_path (str): 저장 폴더 (None이면 다운로드 모드 - 파일마다 zip 버퍼에 압축)
+        side_columns (SideColumns, optional): 작업 데이터에서 분리 보관한 컬럼 (파일마다 결합)
+
+    Returns:
+        tuple: (저장한 파일 수, zip 내용 - 다운로드 모드가 아니면 None)
+    """
+    zip_output = ZipOutput() if save_path is None else None
+    total = len(split_files)
+    for i, (file_name, panels) in enumerate(split_files):
+        job.update(int(i / total * 100), f"{i}/{total} files saved")
+        df = raw_data[raw_data[panel_no].isin(panels)]
+        if side_columns is not None:
+            df = side_columns.join(df)
+        if zip_output is not None:
+            buffer = io.BytesIO()
+            set_xl_layout(buffer, df, error_columns, check_columns, columns_to_remove)
+            zip_output.add(file_name, buffer.getvalue())
+        else:
+            xl_path = os.path.join(save_path, file_name)
+            set_xl_layout(xl_path, df, error_columns, check_columns, columns_to_remove)
+    job.update(100, f"{total}/{total} files saved")
+    return total, zip_output.close() if zip_output is not None else None
+
+def on_split_complete(result, zip_name):
+    """분할 저장 완료 시 결과 메시지를 반환합니다. (다운로드 모드는 zip을 다운로드 목록에 추가)"""
+    count, zip_data = result
+    if zip_data is not None:
+        add_download('Split Data', zip_name, zip_data)
+    return f"🚀 Split data has been saved successfully. ({count} files)"
+
+def run_merge(job, merge_files, columns_to_remove, key_columns, dedup_keep, answer_date, save_path, new_path):
+    """
+    업로드 파일들을 병합하고 변환합니다. (백그라운드 작업 함수)
+
+    Args:
+        job (Job): 진행 상태 / 취소 확인용 작업 (단계: MERGE_STEPS + PROCESS_STEPS)
+        merge_files (list): (파일명, 파일 내용 bytes) 리스트
+        columns_to_remove (list): 병합 전 제거할 파생/오류 컬럼
+        key_columns (list): 중복 응답 판단 키 컬럼
+        dedup_keep (str): 중복 응답 처리 방식 (None이면 중복 유지)
+        answer_date (str): 응답 일시 컬럼명
+        save_path (str): 병합 데이터 저장 폴더 (None이면 다운로드 모드 - 변환 파일만 생성)
+        new_path (str): 변환 데이터 저장 파일 경로
+
+    Returns:
+        tuple: (변환된 병합 데이터, 제거한 중복 응답 수)
+    """
+    job.step(0)
+    merge_frames = []
+    for file_name, content in merge_files:
+        job.check_cancelled()
+        merge_frames.append((file_name, prepare_merge_frame(file_name, content, columns_to_remove)))
+
+    # 변환 전에 파일 간 중복 응답 제거
+    job.step(1)
+    merge_dfs = [df for _, df in merge_frames]
+    removed_count = 0
+    if dedup_keep is not None :
+        merge_dfs, removed = deduplicate_frames(merge_frames, key_columns, keep=dedup_keep, answer_date=answer_date)
+        removed_count = len(removed)
+
+    # concat 시 index를 무시하고 새로 부여하여 이후 인덱스 관련 에러를 방지
+    job.step(2)
+    merge_df = pd.concat(merge_dfs, ignore_index=True)
+    merge_df = sort_data(merge_df)
+    if save_path is not None:
+        merge_df.to_excel(os.path.join(save_path, 'merge_data.xlsx'), index=False)
+
+    step_offset = len(MERGE_STEPS)
+    converted = run_convert(merge_df, new_path, on_step=lambda idx: job.step(step_offset + idx))
+    return converted, removed_count
+
+def build_split_preview(split_panels: list, file_names: list, panel_rows: pd.Series) -> pd.DataFrame:
+    """
+    분할 파일별 패널 수 / 행 수 미리보기 표를 생성합니다.
+
+    Args:
+        split_panels (list): 파일별 패널 번호 리스트
+        file_names (list): 파일명 리스트
+        panel_rows (Series): 패널 번호 인덱스의 패널별 응답 수
+
+    Returns:
+        DataFrame: File, Panels, Rows 컬럼
+    """
+    return pd.DataFrame({
+        'File': file_names,
+        'Panels': [len(panel) for panel in split_panels],
+        'Rows': [int(panel_rows.reindex(panel).sum()) for panel in split_panels],
+    })
+
+def show_panel_list(panel_groups: dict) :
+    """
+    선택한 파일의 패널 목록을 페이지 단위로 표시합니다. (패널 번호 10개씩 한 줄)
+
+    Args:
+        panel_groups (dict): {이름: 패널 번호 리스트}
+    """
+    list_col1, list_col2, list_col3 = st.columns([2, 1, 4], vertical_alignment="bottom")
+    with list_col1 :
+        group_name = st.selectbox("**Panel List**", list(panel_groups.keys()), index=0)
+
+    panel_str_list = [str(p) for p in sorted(panel_groups[group_name])]
+    line_count = (len(panel_str_list) - 1) // PANEL_LINE_SIZE + 1
+    page_count = max((line_count - 1) // PANEL_LINES_PER_PAGE + 1, 1)
+    # 다른 파일을 선택해 페이지 수가 줄어든 경우 첫 페이지로 이동
+    # (기본값은 세션 상태로만 지정 - value=와 함께 쓰면 Streamlit 경고 발생)
+    if st.session_state.setdefault('panel_list_page', 1) > page_count :
+        st.session_state['panel_list_page'] = 1
+    with list_col2 :
+        page = st.number_input("페이지", min_value=1, max_value=page_count, step=1, key='panel_list_page')
+    with list_col3 :
+        st.caption(f"{len(panel_str_list):,} Panels / {page_count:,} 페이지")
+
+    # 현재 페이지의 줄만 하나의 요소로 렌더링
+    start_line = (page - 1) * PANEL_LINES_PER_PAGE
+    end_line = min(start_line + PANEL_LINES_PER_PAGE, line_count)
+    html_lines = []
+    for idx in range(start_line, end_line):
+        line = ", ".join(panel_str_list[idx * PANEL_LINE_SIZE:(idx + 1) * PANEL_LINE_SIZE])
+        html_lines.append(f'<div class="panel-line"><div class="panel-line-index">{idx + 1}</div><div class="panel-line-panel">{line}</div></div>')
+    st.markdown("".join(html_lines), unsafe_allow_html=True)
+
 def pick_directory_via_dialog() -> list:
     """로컬 시스템 폴더 선택 대화상자를 띄워 여러 xlsx, csv 파일 경로를 리스트로 반환합니다."""
     try:
@@ -44,177 +236,185 @@ def pick_directory_via_dialog() -> list:
         st.warning("시스템 파일 선택 대화상자를 열 수 없습니다. 경로를 직접 입력해주세요.")
         return []
 
-def show_split_merge():
+@st.fragment
+def show_split_section():
     """
-    Split & Merge 페이지를 표시합니다.
-    
-    이 함수는 데이터를 분할하거나 병합하는 기능을 제공합니다.
-    - Split: 데이터를 여러 파일로 분할하여 저장
-    - Merge: 여러 파일을 하나로 병합
-    """
-    st.header("🚀 Split & Merge")
+    Split 탭을 표시합니다.
 
-    raw_data = st.session_state.get("raw_data", None)
-    
-    # 컬럼 매니저를 통해 모든 컬럼명을 한 번에 가져옴
+    분할 수 / 분할 방식 선택과 미리보기는 이 영역만 다시 실행되어, 앱 전체를 다시 그리지 않습니다.
+    """
+    raw_data = get_dataset().df
     column_manager = get_column_manager()
-    
-    # 컬럼 그룹들 가져오기
+    download_mode = is_download_mode()
+
     error_columns = get_all_error_columns()
     check_columns = get_all_check_columns()
     boolean_columns = get_all_boolean_columns()
     columns_to_remove = get_columns_to_remove()
+
+    st.subheader("💫 Split")
     
-    # 파생 컬럼명들 가져오기
-    derived_columns = get_derived_column_names()
+    # split_count에 따라 파일명에 들어가는 번호의 자릿수를 동적으로 결정
+    split_panels = []
+    success_panel_ids = []
+    error_panel_ids = []
+    if raw_data is not None :
+        panel_no = column_manager.get_column('panel_no')
+        # 패널별 응답 수 / 오류 여부는 데이터 버전별로 한 번만 계산
+        panel_summary = get_panel_summary(panel_no, boolean_columns)
+        unique_panels = [int(i) for i in panel_summary.index]
+        max_split_count = len(unique_panels)
 
+        select_col1, select_col2, select_col3 = st.columns([1.2, 3, 6], vertical_alignment="bottom")
+        with select_col1 :
+            split_type = st.selectbox("**📌 Split Type**", ["분할 (n등분)", "응답자별 분할"], index=0, width=300)
 
-    tab1, tab2 = st.tabs(["Split", "Merge"])
+        with select_col2 :
+            error_check = st.checkbox("에러 케이스만 분류하여 저장", value=True)
 
-    with tab1 :
-        st.subheader("💫 Split")
-        
-        # split_count에 따라 파일명에 들어가는 번호의 자릿수를 동적으로 결정
-        split_panels = []
-        success_panel_ids = []
-        error_panel_ids = []
-        if raw_data is not None :
-            panel_no = column_manager.get_column('panel_no')
-            unique_panels = [int(i) for i in raw_data[panel_no].unique()]
-            max_split_count = len(unique_panels)
-
-            select_col1, select_col2, select_col3 = st.columns([1.2, 3, 6], vertical_alignment="bottom")
-            with select_col1 :
-                split_type = st.selectbox("**📌 Split Type**", ["분할 (n등분)", "응답자별 분할"], index=0, width=300)
-
-            with select_col2 :
-                error_check = st.checkbox("에러 케이스만 분류하여 저장", value=True)
-
-            if error_check :
-                for panel in unique_panels :
-                    panel_df = raw_data[raw_data[panel_no] == panel]
-                    # boolean_columns에 해당하는 컬럼 중 하나라도 True가 있으면 안 됨 (모두 False여야 함)
-                    if not (panel_df[boolean_columns] == True).any().any():
-                        success_panel_ids.append(panel)
-                error_panel_ids = [panel for panel in unique_panels if panel not in success_panel_ids]
-                max_split_count = len(error_panel_ids)
-
-            split_count = None
-            if split_type == "분할 (n등분)":
-                num_col1, num_col2, num_col3 = st.columns([0.3, 3, 1], vertical_alignment="center")
-                with num_col1 :
-                    split_count = st.number_input("분할 수 지정", value=2, min_value=2, max_value=max_split_count, step=1)
-                with num_col2 :
-                    st.write(f"<div style='margin-top: 20px;font-size: 14px;'>개 파일로 분할합니다. (최대 분할 수: {max_split_count})</div>", unsafe_allow_html=True)
-            else :
-                split_count = max_split_count
-                st.info(f'총 {max_split_count:,}개의 파일로 분할합니다.', width=555)
-
-            # split_count가 None이 아니면 파일명 포맷을 동적으로 생성
-            if split_count is not None:
-                # split_count의 자릿수 계산 (예: 9->1, 10->2, 100->3)
-                digit_count = len(str(split_count))
-                file_name_format = '{number:0' + str(digit_count) + 'd}_split_data.xlsx'
-
-                target_panels = error_panel_ids if error_check else unique_panels
-
-                split_panels = split_list(split_count, target_panels)
-                col1, col2, col3 = st.columns([2, 1, 5], vertical_alignment="bottom")
-                with col1 :
+        if error_check :
+            # boolean_columns에 해당하는 컬럼 중 하나라도 True가 있으면 에러 패널 (모두 False여야 성공)
+            success_panel_ids = [int(i) for i in panel_summary.index[~panel_summary['has_error']]]
+            error_panel_ids = [int(i) for i in panel_summary.index[panel_summary['has_error']]]
+            max_split_count = len(error_panel_ids)
+
+        split_count = None
+        if split_type == "분할 (n등분)":
+            num_col1, num_col2, num_col3 = st.columns([0.3, 3, 1], vertical_alignment="center")
+            with num_col1 :
+                split_count = st.number_input("분할 수 지정", value=2, min_value=2, max_value=max_split_count, step=1)
+            with num_col2 :
+                st.write(f"<div style='margin-top: 20px;font-size: 14px;'>개 파일로 분할합니다. (최대 분할 수: {max_split_count})</div>", unsafe_allow_html=True)
+        else :
+            split_count = max_split_count
+            st.info(f'총 {max_split_count:,}개의 파일로 분할합니다.', width=555)
+
+        # split_count가 None이 아니면 파일명 포맷을 동적으로 생성
+        if split_count is not None:
+            # split_count의 자릿수 계산 (예: 9->1, 10->2, 100->3)
+            digit_count = len(str(split_count))
+            file_name_format = '{number:0' + str(digit_count) + 'd}_split_data.xlsx'
+
+            target_panels = error_panel_ids if error_check else unique_panels
+
+            split_panels = split_list(split_count, target_panels)
+            col1, col2, col3 = st.columns([2, 1, 5], vertical_alignment="bottom")
+            with col1 :
+                if download_mode :
+                    split_save_path = None
+                    st.caption("📥 분할 파일을 zip으로 묶어 다운로드로 제공합니다.")
+                else :
                     split_data_path = os.path.join(st.session_state.get("base_directory"), "split")
                     if not os.path.exists(split_data_path):
                             os.makedirs(split_data_path, exist_ok=True)
 
                     split_save_path = st.text_input("Save Path", value=split_data_path, disabled=True)
 
-                with col2 :
-                # Save split data
-                    split_save_btn = st.button("Save Split Data", type="primary", width=200)
-                    
-                if split_save_btn :
-                    curr_date = datetime.now().strftime('%Y%m%d')
+            with col2 :
+            # Save split data
+                split_save_btn = st.button("Save Split Data", type="primary", width=200)
+                
+            if split_save_btn :
+                curr_date = datetime.now().strftime('%Y%m%d')
+                save_path = None
+                if split_save_path is not None :
                     save_path = os.path.join(split_save_path, curr_date)
                     if not os.path.exists(save_path):
                         os.makedirs(save_path, exist_ok=True)
 
-                    # Progress bar creation
-                    progress = st.progress(0, text="Saving split data...")
+                # 저장할 파일 목록 (파일명, 패널 번호 리스트)
+                split_files = []
+                if success_panel_ids :
+                    split_files.append(('success_panel_data.xlsx', success_panel_ids))
 
-                    total = len(split_panels)
+                for i, panel in enumerate(split_panels, 1):
+                    file_name = file_name_format.format(number=i)
+                    if split_type == "응답자별 분할" :
+                        if len(panel) == 1 :
+                            file_name = f'{panel[0]}_panel_data.xlsx'
+                        else :
+                            file_name = f'{panel[0]}-{panel[-1]}_panel_data.xlsx'
+                    split_files.append((file_name, panel))
 
-                    if success_panel_ids :
-                        total += 1
-                        df = raw_data[raw_data[panel_no].isin(success_panel_ids)]
-                        xl_path = os.path.join(save_path, f'success_panel_data.xlsx')
-                        set_xl_layout(xl_path, df, error_columns, check_columns, columns_to_remove)
-                        # Update progress bar
-                        progress.progress(1 / total, text=f"Success panel data saved")
-
-                    for i, panel in enumerate(split_panels, 1):
-                        file_name = file_name_format.format(number=i)
-                        if split_type == "응답자별 분할" :
-                            if len(panel) == 1 :
-                                file_name = f'{panel[0]}_panel_data.xlsx'
-                            else :
-                                file_name = f'{panel[0]}-{panel[-1]}_panel_data.xlsx'
-                        df = raw_data[raw_data[panel_no].isin(panel)]
-                        xl_path = os.path.join(save_path, file_name)
-                        set_xl_layout(xl_path, df, error_columns, check_columns, columns_to_remove)
-                        # Update progress bar
-                        progress.progress(i / total, text=f"{i}/{total} files saved")
-
-                    progress.empty()
-                    st.success("🚀 Split data has been saved successfully.")
-                
-                st.divider()
+                registry = get_job_registry()
+                if registry.is_running('Split Data') :
+                    st.warning("⚠️ 이미 분할 저장이 진행 중입니다.")
+                else :
+                    # 저장 중 데이터가 수정되어도 영향이 없도록 복사본 전달
+                    registry.submit(
+                        'Split Data', save_split_files,
+                        raw_data.copy(), split_files, save_path, panel_no,
+                        error_columns, check_columns, columns_to_remove,
+                        side_columns=get_side_columns(),
+                        on_complete=lambda result: on_split_complete(result, f'split_data_{curr_date}.zip')
+                    )
+                    st.toast("⏳ 백그라운드에서 분할 파일을 저장합니다. 진행 상태는 사이드바에서 확인할 수 있습니다.")
+                    # fragment만 다시 실행되면 사이드바 작업 상태가 표시되지 않으므로 앱 전체를 다시 실행
+                    st.rerun(scope="app")
+            
+            st.divider()
+
+            if split_panels :
+                if success_panel_ids :
+                    success_count = len(success_panel_ids)
+                    st.success(f"{success_count} panels have no errors.", icon="✅")
+
+                if error_panel_ids :
+                    error_count = len(error_panel_ids)
+                    st.error(f"{error_count} panels have errors.", icon="❌")
+                    
+                if not split_type == "응답자별 분할" :
+                    st.info('**PANELNO Check**', icon='🔍')
+
+                    # 파일별 패널 수 / 행 수는 패널 요약(패널별 응답 수)에서 바로 집계
+                    file_names = [file_name_format.format(number=i) for i in range(1, len(split_panels) + 1)]
+                    preview_df = build_split_preview(split_panels, file_names, panel_summary['rows'])
+                    st.markdown("##### Error Panels")
+                    st.dataframe(preview_df, hide_index=True, width='stretch')
 
-                if split_panels :
+                    # 패널 목록은 선택한 파일만 페이지 단위로 한 번에 표시
+                    panel_groups = {name: panel for name, panel in zip(file_names, split_panels)}
                     if success_panel_ids :
-                        success_count = len(success_panel_ids)
-                        st.success(f"{success_count} panels have no errors.", icon="✅")
-
-                    if error_panel_ids :
-                        error_count = len(error_panel_ids)
-                        st.error(f"{error_count} panels have errors.", icon="❌")
-                        
-                    if not split_type == "응답자별 분할" :
-                        st.info('**PANELNO Check**', icon='🔍')
-                        if success_panel_ids :
-                            st.markdown("##### Pass Panels")
-                            success_expander = st.expander("Success Panels", expanded=False)
-                            with success_expander :
-                                st.markdown("**Panel List**")
-                                # 패널 번호를 10개씩 한 줄에 보여주기
-                                panel_str_list = [str(p) for p in sorted(success_panel_ids)]
-                                chunk_size = 10
-                                panel_lines = [
-                                    ", ".join(panel_str_list[j:j+chunk_size])
-                                    for j in range(0, len(panel_str_list), chunk_size)
-                                ]
-                                for idx, line in enumerate(panel_lines, 1):
-                                    txt = f'''<div class="panel-line"><div class="panel-line-index">{idx}</div><div class="panel-line-panel">{line}</div></div>'''
-                                    st.markdown(txt, unsafe_allow_html=True)
-                            
-                        st.markdown("##### Error Panels")
-                        for i, panel in enumerate(split_panels, 1):
-                            file_name = file_name_format.format(number=i)
-                            df = raw_data[raw_data[panel_no].isin(panel)]
-                            expander_text = f'{file_name} ({len(panel)} Panels / {len(df)} rows)'
-                            expander = st.expander(expander_text, expanded=False)
-                            with expander:
-                                st.markdown("**Panel List**")
-                                # 패널 번호를 10개씩 한 줄에 보여주기
-                                panel_str_list = [str(p) for p in sorted(panel)]
-                                chunk_size = 10
-                                panel_lines = [
-                                    ", ".join(panel_str_list[j:j+chunk_size])
-                                    for j in range(0, len(panel_str_list), chunk_size)
-                                ]
-                                for idx, line in enumerate(panel_lines, 1):
-                                    txt = f'''<div class="panel-line"><div class="panel-line-index">{idx}</div><div class="panel-line-panel">{line}</div></div>'''
-                                    st.markdown(txt, unsafe_allow_html=True)
-        else :
-            st.warning("먼저 데이터를 로드해주세요.")
+                        panel_groups = {"Success Panels": success_panel_ids, **panel_groups}
+                    show_panel_list(panel_groups)
+    else :
+        st.warning("먼저 데이터를 로드해주세요.")
+
+
+def show_split_merge():
+    """
+    Split & Merge 페이지를 표시합니다.
+    
+    이 함수는 데이터를 분할하거나 병합하는 기능을 제공합니다.
+    - Split: 데이터를 여러 파일로 분할하여 저장
+    - Merge: 여러 파일을 하나로 병합
+    """
+    st.header("🚀 Split & Merge")
+
+    # 컬럼 매니저를 통해 모든 컬럼명을 한 번에 가져옴
+    column_manager = get_column_manager()
+    download_mode = is_download_mode()
+    
+    # 컬럼 그룹들 가져오기
+    columns_to_remove = get_columns_to_remove()
+    
+    # 파생 컬럼명들 가져오기
+    derived_columns = get_derived_column_names()
+
+    unique_id = column_manager.get_column('unique_id')
+    answer_date = column_manager.get_column('answer_date')
+
+    # 병합 시 중복 응답 처리 방식
+    dedup_options = {
+        "중복 유지": None,
+        "먼저 병합된 응답 유지 (keep-first)": KEEP_FIRST,
+        "최신 응답 유지 (keep-latest)": KEEP_LATEST,
+    }
+
+    tab1, tab2 = st.tabs(["Split", "Merge"])
+
+    with tab1 :
+        show_split_section()
 
     with tab2 :
         st.subheader("📚 Merge")
@@ -229,7 +429,9 @@ def show_split_merge():
                 
         if file_paths:
             base_dir = st.session_state.get("base_directory")
-            if base_dir:
+            if download_mode:
+                save_path = None
+            elif base_dir:
                 merge_path = os.path.join(base_dir, "merge")
                 if not os.path.exists(merge_path):
                     os.makedirs(merge_path, exist_ok=True)
@@ -248,54 +450,59 @@ def show_split_merge():
                         st.rerun()
 
             if not save_path == '' :
+                # 파일 간 중복 응답 처리 옵션
+                dedup_col1, dedup_col2 = st.columns([1.2, 3], vertical_alignment="bottom")
+                with dedup_col1 :
+                    dedup_option = st.selectbox("**📌 중복 응답 처리**", list(dedup_options.keys()), index=0, width=300)
+                with dedup_col2 :
+                    use_answer_key = st.checkbox("ANSWERID 외 응답 내용(패널/Q1~Q5) 기준으로도 검사", value=False)
+
+                dedup_keep = dedup_options[dedup_option]
+                key_columns = [unique_id]
+                if use_answer_key :
+                    key_columns = get_answer_key_column_names()
+
                 merge_btn = st.button('Start Merge', key='merge_btn', width=555)
                 if merge_btn:
-                    with st.spinner('데이터를 병합하는 중입니다...'):
-                        merge_dfs = []
-                        for file in file_paths[::-1]:
-                            file_name = file.name
-                            endwith = file_name.split('.')[-1].lower()
-                            if endwith == 'xlsx':
-                                df = pd.read_excel(file)
-                            elif endwith == 'csv':
-                                df = pd.read_csv(file)
-                            # columns_to_remove에 해당하는 컬럼이 df에 존재하면 삭제
-                            remove_cols = [col for col in columns_to_remove if col in df.columns]
-                            if remove_cols:
-                                df = df.drop(columns=remove_cols)
-                            df = sort_data(df)
-                            merge_dfs.append(df)
-                        # concat 시 index를 무시하고 새로 부여하여 이후 인덱스 관련 에러를 방지
-                        merge_df = pd.concat(merge_dfs, ignore_index=True)
-                        merge_df = sort_data(merge_df)
-
-                        st.session_state["raw_data"] = merge_df
+                    registry = get_job_registry()
+                    if registry.is_running('Merge Data') :
+                        st.warning("⚠️ 이미 데이터 병합이 진행 중입니다.")
+                    else :
+                        # 업로드 파일 내용은 스크립트 스레드에서 읽어 작업 스레드로 전달
+                        merge_files = [(file.name, file.getvalue()) for file in file_paths[::-1]]
+                        new_path, origin_name, base_dir = resolve_convert_path('merge_data', save_path)
 
-                        panel_no = column_manager.get_column('panel_no')
-                        unique_panels = [int(i) for i in merge_df[panel_no].unique()]
-                        merge_expander = st.expander(f'**Merge Data** : {len(merge_df)} rows ({len(unique_panels)} panels)', expanded=False)
-                        with merge_expander:
-                            st.dataframe(merge_df)
-
-                        convert_data(file_name='merge_data', set_path=save_path)
-                        merge_df.to_excel(os.path.join(save_path, 'merge_data.xlsx'), index=False)
-                        st.success('데이터 병합이 완료되었습니다.')
+                        def on_merge_complete(result):
+                            merge_df, removed_count = result
+                            load_projected(merge_df)
+                            apply_convert_result(get_dataset().df, origin_name, base_dir, new_path)
+                            panel_no = column_manager.get_column('panel_no')
+                            message = f"✅ 데이터 병합이 완료되었습니다. ({len(merge_df):,} rows / {merge_df[panel_no].nunique():,} panels)"
+                            if removed_count :
+                                message += f"\n\n⚠️ 파일 간 중복 응답 {removed_count:,}건 제거"
+                            return message
+
+                        registry.submit(
+                            'Merge Data', run_merge,
+                            merge_files, columns_to_remove, key_columns, dedup_keep, answer_date, save_path, new_path,
+                            steps=MERGE_STEPS + PROCESS_STEPS,
+                            on_complete=on_merge_complete
+                        )
+                        st.info("⏳ 백그라운드에서 데이터를 병합합니다. 진행 상태는 사이드바에서 확인할 수 있습니다.")
                 else:
                     st.info(f'{len(file_paths)}개 파일이 업로드되었습니다.', icon='🔍')
-                    for file in file_paths[::-1]:
-                        file_name = file.name
-                        endwith = file_name.split('.')[-1].lower()
-                        if endwith == 'xlsx':
-                            df = pd.read_excel(file)
-                        elif endwith == 'csv':
-                            df = pd.read_csv(file)
-                        remove_cols = [col for col in columns_to_remove if col in df.columns]
-                        if remove_cols:
-                            df = df.drop(columns=remove_cols)
-                        df = sort_data(df)
-                        
+                    merge_files = tuple((file.name, file.getvalue()) for file in file_paths[::-1])
+                    preview_frames, collision_report = build_merge_preview(
+                        merge_files, tuple(columns_to_remove), tuple(key_columns)
+                    )
+                    for file_idx, (file_name, df) in enumerate(preview_frames):
                         panel_no = column_manager.get_column('panel_no')
                         unique_panels = [int(i) for i in df[panel_no].unique()]
                         expander = st.expander(f'**{file_name}** : {len(df)} rows ({len(unique_panels)} panels)', expanded=False)
                         with expander:
-                            st.dataframe(df)
\ No newline at end of file
+                            show_paged_dataframe(df, key=f'merge_file_preview_{file_idx}')
+
+                    # 파일 간 중복 응답 리포트
+                    if not collision_report.empty :
+                        st.warning(f"⚠️ 파일 간 중복 응답이 있습니다. ({collision_report['중복 응답 수'].sum():,}건)")
+                        st.dataframe(collision_report, hide_index=True, width=555)
\ No newline at end of file
@@ -2,10 +2,17 @@ import streamlit as st
 import pandas as pd
 from features.error_check import show_error_check
 from features.dashboard import show_dashboard
-from features.setting import get_default_page, get_preview_rows
+from features.setting import get_default_page
 from utils.data_loader import show_data_upload_sidebar, show_data_info, validate_session_file_path
 from features.split_merge_data import show_split_merge
 from features.export_for_import import show_export_for_import
+from features.change_log import show_change_log
+from features.performance import show_performance
+from utils.dataset import get_dataset
+from utils.data_preview import show_paged_dataframe
+from utils.job_runner import get_job_registry, show_job_status
+from utils.output_files import get_downloads, show_downloads
+from utils.stage_timer import get_recent_timings, show_stage_timing
 
 # 페이지 설정
 st.set_page_config(
@@ -31,9 +38,6 @@ st.title("Data Cleaning")
 if 'updated_data' not in st.session_state:
     st.session_state['updated_data'] = False
 
-if 'log_data' not in st.session_state:
-    st.session_state['log_data'] = pd.DataFrame()
-
 # 초기 페이지 설정
 if st.session_state.get('selected_page') is None:
     st.session_state['selected_page'] = get_default_page()
@@ -46,7 +50,7 @@ with st.sidebar:
     st.header("📋 Navigation")
 
     # 페이지 선택 - 하드코딩된 페이지 옵션 사용
-    page_options = ["Guide Page", "Error Check", "Dashboard", "Split & Merge", "Export for Import"]
+    page_options = ["Guide Page", "Error Check", "Dashboard", "Split & Merge", "Export for Import", "Change Log", "Performance"]
     selected_page = st.selectbox(
         "Select Page",
         page_options,
@@ -251,7 +255,7 @@ if st.session_state.get('selected_page') == "Guide Page":
         # 컨테이너 종료
         st.markdown('</div>', unsafe_allow_html=True)
 
-    raw_data = st.session_state.get("raw_data")
+    raw_data = get_dataset().df
     raw_data_path = st.session_state.get("raw_data_path")
 
     try :
@@ -265,9 +269,13 @@ if st.session_state.get('selected_page') == "Guide Page":
             # 데이터 정보 표시
             show_data_info()
 
+            # 최근 변환의 단계별 소요 시간
+            if get_recent_timings():
+                show_stage_timing(get_recent_timings()[0])
+
             # 데이터 미리보기
             with st.expander("데이터 미리보기", expanded=False):
-                st.dataframe(raw_data.head(get_preview_rows()), width='stretch')
+                show_paged_dataframe(raw_data, key='guide_preview', width='stretch')
     except Exception as e:
         st.error(f"읽을 수 없는 데이터 형식입니다. 시트 또는 데이터를 확인해주세요.")
 
@@ -283,5 +291,22 @@ elif st.session_state.get('selected_page') == "Split & Merge":
 elif st.session_state.get('selected_page') == "Export for Import":
     show_export_for_import()
 
+elif st.session_state.get('selected_page') == "Change Log":
+    show_change_log()
+
+elif st.session_state.get('selected_page') == "Performance":
+    show_performance()
+
 # elif st.session_state.get('selected_page') == "Settings":
-#     show_settings()
\ No newline at end of file
+#     show_settings()
+# 백그라운드 작업 상태 (페이지 내용 다음에 그려서 이번 실행에서 시작한 작업도 표시)
+if get_job_registry().jobs:
+    with st.sidebar:
+        st.divider()
+        show_job_status()
+
+# 다운로드 모드 결과 파일
+if get_downloads():
+    with st.sidebar:
+        st.divider()
+        show_downloads()
@@ -0,0 +1,319 @@
+"""
+데이터 처리 벤치마크
+
+합성 다이어리 데이터(utils.synthetic_data)로 아래 작업의 소요 시간을 행 수별로 측정하고,
+결과를 JSONL 파일에 이어 써서 이전 실행과 비교합니다. (같은 행 수/항목의 직전 결과 대비 배율 표시)
+
+- 로드: read_csv_typed + sort_data
+- utils/data_processing의 각 함수 (변환 단계 순서)
+- 변환 전체 (run_convert - convert_data에서 화면 처리를 뺀 부분, 엑셀 저장 포함)
+- set_xl_layout (엑셀 저장)
+- 분할 저장 (save_split_files) / 병합 (run_merge - 병합 후 변환 포함)
+
+패널마다 전체 데이터를 다시 필터링하는 검사 함수는 행 수의 제곱에 가깝게 느려지므로, 작은 행 수의 결과로
+예상 시간을 계산하여 --budget(초)을 넘으면 실행하지 않고 skipped로 기록합니다.
+
+사용 예:
+    python -m utils.benchmark --rows 10000 100000 1000000 --budget 600
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+import pandas as pd
+from utils.synthetic_data import generate_rows
+from utils.csv_reader import read_csv_typed
+from utils.data_loader import sort_data
+from utils.data_convert import run_convert
+from utils.xl_layout import set_xl_layout
+from utils.column_manager import (
+    get_column_manager, get_derived_column_names, get_all_error_columns, get_all_check_columns,
+    get_columns_to_remove, get_answer_key_column_names
+)
+from utils.data_processing import (
+    split_date_columns, split_time_columns, add_duration_column,
+    check_order_errors, check_count_errors, check_duplicate_times,
+    add_error_columns, add_answer_combine_column, compare_previous_response_and_time
+)
+from features.split_merge_data import save_split_files, run_merge, split_list
+from utils.merge_index import KEEP_LATEST
+
+DEFAULT_ROWS = [10_000, 100_000, 1_000_000]
+DEFAULT_OUTPUT = 'benchmark_results.jsonl'
+
+# 분할 / 병합 파일 수
+SPLIT_FILES = 4
+MERGE_FILES = 2
+
+# 직전 결과보다 이 배율 이상 느리면 회귀로 표시
+REGRESSION_RATIO = 1.2
+
+
+class BenchJob:
+    """백그라운드 작업 함수(save_split_files, run_merge)를 스레드 없이 실행하기 위한 진행 상태 수신 객체"""
+
+    def check_cancelled(self) -> None:
+        pass
+
+    def step(self, step_idx: int, progress: Optional[int] = None) -> None:
+        pass
+
+    def update(self, progress: int, message: str = '') -> None:
+        pass
+
+
+class BenchCase:
+    """
+    벤치마크 항목
+
+    Args:
+        name (str): 항목 이름
+        run (callable): run(state) - 측정할 작업 (결과를 state에 저장하여 다음 항목의 입력으로 사용 가능)
+        scaling (float): 행 수 대비 예상 증가 차수 (예상 시간 계산용, 패널별 전체 필터링은 2)
+        prepare (callable, optional): 측정하지 않는 준비 작업 (항목을 실행할 때만)
+        feeds (bool): 결과가 뒤 항목의 입력인지 여부 (True이면 건너뛰어도 측정 없이 실행)
+    """
+
+    def __init__(self, name: str, run: Callable[[dict], None], scaling: float = 1.0,
+                 prepare: Optional[Callable[[dict], None]] = None, feeds: bool = False):
+        self.name = name
+        self.run = run
+        self.scaling = scaling
+        self.prepare = prepare
+        self.feeds = feeds
+
+
+def build_cases() -> List[BenchCase]:
+    """측정 항목 목록을 만듭니다. (앞 항목의 결과를 뒤 항목의 입력으로 사용)"""
+    column_manager = get_column_manager()
+    derived = get_derived_column_names()
+    panel_no = column_manager.get_column('panel_no')
+    product_col = column_manager.get_column('product_col')
+    order_col = column_manager.get_column('order_col')
+    input_col = column_manager.get_column('input_col')
+    start_col = column_manager.get_column('start_col')
+    end_col = column_manager.get_column('end_col')
+    index_col = column_manager.get_column('index_col')
+    total_duration = column_manager.get_error_column('total_duration')
+    answer_combine = column_manager.get_error_column('answer_combine')
+    error_columns = get_all_error_columns()
+    check_columns = get_all_check_columns()
+    columns_to_remove = get_columns_to_remove()
+
+    def load(state):
+        state['df'] = sort_data(read_csv_typed(state['csv_path']))
+
+    def date_columns(state):
+        state['step'] = split_date_columns(state['df'].reset_index(drop=True), input_col)
+
+    def time_columns(state):
+        state['step'], state['time_data'] = split_time_columns(state['step'], [start_col, end_col])
+
+    def duration(state):
+        state['step'] = add_duration_column(state['step'], state['time_data'], start_col, end_col,
+                                            total_duration, derived['end_min'])
+
+    def order_errors(state):
+        state['order'], state['day_order'], state['dup'] = check_order_errors(state['step'], panel_no, order_col, input_col)
+
+    def count_errors(state):
+        state['count'] = check_count_errors(state['step'], panel_no, product_col, index_col)
+
+    def answer_combine_column(state):
+        state['step'] = add_answer_combine_column(state['step'], input_col, order_col, product_col,
+                                                  start_col, end_col, answer_combine)
+
+    def duplicate_times(state):
+        state['duplicate_time'] = check_duplicate_times(state['step'], panel_no, answer_combine)
+
+    def previous_time(state):
+        state['time_error'] = compare_previous_response_and_time(
+            state['step'], panel_no, derived['input_month'], derived['input_day'],
+            derived['start_time'], derived['end_time']
+        )
+
+    def error_columns_step(state):
+        # 건너뛴 검사 함수의 결과는 오류 없음으로 처리
+        state['converted'] = add_error_columns(state['step'], {
+            'order_errors': state.get('order', []),
+            'day_order_errors': state.get('day_order', []),
+            'dup_errors': state.get('dup', []),
+            'count_errors': state.get('count', []),
+            'duplicate_time_errors': state.get('duplicate_time', []),
+            'time_error_errors': state.get('time_error', []),
+        })
+
+    def convert(state):
+        run_convert(state['df'], os.path.join(state['work_dir'], 'converted_data.xlsx'))
+
+    def xl_layout(state):
+        set_xl_layout(os.path.join(state['work_dir'], 'xl_layout.xlsx'), state['converted'],
+                      error_columns, check_columns, columns_to_remove)
+
+    def split(state):
+        panels = state['converted'][panel_no].unique().tolist()
+        split_files = [(f'{i + 1}_split_data.xlsx', group) for i, group in enumerate(split_list(SPLIT_FILES, panels))]
+        save_split_files(BenchJob(), state['converted'], split_files, state['work_dir'], panel_no,
+                         error_columns, check_columns, columns_to_remove)
+
+    def prepare_merge(state):
+        # 패널 기준으로 나눈 CSV 파일 내용 (병합 업로드 파일)
+        df = state['df']
+        panels = df[panel_no].unique().tolist()
+        state['merge_files'] = [
+            (f'{i + 1}_merge.csv', df[df[panel_no].isin(group)].to_csv(index=False).encode('utf-8'))
+            for i, group in enumerate(split_list(MERGE_FILES, panels))
+        ]
+
+    def merge(state):
+        run_merge(BenchJob(), state['merge_files'], columns_to_remove, get_answer_key_column_names(),
+                  KEEP_LATEST, column_manager.get_column('answer_date'), state['work_dir'],
+                  os.path.join(state['work_dir'], 'merged_converted.xlsx'))
+
+    return [
+        BenchCase('load (read_csv_typed + sort_data)', load, feeds=True),
+        BenchCase('split_date_columns', date_columns, feeds=True),
+        BenchCase('split_time_columns', time_columns, feeds=True),
+        BenchCase('add_duration_column', duration, feeds=True),
+        BenchCase('check_order_errors', order_errors, scaling=2),
+        BenchCase('check_count_errors', count_errors, scaling=2),
+        BenchCase('add_answer_combine_column', answer_combine_column, feeds=True),
+        BenchCase('check_duplicate_times', duplicate_times, scaling=2),
+        BenchCase('compare_previous_response_and_time', previous_time, scaling=2),
+        BenchCase('add_error_columns', error_columns_step, feeds=True),
+        BenchCase('set_xl_layout', xl_layout),
+        BenchCase('split (save_split_files)', split),
+        BenchCase('convert_data (run_convert)', convert, scaling=2),
+        BenchCase('merge (run_merge)', merge, scaling=2, prepare=prepare_merge),
+    ]
+
+
+def estimate_seconds(history: Dict[str, tuple], case: BenchCase, rows: int) -> Optional[float]:
+    """이번 실행의 더 작은 행 수 결과로 예상 시간을 계산합니다. (결과가 없으면 None)"""
+    measured = history.get(case.name)
+    if measured is None:
+        return None
+    prev_rows, prev_seconds = measured
+    return prev_seconds * (rows / prev_rows) ** case.scaling
+
+
+def get_git_commit() -> Optional[str]:
+    """현재 커밋 해시를 반환합니다. (git 저장소가 아니면 None)"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_previous_results(output: str) -> Dict[tuple, dict]:
+    """결과 파일에서 (행 수, 항목)별 가장 최근 완료 결과를 읽습니다."""
+    previous = {}
+    if not os.path.exists(output):
+        return previous
+    with open(output, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record.get('status') == 'ok':
+                previous[(record['rows'], record['case'])] = record
+    return previous
+
+
+def run_benchmark(sizes: List[int], budget: float, seed: int, output: str, case_filter: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    행 수별로 측정 항목을 실행하고 결과를 저장합니다.
+
+    Args:
+        sizes (list): 목표 행 수 리스트 (작은 순으로 실행)
+        budget (float): 항목별 최대 예상 시간 (초, 넘으면 건너뜀)
+        seed (int): 합성 데이터 seed
+        output (str): 결과 JSONL 파일 경로
+        case_filter (list, optional): 실행할 항목 이름에 포함된 문자열 (생략 시 전체)
+
+    Returns:
+        DataFrame: 이번 실행 결과 (직전 결과 대비 배율 포함)
+    """
+    previous = load_previous_results(output)
+    run_info = {
+        'run_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'commit': get_git_commit(),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'seed': seed,
+    }
+    cases = build_cases()
+    history = {}
+    results = []
+
+    for size in sorted(sizes):
+        with tempfile.TemporaryDirectory() as work_dir:
+            raw = generate_rows(size, seed=seed)
+            rows = len(raw)
+            csv_path = os.path.join(work_dir, 'raw_data.csv')
+            raw.to_csv(csv_path, index=False)
+            del raw
+            state = {'csv_path': csv_path, 'work_dir': work_dir}
+            print(f"\n[{rows:,} rows]")
+
+            for case in cases:
+                selected = not case_filter or any(key in case.name for key in case_filter)
+                estimate = estimate_seconds(history, case, rows)
+                skip = not selected or (estimate is not None and estimate > budget)
+                if skip:
+                    # 뒤 항목의 입력이 되는 단계는 측정하지 않고 실행
+                    if case.feeds:
+                        case.run(state)
+                    if not selected:
+                        continue
+                    record = {'rows': rows, 'case': case.name, 'status': 'skipped', 'seconds': None,
+                              'estimate': round(estimate, 1)}
+                else:
+                    if case.prepare is not None:
+                        case.prepare(state)
+                    started = time.perf_counter()
+                    case.run(state)
+                    seconds = time.perf_counter() - started
+                    history[case.name] = (rows, seconds)
+                    record = {'rows': rows, 'case': case.name, 'status': 'ok', 'seconds': round(seconds, 4)}
+
+                last = previous.get((rows, case.name))
+                ratio = record['seconds'] / last['seconds'] if record['seconds'] and last and last['seconds'] else None
+                record['vs_previous'] = round(ratio, 2) if ratio is not None else None
+                results.append(record)
+                print(f"  {case.name:<40} {record['status']:<8} "
+                      f"{record['seconds'] if record['seconds'] is not None else '-':>10} s"
+                      + (f"  (x{ratio:.2f} vs previous{' - REGRESSION' if ratio >= REGRESSION_RATIO else ''})" if ratio else '')
+                      + (f"  (estimated {estimate:,.0f} s)" if record['status'] == 'skipped' else ''))
+
+                with open(output, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps({**run_info, **record}, ensure_ascii=False) + '\n')
+
+    return pd.DataFrame(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 데이터로 데이터 처리 함수의 소요 시간을 측정합니다.")
+    parser.add_argument('--rows', type=int, nargs='+', default=DEFAULT_ROWS, help="목표 행 수 (여러 개 지정 가능)")
+    parser.add_argument('--budget', type=float, default=600, help="항목별 최대 예상 시간 (초)")
+    parser.add_argument('--seed', type=int, default=0, help="합성 데이터 seed")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="결과 JSONL 파일 경로 (이어 쓰기)")
+    parser.add_argument('--case', action='append', default=None, help="실행할 항목 이름 (일부 문자열, 여러 번 지정 가능)")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.rows, args.budget, args.seed, args.output, args.case)
+    regressions = results[results['vs_previous'] >= REGRESSION_RATIO]
+    print(f"\n결과 저장: {args.output}")
+    if not regressions.empty:
+        print(f"⚠️ 직전 결과보다 {REGRESSION_RATIO}배 이상 느린 항목: {len(regressions)}개")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""
+캐시 사용 통계
+
+st.cache_data / st.cache_resource는 적중 여부를 알려주지 않으므로, 캐시 함수를 감싸
+호출 수와 실제 실행 수(캐시 미적중)를 셉니다. 세션 데이터셋의 파생 결과 캐시(Dataset.memoize)도
+같은 형식으로 세션별 적중/미적중 수를 기록합니다.
+
+- 캐시 함수 통계는 캐시와 같이 프로세스 전체(모든 세션)에서 공유됩니다.
+- 캐시 항목 수와 크기는 Streamlit 캐시 통계에서 가져옵니다. (Streamlit 내부 API이므로 실패하면 생략)
+"""
+
+import functools
+import threading
+from typing import Callable, Dict, List
+import pandas as pd
+import streamlit as st
+
+_lock = threading.Lock()
+_cache_calls: Dict[str, List[int]] = {}     # 캐시 함수 이름(모듈.함수) -> [호출 수, 실행 수]
+
+
+def _count(name: str, index: int) -> None:
+    with _lock:
+        _cache_calls.setdefault(name, [0, 0])[index] += 1
+
+
+def tracked_cache(cache: Callable = st.cache_data, **cache_kwargs) -> Callable:
+    """
+    st.cache_data(또는 st.cache_resource) 대신 사용하여 호출 수와 캐시 미적중 수를 기록하는 데코레이터
+
+    Streamlit은 감싼 함수의 원래 이름/소스/인자명으로 캐시 키를 만들므로 캐시 동작은 그대로입니다.
+
+    Args:
+        cache (callable): st.cache_data 또는 st.cache_resource
+        **cache_kwargs: 캐시 데코레이터 인자 (max_entries, show_spinner 등)
+
+    Returns:
+        callable: 데코레이터 (감싼 함수에도 clear()가 있음)
+    """
+    def decorator(func):
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def run(*args, **kwargs):
+            # 캐시 미적중 시에만 실행됨
+            _count(name, 1)
+            return func(*args, **kwargs)
+
+        cached = cache(**cache_kwargs)(run)
+
+        @functools.wraps(func)
+        def call(*args, **kwargs):
+            _count(name, 0)
+            return cached(*args, **kwargs)
+
+        call.clear = cached.clear
+        return call
+    return decorator
+
+
+def record_memo(name: str, hit: bool) -> None:
+    """세션 데이터셋 파생 결과 캐시의 적중/미적중을 기록합니다."""
+    stats = st.session_state.setdefault('memo_stats', {})
+    counts = stats.setdefault(name, [0, 0])
+    counts[0 if hit else 1] += 1
+
+
+def _get_cache_sizes() -> Dict[str, List[int]]:
+    """Streamlit 캐시 통계에서 함수(모듈.함수)별 (항목 수, 바이트)를 가져옵니다."""
+    sizes = {}
+    try:
+        from streamlit.runtime.caching import get_data_cache_stats_provider, get_resource_cache_stats_provider
+        providers = [get_data_cache_stats_provider(), get_resource_cache_stats_provider()]
+        for provider in providers:
+            for stats in provider.get_stats().values():
+                for stat in stats:
+                    size = sizes.setdefault(stat.cache_name, [0, 0])
+                    size[0] += 1
+                    size[1] += stat.byte_length
+    except Exception:
+        pass
+    return sizes
+
+
+def get_cache_stats() -> pd.DataFrame:
+    """
+    캐시 함수(프로세스 전체)와 세션 파생 결과 캐시의 통계를 반환합니다.
+
+    Returns:
+        DataFrame: Cache, Scope, Calls, Hits, Misses, Hit Rate (%), Entries, Size (MB) 컬럼
+    """
+    sizes = _get_cache_sizes()
+    rows = []
+    with _lock:
+        calls = {name: list(counts) for name, counts in _cache_calls.items()}
+    for name, (total, misses) in calls.items():
+        entries, size = sizes.get(name, [None, None])
+        rows.append({'Cache': name.rsplit('.', 1)[-1], 'Scope': 'process', 'Calls': total, 'Misses': misses,
+                     'Entries': entries, 'Size (MB)': round(size / 2 ** 20, 2) if size is not None else None})
+    for name, (hits, misses) in st.session_state.get('memo_stats', {}).items():
+        rows.append({'Cache': name, 'Scope': 'session', 'Calls': hits + misses, 'Misses': misses,
+                     'Entries': None, 'Size (MB)': None})
+
+    frame = pd.DataFrame(rows, columns=['Cache', 'Scope', 'Calls', 'Misses', 'Entries', 'Size (MB)'])
+    frame['Entries'] = frame['Entries'].astype('Int64')
+    frame.insert(3, 'Hits', frame['Calls'] - frame['Misses'])
+    frame.insert(5, 'Hit Rate (%)', (frame['Hits'] / frame['Calls'].where(frame['Calls'] > 0) * 100).round(1))
+    return frame
+
+
+def reset_cache_stats() -> None:
+    """캐시 통계를 초기화합니다. (세션 파생 결과 통계는 현재 세션만)"""
+    with _lock:
+        _cache_calls.clear()
+    st.session_state['memo_stats'] = {}
@@ -12,7 +12,7 @@
 """
 
 from typing import List, Dict, Optional
-from features.setting import get_column_name, get_error_column, get_max_answers, get_product_list, get_duration_max
+from features.setting import get_column_name, get_error_column, get_max_answers, get_product_list, get_duration_max, get_problem_columns
 
 
 class ColumnManager:
@@ -188,6 +188,37 @@ class ColumnManager:
             self.get_column('end_col'),
         ]
     
+    def get_answer_key_columns(self) -> List[str]:
+        """
+        응답 내용 전체를 식별하는 키 컬럼명 리스트를 반환
+
+        병합 시 ANSWERID가 달라도 같은 응답인지 확인하는 데 사용합니다.
+
+        Returns:
+            List[str]: 응답 키 컬럼명 리스트
+        """
+        return [
+            self.get_column('panel_no'),
+            self.get_column('input_col'),
+            self.get_column('order_col'),
+            self.get_column('product_col'),
+            self.get_column('start_col'),
+            self.get_column('end_col'),
+        ]
+
+    def get_projection_columns(self) -> List[str]:
+        """
+        작업 데이터에 남길 컬럼명 리스트를 반환
+
+        오류 검사와 대시보드에 필요한 컬럼으로, 나머지 컬럼은 별도 보관했다가
+        엑셀 저장과 Export에서만 다시 결합합니다.
+
+        Returns:
+            List[str]: 기본 컬럼명 + Q6 컬럼명 리스트
+        """
+        columns = [col for col in self._columns.values() if col]
+        return columns + [col for col in get_problem_columns() if col not in columns]
+
     def get_required_columns_for_export(self) -> List[str]:
         """
         Export for Import에서 필수로 포함해야 할 컬럼명 리스트를 반환
@@ -277,6 +308,16 @@ def get_log_column_names() -> List[str]:
     return get_column_manager().get_log_columns()
 
 
+def get_answer_key_column_names() -> List[str]:
+    """응답 키 컬럼명 리스트를 반환하는 편의 함수"""
+    return get_column_manager().get_answer_key_columns()
+
+
+def get_projection_column_names() -> List[str]:
+    """작업 데이터에 남길 컬럼명 리스트를 반환하는 편의 함수"""
+    return get_column_manager().get_projection_columns()
+
+
 def get_required_export_columns() -> List[str]:
     """Export용 필수 컬럼명 리스트를 반환하는 편의 함수"""
     return get_column_manager().get_required_columns_for_export()
@@ -0,0 +1,179 @@
+"""
+작업 데이터 컬럼 분리 보관 (column projection)
+
+패널 데이터 export는 수백 개의 컬럼을 가지지만, 오류 검사와 대시보드에는 [column_names]와
+problem_columns의 컬럼만 필요합니다. 모든 컬럼을 작업 데이터에 두면 변환, 수정, 백그라운드 작업마다
+넓은 데이터프레임을 복사하게 되므로, 로드 시 필요한 컬럼만 작업 데이터로 사용하고
+나머지 컬럼은 IndexNum 인덱스의 별도 테이블에 한 번만 보관합니다.
+엑셀 저장(변환/분할)과 Export처럼 원래 컬럼이 모두 필요한 경우에만 IndexNum으로 다시 결합합니다.
+
+주요 기능:
+- 작업 데이터 / 별도 보관 컬럼 분리 및 결합 (원래 컬럼 순서 유지)
+- 데이터셋별 별도 보관 컬럼 세션 저장 (다른 데이터를 로드하면 자동으로 무효화)
+"""
+
+from typing import List, Optional, Tuple
+import pandas as pd
+import streamlit as st
+from features.setting import get_column_projection
+from utils.dataset import get_dataset
+from utils.column_manager import get_column, get_columns_to_remove, get_projection_column_names
+
+
+class SideColumns:
+    """
+    작업 데이터에서 분리한 컬럼
+
+    행 삭제/실행 취소 후에도 행을 찾을 수 있도록 위치가 아닌 IndexNum 값을 인덱스로 사용합니다.
+    """
+
+    def __init__(self, frame: pd.DataFrame, key_col: str, column_order: List[str], dataset_id: Optional[str] = None):
+        """
+        Args:
+            frame (DataFrame): 분리한 컬럼 (IndexNum 값 인덱스)
+            key_col (str): 결합 키 컬럼명 (IndexNum)
+            column_order (list): 분리 전 전체 컬럼 순서
+            dataset_id (str, optional): 이 컬럼이 속한 데이터셋 ID
+        """
+        self.frame = frame
+        self.key_col = key_col
+        self.column_order = column_order
+        self.dataset_id = dataset_id
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self.frame.columns)
+
+    def get_full_columns(self, df: pd.DataFrame) -> List[str]:
+        """
+        결합 후 컬럼 순서를 반환합니다.
+
+        변환은 파생/오류 컬럼을 기준 컬럼 바로 뒤에 삽입하므로, 작업 데이터의 순서를 그대로 두고
+        분리한 컬럼은 분리 전 순서에서 바로 다음에 있던 작업 컬럼 앞에 넣습니다.
+        (다음 작업 컬럼이 없으면 마지막 원래 컬럼 뒤)
+        """
+        side_set = set(self.frame.columns) - set(df.columns)
+        if not side_set:
+            return list(df.columns)
+
+        before = {}     # 작업 컬럼 -> 그 앞에 넣을 분리 컬럼 리스트
+        pending = []
+        last_original = None
+        for col in self.column_order:
+            if col in side_set:
+                pending.append(col)
+            elif col in df.columns:
+                if pending:
+                    before[col] = pending
+                    pending = []
+                last_original = col
+
+        result = []
+        for col in df.columns:
+            result.extend(before.get(col, []))
+            result.append(col)
+            if col == last_original:
+                result.extend(pending)
+        if last_original is None:
+            result.extend(pending)
+        return result
+
+    def join(self, df: pd.DataFrame, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        작업 데이터에 분리한 컬럼을 IndexNum 기준으로 결합합니다.
+
+        Args:
+            df (DataFrame): 작업 데이터 (또는 일부 행)
+            columns (list, optional): 결과 컬럼 (생략 시 전체 컬럼, 원래 순서)
+
+        Returns:
+            DataFrame: 결합한 새 데이터프레임 (df의 행 순서/인덱스 유지)
+        """
+        if columns is None:
+            columns = self.get_full_columns(df)
+        side_columns = [col for col in self.frame.columns if col not in df.columns and col in columns]
+        if side_columns and self.key_col in df.columns:
+            values = self.frame[side_columns].reindex(df[self.key_col].to_numpy())
+            values.index = df.index
+            df = pd.concat([df, values], axis=1)
+        return df[[col for col in columns if col in df.columns]]
+
+
+def split_side_columns(df: pd.DataFrame, key_col: str, keep_columns: List[str]) -> Tuple[pd.DataFrame, Optional[SideColumns]]:
+    """
+    작업 데이터에 남길 컬럼과 별도 보관할 컬럼을 나눕니다.
+
+    Args:
+        df (DataFrame): 로드한 전체 데이터
+        key_col (str): 결합 키 컬럼명 (IndexNum - 행마다 고유해야 함)
+        keep_columns (list): 작업 데이터에 남길 컬럼명 리스트
+
+    Returns:
+        tuple: (작업 데이터, 분리한 컬럼 - 분리할 컬럼이 없으면 None)
+    """
+    keep = set(keep_columns) | {key_col}
+    side_columns = [col for col in df.columns if col not in keep]
+    if not side_columns or key_col not in df.columns or not df[key_col].is_unique:
+        return df, None
+
+    frame = df[side_columns].set_axis(df[key_col].to_numpy(), axis=0)
+    return df.drop(columns=side_columns), SideColumns(frame, key_col, list(df.columns))
+
+
+def project_frame(df: pd.DataFrame) -> Tuple[pd.DataFrame, Optional[SideColumns]]:
+    """
+    설정([data_load] column_projection)에 따라 검사/대시보드 컬럼만 작업 데이터로 분리합니다.
+
+    이전 변환 결과를 다시 읽은 경우를 위해, 변환 시 다시 만드는 파생/오류 컬럼도 작업 데이터에 남깁니다.
+    """
+    if df is None or not get_column_projection():
+        return df, None
+    keep_columns = get_projection_column_names() + get_columns_to_remove()
+    return split_side_columns(df, get_column('index_col'), keep_columns)
+
+
+def get_side_columns() -> Optional[SideColumns]:
+    """현재 데이터셋의 분리 보관 컬럼을 반환합니다. (없거나 다른 데이터셋의 것이면 None)"""
+    side = st.session_state.get('side_columns')
+    if side is None or side.dataset_id != st.session_state.get('dataset_id'):
+        return None
+    return side
+
+
+def set_side_columns(side: Optional[SideColumns]) -> None:
+    """분리 보관 컬럼을 현재 데이터셋의 것으로 저장합니다. (로드/교체 후 호출)"""
+    if side is not None:
+        side.dataset_id = st.session_state.get('dataset_id')
+    st.session_state['side_columns'] = side
+
+
+def load_projected(df: pd.DataFrame) -> None:
+    """데이터를 작업 컬럼만 남겨 로드하고 나머지 컬럼은 별도 보관합니다."""
+    working, side = project_frame(df)
+    get_dataset().load(working)
+    set_side_columns(side)
+
+
+def get_full_columns() -> List[str]:
+    """분리 보관 컬럼을 포함한 현재 데이터의 전체 컬럼명을 반환합니다."""
+    df = get_dataset().df
+    if df is None:
+        return []
+    side = get_side_columns()
+    return side.get_full_columns(df) if side is not None else list(df.columns)
+
+
+def get_full_frame(columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+    """
+    분리 보관 컬럼을 결합한 현재 데이터를 반환합니다. (엑셀 저장, Export, 작업 공간 저장용)
+
+    Args:
+        columns (list, optional): 결과 컬럼 (생략 시 전체 컬럼)
+    """
+    df = get_dataset().df
+    if df is None:
+        return None
+    side = get_side_columns()
+    if side is None:
+        return df if columns is None else df[columns]
+    return side.join(df, columns)
@@ -0,0 +1,181 @@
+"""
+타입 지정 CSV 읽기
+
+pd.read_csv 기본 설정은 모든 컬럼의 타입을 추론하고 문자열을 object로 읽어 느리고 메모리를 많이 사용합니다.
+이 모듈은 setting.toml [data_load]의 컬럼 타입으로 dtype을 지정하고, pyarrow 엔진(멀티스레드)으로 읽습니다.
+
+- 문자열: Q1/Q4/Q5 (날짜/시간 응답 - 숫자로 추론되지 않도록)
+- 정수: 패널 번호
+- 범주형: 제품 (설정의 제품 리스트를 범주에 포함하여 Error Check 수정 값도 저장 가능)
+
+인코딩은 파일 앞부분만 확인하여 utf-8(BOM 포함)과 cp949 중에서 판별하고,
+앞부분이 ASCII뿐이라 utf-8로 판별했는데 뒷부분에서 디코딩 오류가 나면 cp949로 다시 읽습니다.
+대용량 파일은 같은 타입 설정으로 chunk 단위로 읽을 수 있습니다. (스트리밍 변환)
+"""
+
+import codecs
+import io
+from typing import Dict, Iterator, Union
+import pandas as pd
+from features.setting import get_column_name, get_csv_engine, get_csv_dtype_keys, get_product_list
+
+# 인코딩 판별에 사용하는 앞부분 크기 (bytes)
+ENCODING_SAMPLE_BYTES = 1 << 20
+
+# utf-8로 읽을 수 없을 때 다시 읽을 인코딩
+FALLBACK_ENCODING = 'cp949'
+
+CsvSource = Union[str, bytes]
+
+
+def detect_csv_encoding(sample: bytes) -> str:
+    """
+    CSV 앞부분으로 인코딩을 판별합니다.
+
+    Args:
+        sample (bytes): 파일 앞부분
+
+    Returns:
+        str: 'utf-8-sig' / 'utf-8' / 'cp949'
+    """
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    try:
+        # 앞부분을 자른 위치에서 멀티바이트 문자가 잘려도 오류가 나지 않도록 증분 디코더 사용
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return FALLBACK_ENCODING
+
+
+def get_csv_dtypes(columns) -> Dict[str, str]:
+    """
+    설정의 컬럼 타입으로 CSV dtype을 만듭니다. (파일에 있는 컬럼만)
+
+    Args:
+        columns (list): CSV 헤더 컬럼명
+
+    Returns:
+        dict: {컬럼명: dtype}
+    """
+    dtype_names = {'string': 'str', 'integer': 'int64', 'category': 'category'}
+    dtypes = {}
+    for type_key, column_keys in get_csv_dtype_keys().items():
+        for column_key in column_keys:
+            col = get_column_name(column_key)
+            if col and col in columns:
+                dtypes[col] = dtype_names[type_key]
+    return dtypes
+
+
+def _open_source(source: CsvSource):
+    return io.BytesIO(source) if isinstance(source, bytes) else source
+
+
+def _read_sample(source: CsvSource) -> bytes:
+    if isinstance(source, bytes):
+        return source[:ENCODING_SAMPLE_BYTES]
+    with open(source, 'rb') as f:
+        return f.read(ENCODING_SAMPLE_BYTES)
+
+
+def _check_decoded(df: pd.DataFrame, encoding: str) -> pd.DataFrame:
+    """pyarrow 엔진은 디코딩할 수 없는 컬럼을 bytes로 읽으므로, 이 경우 디코딩 오류로 처리합니다."""
+    for col in df.columns[df.dtypes == object]:
+        values = df[col].dropna()
+        if len(values) and isinstance(values.iloc[0], bytes):
+            raise UnicodeDecodeError(encoding, values.iloc[0], 0, len(values.iloc[0]), f"column {col}")
+    return df
+
+
+def _read_typed(source: CsvSource, encoding: str) -> pd.DataFrame:
+    columns = pd.read_csv(_open_source(source), encoding=encoding, nrows=0).columns
+    dtypes = get_csv_dtypes(columns)
+
+    engine = get_csv_engine()
+    try:
+        df = pd.read_csv(_open_source(source), encoding=encoding, dtype=dtypes,
+                         engine=engine if engine == 'pyarrow' else None)
+        return _check_decoded(df, encoding)
+    except UnicodeDecodeError:
+        # UnicodeDecodeError도 ValueError이므로, 같은 인코딩으로 다시 읽지 않도록 먼저 처리
+        raise
+    except (ValueError, TypeError, ImportError):
+        return pd.read_csv(_open_source(source), encoding=encoding)
+
+
+def read_csv_typed(source: CsvSource) -> pd.DataFrame:
+    """
+    설정의 컬럼 타입과 pyarrow 엔진으로 CSV를 읽습니다.
+
+    정수 컬럼에 빈 값이 있는 등 타입을 지정해 읽을 수 없으면 기존과 같이 타입 추론으로 다시 읽고,
+    판별한 인코딩으로 디코딩할 수 없으면 cp949로 다시 읽습니다.
+
+    Args:
+        source (str | bytes): CSV 파일 경로 또는 파일 내용
+
+    Returns:
+        DataFrame: 읽은 데이터
+    """
+    encoding = detect_csv_encoding(_read_sample(source))
+    try:
+        df = _read_typed(source, encoding)
+    except UnicodeDecodeError:
+        if encoding == FALLBACK_ENCODING:
+            raise
+        df = _read_typed(source, FALLBACK_ENCODING)
+
+    # 설정의 제품 리스트도 범주에 포함 (정렬된 범주 순서 = 문자열 정렬 순서)
+    product_col = get_column_name('product_col')
+    if product_col in df.columns and isinstance(df[product_col].dtype, pd.CategoricalDtype):
+        categories = set(df[product_col].cat.categories) | set(get_product_list())
+        df[product_col] = df[product_col].cat.set_categories(sorted(categories))
+    return df
+
+
+def _iter_chunks(file_path: str, encoding: str, chunk_rows: int, skip_rows: int = 0) -> Iterator[pd.DataFrame]:
+    columns = pd.read_csv(file_path, encoding=encoding, nrows=0).columns
+    dtypes = {col: 'str' if dtype == 'category' else dtype for col, dtype in get_csv_dtypes(columns).items()}
+    with pd.read_csv(file_path, encoding=encoding, dtype=dtypes, chunksize=max(int(chunk_rows), 1),
+                     skiprows=range(1, skip_rows + 1)) as reader:
+        for chunk in reader:
+            if skip_rows:
+                chunk.index += skip_rows
+            yield chunk
+
+
+def iter_csv_typed(file_path: str, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    """
+    설정의 컬럼 타입으로 CSV를 chunk 단위로 읽습니다. (스트리밍 변환용)
+
+    chunk마다 범주가 달라지면 chunk를 이어 붙일 때 범주형이 풀리므로, 범주형 컬럼은 문자열로 읽습니다.
+    pyarrow 엔진은 chunk 읽기를 지원하지 않아 C 엔진을 사용합니다.
+    읽는 도중 디코딩 오류가 나면 이미 읽은 행 다음부터 cp949로 이어서 읽습니다.
+
+    Args:
+        file_path (str): CSV 파일 경로
+        chunk_rows (int): chunk 행 수
+
+    Yields:
+        DataFrame: chunk 데이터 (RangeIndex는 파일 전체 기준)
+    """
+    encoding = detect_csv_encoding(_read_sample(file_path))
+    rows = 0
+    try:
+        for chunk in _iter_chunks(file_path, encoding, chunk_rows):
+            rows += len(chunk)
+            yield chunk
+    except UnicodeDecodeError:
+        if encoding == FALLBACK_ENCODING:
+            raise
+        # 이미 읽은 행은 utf-8로 디코딩되었으므로 ASCII 범위 (cp949로 읽어도 같음)
+        yield from _iter_chunks(file_path, FALLBACK_ENCODING, chunk_rows, skip_rows=rows)
+
+
+def count_csv_rows(file_path: str) -> int:
+    """CSV 데이터 행 수를 줄바꿈 수로 빠르게 셉니다. (헤더 제외, 진행률 표시용 근사값)"""
+    lines = 0
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(ENCODING_SAMPLE_BYTES), b''):
+            lines += block.count(b'\n')
+    return max(lines - 1, 0)
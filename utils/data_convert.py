@@ -3,9 +3,16 @@ import numpy as np
 import streamlit as st
 import openpyxl as xl
 import os
+import io
 import re
 from datetime import datetime, timedelta
 from utils.xl_layout import set_xl_layout
+from utils.dataset import get_dataset
+from utils.column_store import get_side_columns
+from utils.job_runner import get_job_registry
+from utils.output_files import is_download_mode, add_download
+from utils.stage_timer import StageTimer, write_timing_log, add_recent_timing
+from features.setting import get_trace_memory
 from utils.column_manager import (
     get_column_manager,
     get_all_error_columns,
@@ -19,39 +26,54 @@ from utils.data_processing import (
     add_error_columns, add_answer_combine_column, compare_previous_response_and_time
 )
 
-def convert_data(file_name='converted_data', rerun=True, set_path=None):
+# 진행 단계를 추적하기 위한 리스트
+PROCESS_STEPS = [
+    "Remove columns",
+    "Process date columns",
+    "Process time columns",
+    "Calculate duration",
+    "Prepare error check",
+    "Review panel data",
+    "Add error columns",
+    "Prepare data save",
+    "Apply Excel styles",
+    "Save complete"
+]
+
+# 단계별 진행률 (%)
+STEP_PROGRESS = [5, 15, 25, 35, 45, 55, 75, 85, 95, 100]
+
+
+def process_data(df, on_step=None, timer=None):
     """
-    데이터를 변환하고 처리하는 메인 함수
-    
-    이 함수는 원시 데이터를 받아서 다음과 같은 처리를 수행합니다:
-    1. 날짜/시간 컬럼 분리
-    2. 지속시간 계산
-    3. 오류 검사 및 컬럼 추가
-    4. 엑셀 파일로 저장
-    
+    원시 데이터에 파생 컬럼과 오류 컬럼을 추가 (변환 1~7단계)
+
+    화면 출력 없이 데이터만 처리하므로 convert_data 외에도
+    일부 패널만 다시 검사하는 경우 등에 재사용할 수 있습니다.
+
     Args:
-        file_name (str): 저장할 파일명 (기본값: 'converted_data')
-        rerun (bool): 처리 완료 후 페이지 새로고침 여부 (기본값: True)
-        set_path (str): 저장 경로 (기본값: None, 자동 결정)
+        df (DataFrame): 원시 데이터프레임 (인덱스는 RangeIndex로 다시 부여됨)
+        on_step (callable, optional): 단계 시작 시 호출할 함수 (단계 인덱스를 인자로 받음)
+        timer (StageTimer, optional): 단계/검사 규칙별 소요 시간 측정기
+
+    Returns:
+        DataFrame: 파생 컬럼과 오류 컬럼이 추가된 데이터프레임
     """
-    raw_data = st.session_state.get("raw_data")
-    if raw_data is None:
-        st.warning("먼저 데이터를 로드해주세요.")
-        return
-    
-    df = raw_data.copy()
+    if timer is None:
+        timer = StageTimer()
+
+    def notify(step_idx):
+        timer.begin(PROCESS_STEPS[step_idx], rows=len(df))
+        if on_step is not None:
+            on_step(step_idx)
 
     # 컬럼 매니저를 통해 모든 컬럼명을 한 번에 가져옴
     column_manager = get_column_manager()
-    
-    # 컬럼 그룹들 가져오기
-    error_columns = get_all_error_columns()
-    check_columns = get_all_check_columns()
     columns_to_remove = get_columns_to_remove()
-    
+
     # 파생 컬럼명들 가져오기
     derived_columns = get_derived_column_names()
-    
+
     # 개별 컬럼명들 가져오기
     panel_no = column_manager.get_column('panel_no')
     product_col = column_manager.get_column('product_col')
@@ -60,94 +82,66 @@ def convert_data(file_name='converted_data', rerun=True, set_path=None):
     start_col = column_manager.get_column('start_col')
     end_col = column_manager.get_column('end_col')
     index_col = column_manager.get_column('index_col')
-    
+
     # 에러 컬럼명들 가져오기
     total_duration = column_manager.get_error_column('total_duration')
     answer_combine = column_manager.get_error_column('answer_combine')
 
-    progress = st.progress(0)
-    status_text = st.empty()
-
-    # 진행 단계를 추적하기 위한 리스트
-    process_steps = [
-        "Remove columns",
-        "Process date columns",
-        "Process time columns",
-        "Calculate duration",
-        "Prepare error check",
-        "Review panel data",
-        "Add error columns",
-        "Prepare data save",
-        "Apply Excel styles",
-        "Save complete"
-    ]
-
-    def update_status_display(current_step_idx, current_text=""):
-        display_text = "**Data Conversion Progress:**\n\n"
-        for i, step in enumerate(process_steps):
-            if i < current_step_idx:
-                display_text += f"✅ ~~{step}~~\n\n"
-            elif i == current_step_idx:
-                display_text += f"⏳ **{step}**\n\n"
-            else:
-                display_text += f"⏸️ {step}\n\n"
-        status_text.markdown(display_text)
-
     # 1단계: 기존 컬럼 제거
-    update_status_display(0)
-    progress.progress(5)
+    notify(0)
+    # 시간 데이터 및 오류 검사는 행 위치(RangeIndex) 기준이므로 정렬 후 인덱스를 다시 부여
+    df = df.reset_index(drop=True)
     for col in columns_to_remove:
         if col in df.columns:
             df = df.drop(columns=[col])
 
     # 2단계: 날짜 컬럼 분리 및 추가 (함수 사용)
-    update_status_display(1)
-    progress.progress(15)
+    notify(1)
     df = split_date_columns(df, input_col)
 
     # 3단계: 시간 컬럼 데이터 처리 (함수 사용)
-    update_status_display(2)
-    progress.progress(25)
+    notify(2)
     df, time_data = split_time_columns(df, [start_col, end_col])
 
     # 4단계: 총 소요시간 계산 (함수 사용)
-    update_status_display(3)
-    progress.progress(35)
+    notify(3)
     df = add_duration_column(df, time_data, start_col, end_col, total_duration, derived_columns['end_min'])
 
     # 5단계: 오류 검사 준비
-    update_status_display(4)
-    progress.progress(45)
+    notify(4)
 
     # 6단계: 패널별 데이터 검토 (함수들 사용)
-    update_status_display(5)
-    progress.progress(55)
+    notify(5)
 
     # 순서 오류 검사
-    order_answer_errors, day_order_errors, dup_errors = check_order_errors(df, panel_no, order_col, input_col)
+    with timer.stage('check_order_errors', rows=len(df)):
+        order_answer_errors, day_order_errors, dup_errors = check_order_errors(df, panel_no, order_col, input_col)
 
     # 응답 수 초과 오류 검사
-    count_errors = check_count_errors(df, panel_no, product_col, index_col)
+    with timer.stage('check_count_errors', rows=len(df)):
+        count_errors = check_count_errors(df, panel_no, product_col, index_col)
 
     # 응답 결합 컬럼 추가 (일단 맨 끝에 추가)
-    df = add_answer_combine_column(df, input_col, order_col, product_col, start_col, end_col,
-                                  answer_combine)
+    with timer.stage('add_answer_combine_column', rows=len(df)):
+        df = add_answer_combine_column(df, input_col, order_col, product_col, start_col, end_col,
+                                      answer_combine)
 
     # 시간 중복 오류 검사
-    start_end_duplicate_errors = check_duplicate_times(df, panel_no, answer_combine)
+    with timer.stage('check_duplicate_times', rows=len(df)):
+        start_end_duplicate_errors = check_duplicate_times(df, panel_no, answer_combine)
 
 
     # 직전 응답과 시간 비교
-    time_error_errors = compare_previous_response_and_time(
-        df, panel_no, 
-        derived_columns['input_month'], derived_columns['input_day'], 
-        derived_columns['start_time'], derived_columns['end_time']
-    )
+    with timer.stage('compare_previous_response_and_time', rows=len(df)):
+        time_error_errors = compare_previous_response_and_time(
+            df, panel_no, 
+            derived_columns['input_month'], derived_columns['input_day'], 
+            derived_columns['start_time'], derived_columns['end_time']
+        )
 
 
     # 7단계: 오류 컬럼 추가 (함수 사용)
-    update_status_display(6)
-    progress.progress(75)
+    notify(6)
 
     # 오류 데이터 딕셔너리 준비
     error_data = {
@@ -160,17 +154,62 @@ def convert_data(file_name='converted_data', rerun=True, set_path=None):
     }
 
     # 오류 컬럼들 추가
-    df = add_error_columns(df, error_data)
+    return add_error_columns(df, error_data)
+
 
-    # 8단계: 데이터 저장 준비
-    update_status_display(7)
-    progress.progress(85)
-    raw_data = df
+def revalidate_panels(df, panels):
+    """
+    지정한 패널들만 다시 검사하여 파생 컬럼과 오류 컬럼을 갱신
+
+    모든 검사 규칙은 패널 단위이므로 해당 패널의 행만 다시 처리해도
+    전체 변환과 같은 결과가 나옵니다. df는 제자리에서 수정됩니다.
+
+    Args:
+        df (DataFrame): 변환이 완료된 데이터프레임
+        panels (list): 다시 검사할 패널 번호 리스트
+
+    Returns:
+        DataFrame: 갱신된 데이터프레임 (df와 동일 객체)
+    """
+    panel_no = get_column_manager().get_column('panel_no')
+    columns_to_remove = [col for col in get_columns_to_remove() if col in df.columns]
+    if not panels or not columns_to_remove:
+        return df
+
+    positions = np.flatnonzero(df[panel_no].isin(panels).to_numpy())
+    if len(positions) == 0:
+        return df
+
+    subset = df.iloc[positions].reset_index(drop=True)
+    checked = process_data(subset)
+
+    col_positions = [df.columns.get_loc(col) for col in columns_to_remove]
+    for col, col_pos in zip(columns_to_remove, col_positions):
+        values = checked[col]
+        if df[col].dtype != values.dtype:
+            df[col] = df[col].astype(object)
+        df.iloc[positions, col_pos] = values.to_numpy()
+    return df
+
+
+def resolve_convert_path(file_name='converted_data', set_path=None):
+    """
+    변환 데이터 저장 경로를 결정합니다.
+
+    Args:
+        file_name (str): 저장할 파일명 (확장자/일시 제외)
+        set_path (str): 저장 경로 (None이면 원본 파일 위치의 convert 폴더)
 
+    Returns:
+        tuple: (저장 파일 경로, 저장 파일명, 기준 폴더)
+            다운로드 모드에서는 (메모리 버퍼, 저장 파일명, None)
+    """
     raw_data_path = st.session_state.get("raw_data_path")
     curr_datetime = datetime.now().strftime('%Y%m%d_%H%M%S')
     origin_name = f'{file_name}_{curr_datetime}.xlsx'
-    file_name = origin_name
+
+    if is_download_mode():
+        return io.BytesIO(), origin_name, None
 
     base_dir = set_path if set_path is not None else os.path.dirname(raw_data_path) if raw_data_path else os.getcwd()
     save_path = base_dir
@@ -188,35 +227,163 @@ def convert_data(file_name='converted_data', rerun=True, set_path=None):
     if set_path is not None:
         save_path = set_path
 
-    new_path = os.path.join(save_path, file_name)
-    clean_data = raw_data.copy()
+    return os.path.join(save_path, origin_name), origin_name, base_dir
+
+
+def run_convert(df, new_path, on_step=None, side_columns=None, timer=None):
+    """
+    변환 1~10단계를 실행하고 엑셀 파일로 저장합니다. (화면/세션 접근 없음)
+
+    Args:
+        df (DataFrame): 원시 데이터프레임
+        new_path (str): 저장할 엑셀 파일 경로 (또는 메모리 버퍼)
+        on_step (callable, optional): 단계 시작 시 호출할 함수 (단계 인덱스를 인자로 받음)
+        side_columns (SideColumns, optional): 작업 데이터에서 분리 보관한 컬럼 (엑셀 저장 시에만 결합)
+        timer (StageTimer, optional): 단계별 소요 시간 측정기 (완료 시 finish 호출)
+
+    Returns:
+        DataFrame: 변환된 데이터프레임
+    """
+    if timer is None:
+        timer = StageTimer()
+
+    def notify(step_idx):
+        timer.begin(PROCESS_STEPS[step_idx], rows=len(df))
+        if on_step is not None:
+            on_step(step_idx)
+
+    # 컬럼 그룹들 가져오기
+    error_columns = get_all_error_columns()
+    check_columns = get_all_check_columns()
+    columns_to_remove = get_columns_to_remove()
+
+    try:
+        # 1~7단계: 컬럼 변환 및 오류 검사
+        df = process_data(df, on_step=on_step, timer=timer)
 
-    # 9단계: 엑셀 스타일 적용
-    update_status_display(8)
-    progress.progress(95)
+        # 8단계: 데이터 저장 준비
+        notify(7)
+        clean_data = side_columns.join(df) if side_columns is not None else df.copy()
 
-    # 엑셀 스타일 적용
-    set_xl_layout(new_path, clean_data, error_columns, check_columns, columns_to_remove)
+        # 9단계: 엑셀 스타일 적용
+        notify(8)
+        set_xl_layout(new_path, clean_data, error_columns, check_columns, columns_to_remove)
 
-    # 10단계: 완료
-    update_status_display(9)
-    progress.progress(100)
+        # 10단계: 완료
+        notify(9)
+    finally:
+        # 취소/오류로 중단된 경우에도 측정을 마치고 메모리 추적을 종료
+        timer.finish()
+    return df
 
-    # 상태 텍스트를 최종 완료 상태로 업데이트
-    final_display = "**Completed! 🎉**\n\n"
-    for step in process_steps:
-        final_display += f"~~{step}~~ ✅\n\n"
-    status_text.markdown(final_display)
 
-    # 잠시 후 상태 텍스트와 프로그레스 바 정리
-    import time
-    time.sleep(2)
+def save_stage_timing(timer, new_path):
+    """
+    변환 단계별 측정 결과를 세션에 보관하고, 저장 파일과 같은 폴더의 JSONL 로그에 이어 씁니다.
+
+    다운로드 모드(메모리 버퍼)에서는 저장할 폴더가 없으므로 세션에만 보관합니다.
+    """
+    run = timer.to_run()
+    add_recent_timing(run)
+    if isinstance(new_path, str):
+        try:
+            write_timing_log(os.path.dirname(new_path), run)
+        except OSError as e:
+            st.warning(f"⚠️ 단계별 소요 시간 로그를 저장하지 못했습니다: {str(e)}")
+
+
+def apply_convert_result(df, origin_name, base_dir, new_path=None):
+    """변환 결과를 세션 데이터셋과 저장 경로 정보에 반영합니다. (다운로드 모드는 다운로드 목록에 추가)"""
+    get_dataset().replace(df)
+    st.session_state["curr_file_name"] = origin_name
+    if base_dir is not None:
+        st.session_state["base_directory"] = base_dir
+    if isinstance(new_path, io.BytesIO):
+        add_download('Converted Data', origin_name, new_path.getvalue())
+
+
+def convert_data(file_name='converted_data', rerun=True, set_path=None, background=False):
+    """
+    데이터를 변환하고 처리하는 메인 함수
+    
+    이 함수는 원시 데이터를 받아서 다음과 같은 처리를 수행합니다:
+    1. 날짜/시간 컬럼 분리
+    2. 지속시간 계산
+    3. 오류 검사 및 컬럼 추가
+    4. 엑셀 파일로 저장
+    
+    Args:
+        file_name (str): 저장할 파일명 (기본값: 'converted_data')
+        rerun (bool): 처리 완료 후 페이지 새로고침 여부 (기본값: True)
+        set_path (str): 저장 경로 (기본값: None, 자동 결정)
+        background (bool): 백그라운드 작업으로 실행 여부 (기본값: False)
+            True이면 작업만 시작하고 바로 반환하며, 완료 시 결과가 세션에 반영됩니다.
+    """
+    dataset = get_dataset()
+    raw_data = dataset.df
+    if raw_data is None:
+        st.warning("먼저 데이터를 로드해주세요.")
+        return
+
+    new_path, origin_name, base_dir = resolve_convert_path(file_name, set_path)
+
+    if background:
+        registry = get_job_registry()
+        if registry.is_running('Data Conversion'):
+            st.warning("⚠️ 이미 데이터 변환이 진행 중입니다.")
+            return
+
+        # 변환 중 Error Check 수정이 작업 스레드의 데이터에 영향을 주지 않도록 복사본 전달
+        source_token = dataset.token
+        trace_memory = get_trace_memory()
+        timing = {}
+
+        def convert_job(job, df, path, side):
+            # 측정기는 작업 스레드에서 생성 (CPU 시간은 스레드 기준이고, 대기 시간은 제외)
+            timing['timer'] = StageTimer(origin_name, trace_memory=trace_memory)
+            return run_convert(df, path, on_step=job.step, side_columns=side, timer=timing['timer'])
+
+        def on_complete(df):
+            save_stage_timing(timing['timer'], new_path)
+            if get_dataset().token != source_token:
+                return f"⚠️ 변환 중 데이터가 변경되어 결과를 적용하지 않았습니다. ({origin_name} 저장됨)"
+            apply_convert_result(df, origin_name, base_dir, new_path)
+            return f"✅ {origin_name}"
+
+        registry.submit(
+            'Data Conversion',
+            convert_job,
+            raw_data.copy(), new_path, get_side_columns(),
+            steps=PROCESS_STEPS,
+            on_complete=on_complete
+        )
+        st.info("⏳ 백그라운드에서 데이터 변환을 시작했습니다. 진행 상태는 사이드바에서 확인할 수 있습니다.")
+        return
+
+    progress = st.progress(0)
+    status_text = st.empty()
+
+    def update_status_display(current_step_idx, current_text=""):
+        display_text = "**Data Conversion Progress:**\n\n"
+        for i, step in enumerate(PROCESS_STEPS):
+            if i < current_step_idx:
+                display_text += f"✅ ~~{step}~~\n\n"
+            elif i == current_step_idx:
+                display_text += f"⏳ **{step}**\n\n"
+            else:
+                display_text += f"⏸️ {step}\n\n"
+        status_text.markdown(display_text)
+        progress.progress(STEP_PROGRESS[current_step_idx])
+
+    timer = StageTimer(origin_name, trace_memory=get_trace_memory())
+    df = run_convert(raw_data, new_path, on_step=update_status_display, side_columns=get_side_columns(), timer=timer)
+
     status_text.empty()
     progress.empty()
 
-    st.session_state["raw_data"] = raw_data
-    st.session_state["curr_file_name"] = origin_name
-    st.session_state["base_directory"] = base_dir
-    st.success(f"✅ {os.path.basename(file_name)}")
+    save_stage_timing(timer, new_path)
+
+    apply_convert_result(df, origin_name, base_dir, new_path)
+    st.success(f"✅ {origin_name}")
     if rerun:
         st.rerun()
@@ -1,9 +1,20 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import openpyxl as xl
 import os
+import io
 from utils.data_convert import convert_data
+from utils.output_files import is_download_mode
+from utils.column_manager import get_all_boolean_columns
 from features.setting import get_column_name, get_default_excel_sheet_index
+from utils.dataset import get_dataset, get_panel_summary
+from utils.column_store import load_projected
+from utils.csv_reader import read_csv_typed
+from utils.stream_convert import submit_stream_convert
+from utils.get_path import select_directory
+from utils.workspace import find_workspace, save_session_workspace, open_session_workspace
+from utils.cache_stats import tracked_cache
 
 def validate_file_path(file_path: str) -> bool:
     """파일 경로가 유효한지 확인합니다."""
@@ -16,18 +27,61 @@ def validate_file_path(file_path: str) -> bool:
 
     return True
 
+def get_sort_codes(values: pd.Series) -> np.ndarray:
+    """
+    정렬 키 컬럼을 정렬 순서의 정수 코드로 변환합니다. (결측값은 sort_values와 같이 마지막)
+
+    문자열(FINISHED_AT 등)도 문자열 비교 대신 정수 코드로 한 번에 비교할 수 있습니다.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # 범주형은 sort_values와 같이 범주 순서로 정렬하므로 범주 코드를 그대로 사용
+        codes = values.cat.codes.to_numpy()
+        return np.where(codes < 0, len(values.cat.categories), codes)
+    codes, uniques = pd.factorize(values, sort=True)
+    return np.where(codes < 0, len(uniques), codes)
+
+
+def is_sorted_by(df: pd.DataFrame, keys: list) -> bool:
+    """데이터가 이미 정렬 키 순서(오름차순)로 정렬되어 있는지 확인합니다."""
+    try:
+        return pd.MultiIndex.from_arrays([df[key] for key in keys]).is_monotonic_increasing
+    except TypeError:
+        return False
+
+
 def sort_data(df):
+    """
+    패널 번호 / 제품 / 응답 일시 순으로 정렬하고 IndexNum을 1부터 다시 부여합니다.
+
+    - 이미 정렬된 데이터(병합 파일, 변환 결과 재로드 등)는 정렬을 건너뜀
+    - 정렬 키를 정수 코드로 바꾸어 안정 정렬(lexsort)한 뒤 행을 한 번만 재배치
+    - IndexNum은 컬럼 재배치 복사 없이 첫 번째 위치에 삽입
+
+    반환한 데이터프레임은 입력과 데이터를 공유할 수 있으므로, 호출한 쪽에서는 입력을 더 이상 사용하지 않습니다.
+    """
     index_col = get_column_name('index_col')
     panel_no = get_column_name('panel_no')
     product_col = get_column_name('product_col')
     answer_date = get_column_name('answer_date')
-    df = df.copy()
-    df = df.sort_values([panel_no, product_col, answer_date])
-    df[index_col] = range(1, len(df) + 1)
-    df = df[[index_col, *[col for col in df.columns if col != index_col]]].copy()
+    keys = [panel_no, product_col, answer_date]
+
+    if is_sorted_by(df, keys):
+        df = df.copy(deep=False)
+    else:
+        try:
+            # lexsort는 마지막 키가 1순위이며 안정 정렬 (같은 키는 원래 순서 유지)
+            order = np.lexsort([get_sort_codes(df[key]) for key in reversed(keys)])
+            df = df.take(order)
+        except TypeError:
+            # 문자/숫자가 섞여 코드화할 수 없는 경우 기존 방식으로 정렬
+            df = df.sort_values(keys)
+
+    if index_col in df.columns:
+        df.pop(index_col)
+    df.insert(0, index_col, np.arange(1, len(df) + 1))
     return df
 
-@st.cache_data
+@tracked_cache()
 def load_data_excel(file_path, sheet_name):
     """Excel 파일에서 데이터를 로드합니다."""
     if not validate_file_path(file_path):
@@ -40,19 +94,72 @@ def load_data_excel(file_path, sheet_name):
         st.error(f"❌ Excel 파일 읽기 오류: {str(e)}")
         return None
 
-@st.cache_data
+@tracked_cache()
 def load_data_csv(file_path):
     """CSV 파일에서 데이터를 로드합니다."""
     if not validate_file_path(file_path):
         return None
 
     try:
-        df = pd.read_csv(file_path)
+        df = read_csv_typed(file_path)
         return sort_data(df)
     except Exception as e:
         st.error(f"❌ CSV 파일 읽기 오류: {str(e)}")
         return None
 
+@tracked_cache(max_entries=2)
+def load_data_upload(file_name, content, sheet_name=None):
+    """업로드한 파일 내용(bytes)에서 데이터를 로드합니다. (다운로드 모드)"""
+    try:
+        if file_name.endswith('.xlsx'):
+            df = pd.read_excel(io.BytesIO(content), sheet_name=sheet_name)
+        else:
+            df = read_csv_typed(content)
+        return sort_data(df)
+    except Exception as e:
+        st.error(f"❌ 파일 읽기 오류: {str(e)}")
+        return None
+
+def show_file_uploader_sidebar():
+    """
+    다운로드 모드에서 서버 파일 대화상자 대신 브라우저 업로드로 원시 데이터를 불러옵니다.
+
+    서버에 파일 경로가 없으므로 결과 파일은 사이드바의 Downloads에서 받습니다.
+    """
+    dataset = get_dataset()
+    with st.sidebar:
+        if dataset.df is not None and st.session_state.get("curr_file_name"):
+            st.success("✅ Data Loaded")
+            st.markdown(f'📄 `{st.session_state.get("curr_file_name")}`')
+            if st.session_state.get("updated_data") :
+                if st.button('‼️ Modified Data Save', width='stretch', type='primary') :
+                    convert_data()
+                    st.session_state["updated_data"] = False
+            return
+
+        st.header("⚒️ Set Raw Data")
+        uploaded = st.file_uploader("Raw Data File", type=['xlsx', 'csv'], key="raw_data_upload")
+        if uploaded is None:
+            return
+
+        content = uploaded.getvalue()
+        sheet_name = None
+        if uploaded.name.endswith('.xlsx'):
+            sheets = xl.load_workbook(io.BytesIO(content), read_only=True).sheetnames
+            default_index = get_default_excel_sheet_index() if len(sheets) > get_default_excel_sheet_index() else 0
+            sheet_name = st.selectbox('Select the sheet', sheets, index=default_index)
+            read_label = f'Read Excel: {sheet_name}'
+        else:
+            read_label = 'Read CSV File'
+
+        if st.button(read_label, width='stretch'):
+            raw_data = load_data_upload(uploaded.name, content, sheet_name)
+            if raw_data is not None:
+                st.session_state["updated_data"] = False
+                st.session_state["raw_data_path"] = uploaded.name
+                load_projected(raw_data)
+                convert_data()
+
 def pick_directory_via_dialog() -> str:
     """로컬 시스템 폴더 선택 대화상자를 띄워 폴더 경로를 반환합니다."""
     try:
@@ -77,10 +184,37 @@ def pick_directory_via_dialog() -> str:
         return ""
 
 
+def show_open_workspace():
+    """작업 공간 폴더를 선택하여 저장된 세션을 복원합니다."""
+    chosen = select_directory("작업 공간 폴더 선택")
+    if not chosen:
+        return
+
+    workspace_dir = find_workspace(chosen)
+    if workspace_dir is None:
+        st.error(f"❌ 작업 공간을 찾을 수 없습니다: {chosen}")
+        return
+
+    try:
+        manifest = open_session_workspace(workspace_dir)
+    except Exception as e:
+        st.error(f"❌ 작업 공간 열기 오류: {str(e)}")
+        return
+
+    st.toast(f"✅ Workspace Opened : {manifest.get('rows', 0):,} rows ({manifest.get('saved_at')})")
+    if manifest['changed_sections']:
+        st.toast(f"⚠️ 저장 시점과 설정이 다릅니다: {', '.join(manifest['changed_sections'])}")
+    st.rerun()
+
+
 def show_data_upload_sidebar():
     set_raw_data_btn = None
     """사이드바에 데이터 업로드 인터페이스를 표시합니다."""
 
+    if is_download_mode():
+        show_file_uploader_sidebar()
+        return
+
     with st.sidebar:
         if st.session_state.get("base_directory") is not None:
             st.success("✅ Data Loaded")
@@ -89,6 +223,10 @@ def show_data_upload_sidebar():
             st.text_input("Base Directory", value=path, disabled=True)
             if file_name:
                 st.markdown(f'📄 `{file_name}`')
+            if st.button("💾 Save Workspace", key="save_workspace_btn", width='stretch'):
+                workspace_dir = save_session_workspace()
+                if workspace_dir:
+                    st.success(f"✅ Workspace Saved : {workspace_dir}")
         else :
             st.header("⚒️ Set Raw Data")
 
@@ -98,8 +236,10 @@ def show_data_upload_sidebar():
                 if chosen:
                     st.session_state["updated_data"] = False
                     st.session_state["raw_data_path"] = chosen
-                    st.session_state["raw_data"] = None
+                    get_dataset().clear()
 
+            if st.button("📂 Open Workspace", key="open_workspace_btn", width='stretch'):
+                show_open_workspace()
 
             folder_input = st.text_input(
                 "Raw Data Path",
@@ -109,7 +249,7 @@ def show_data_upload_sidebar():
 
     raw_data_path = st.session_state.get("raw_data_path")
 
-    if raw_data_path and st.session_state.get("raw_data") is None:
+    if raw_data_path and get_dataset().df is None:
         # 파일 존재 여부 확인
         if not validate_file_path(raw_data_path):
             return  # 파일이 존재하지 않으면 함수 종료
@@ -127,7 +267,7 @@ def show_data_upload_sidebar():
                     if set_raw_data_btn:
                         raw_data = load_data_excel(raw_data_path, select_sheet)
                         if raw_data is not None:
-                            st.session_state["raw_data"] = raw_data
+                            load_projected(raw_data)
                             convert_data()
 
             elif raw_data_path.endswith('.csv'):
@@ -135,8 +275,14 @@ def show_data_upload_sidebar():
                 if csv_read_btn:
                     raw_data = load_data_csv(raw_data_path)
                     if raw_data is not None:
-                        st.session_state["raw_data"] = raw_data
+                        load_projected(raw_data)
                         convert_data()
+
+                # 메모리에 올리기 어려운 대용량 CSV는 패널 단위로 나누어 변환 결과를 파일로만 저장
+                stream_btn = st.button('Stream Convert (Large CSV)', width='stretch',
+                                       help="패널 번호로 정렬된 CSV를 chunk 단위로 검사하여 convert 폴더에 CSV로 저장합니다.")
+                if stream_btn:
+                    submit_stream_convert(raw_data_path)
             else:
                 st.error('**Invalid file type**')
 
@@ -155,19 +301,19 @@ def validate_session_file_path():
     """세션에 저장된 파일 경로가 유효한지 확인하고 필요시 초기화합니다."""
     raw_data_path = st.session_state.get("raw_data_path")
 
-    if raw_data_path and not os.path.exists(raw_data_path):
+    # 다운로드 모드의 raw_data_path는 업로드한 파일명이므로 확인하지 않음
+    if raw_data_path and not is_download_mode() and not os.path.exists(raw_data_path):
         st.warning(f"⚠️ 저장된 파일 경로가 존재하지 않습니다. 데이터를 초기화합니다: {raw_data_path}")
 
 def show_data_info():
     """데이터 정보를 표시합니다."""
-    raw_data = st.session_state.get("raw_data")
+    raw_data = get_dataset().df
 
     if raw_data is not None:
-        df = raw_data.copy()
-
         panel_no = get_column_name('panel_no')
-        total_response = len(df)
-        answer_count = df[panel_no].unique().size if panel_no in df.columns else 0
+        total_response = len(raw_data)
+        panel_summary = get_panel_summary(panel_no, get_all_boolean_columns())
+        answer_count = len(panel_summary) if panel_summary is not None else 0
 
         col1, col2 = st.columns(2)
 
@@ -0,0 +1,119 @@
+"""
+서버 측 페이지 미리보기 컴포넌트
+
+st.dataframe에 전체 데이터프레임을 넘기면 모든 행을 Arrow로 직렬화하여 브라우저로 보내므로,
+행이 많을수록 서버와 브라우저 모두 느려지고 메모리를 많이 사용합니다.
+이 모듈은 정렬/필터를 pandas에서 처리한 뒤 현재 페이지의 행만 잘라서 표시합니다.
+
+주요 기능:
+- 페이지 크기 / 페이지 번호 선택
+- 컬럼 기준 정렬 (정렬 컬럼만 정렬하여 행 위치를 계산)
+- 컬럼 값 포함 검색 필터
+"""
+
+from typing import Optional
+import numpy as np
+import pandas as pd
+import streamlit as st
+from features.setting import get_preview_rows
+
+PAGE_SIZE_OPTIONS = [10, 30, 50, 100, 200]
+
+
+def get_filter_positions(df: pd.DataFrame, column: Optional[str], keyword: str) -> np.ndarray:
+    """
+    검색어를 포함하는 행 위치를 반환합니다. (대소문자 구분 없음)
+
+    Args:
+        df (DataFrame): 원본 데이터
+        column (str): 검색할 컬럼명 (None이면 필터 없음)
+        keyword (str): 검색어
+
+    Returns:
+        ndarray: 조건에 맞는 행 위치
+    """
+    if column is None or not keyword:
+        return np.arange(len(df))
+    values = df[column].astype(str)
+    mask = values.str.contains(keyword, case=False, na=False, regex=False).to_numpy()
+    return np.flatnonzero(mask)
+
+
+def get_sorted_positions(df: pd.DataFrame, positions: np.ndarray, column: Optional[str], ascending: bool) -> np.ndarray:
+    """
+    행 위치를 컬럼 값 기준으로 정렬합니다. 정렬 컬럼만 정렬하고 데이터프레임 전체는 복사하지 않습니다.
+
+    Args:
+        df (DataFrame): 원본 데이터
+        positions (ndarray): 정렬할 행 위치
+        column (str): 정렬 컬럼명 (None이면 원래 순서)
+        ascending (bool): 오름차순 여부
+
+    Returns:
+        ndarray: 정렬된 행 위치
+    """
+    if column is None or len(positions) == 0:
+        return positions
+    values = df[column].iloc[positions].reset_index(drop=True)
+    try:
+        order = values.sort_values(ascending=ascending, kind='stable').index.to_numpy()
+    except TypeError:
+        # 문자/숫자가 섞인 컬럼은 문자열 기준으로 정렬
+        order = values.astype(str).sort_values(ascending=ascending, kind='stable').index.to_numpy()
+    return positions[order]
+
+
+def show_paged_dataframe(df: pd.DataFrame, key: str, sortable: bool = True, filterable: bool = True, **dataframe_kwargs) -> None:
+    """
+    데이터프레임을 서버에서 페이지 단위로 잘라 표시합니다.
+
+    Args:
+        df (DataFrame): 표시할 데이터
+        key (str): 위젯 키 접두어 (페이지 안에서 고유해야 함)
+        sortable (bool): 정렬 옵션 표시 여부
+        filterable (bool): 검색 필터 표시 여부
+        **dataframe_kwargs: st.dataframe에 전달할 추가 인자
+    """
+    columns = list(df.columns)
+    sort_col = filter_col = None
+    ascending = True
+    keyword = ''
+
+    if (sortable or filterable) and columns:
+        opt_col1, opt_col2, opt_col3, opt_col4 = st.columns([2, 1, 2, 2], vertical_alignment="bottom")
+        if sortable:
+            with opt_col1:
+                sort_col = st.selectbox("정렬 컬럼", columns, index=None, key=f'{key}_sort_col')
+            with opt_col2:
+                ascending = st.toggle("오름차순", value=True, key=f'{key}_ascending')
+        if filterable:
+            with opt_col3:
+                filter_col = st.selectbox("검색 컬럼", columns, index=None, key=f'{key}_filter_col')
+            with opt_col4:
+                keyword = st.text_input("검색어", value="", key=f'{key}_keyword')
+
+    positions = get_filter_positions(df, filter_col, keyword)
+    total = len(positions)
+
+    page_col1, page_col2, page_col3 = st.columns([1, 1, 4], vertical_alignment="bottom")
+    default_size = get_preview_rows()
+    size_options = sorted(set(PAGE_SIZE_OPTIONS + [default_size]))
+    with page_col1:
+        page_size = st.selectbox("페이지 크기", size_options, index=size_options.index(default_size), key=f'{key}_page_size')
+    page_count = max((total - 1) // page_size + 1, 1)
+
+    # 필터/페이지 크기 변경으로 페이지 수가 줄어든 경우 첫 페이지로 이동
+    # (기본값은 세션 상태로만 지정 - value=와 함께 쓰면 Streamlit 경고 발생)
+    page_key = f'{key}_page'
+    if st.session_state.setdefault(page_key, 1) > page_count:
+        st.session_state[page_key] = 1
+    with page_col2:
+        page = st.number_input("페이지", min_value=1, max_value=page_count, step=1, key=page_key)
+    with page_col3:
+        st.caption(f"총 {total:,}행 / {page_count:,} 페이지")
+
+    # 정렬은 필터된 행 위치에만 적용하고, 현재 페이지 행만 잘라서 전송
+    positions = get_sorted_positions(df, positions, sort_col, ascending)
+    start = (page - 1) * page_size
+    page_df = df.iloc[positions[start:start + page_size]]
+    st.dataframe(page_df, **dataframe_kwargs)
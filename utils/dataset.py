@@ -0,0 +1,145 @@
+"""
+세션 작업 데이터를 관리하는 데이터셋 핸들
+
+페이지마다 st.session_state['raw_data']를 직접 읽고 복사하면 데이터가 언제 바뀌었는지
+알 수 없어 파생 결과를 캐시할 수 없습니다. 이 모듈은 데이터 변경(로드, 변환, 수정, 삭제)마다
+증가하는 버전을 관리하고, 버전 토큰을 캐시 키로 사용하여 파생 결과를 재사용할 수 있게 합니다.
+
+주요 기능:
+- 데이터 로드/교체/제자리 수정 시 버전 증가
+- 데이터셋 ID + 버전으로 구성된 캐시 토큰 (세션 간에도 고유)
+- 파생 결과(오류 인덱스, 패널 요약, 분할 분류 등) 세션 메모이제이션
+"""
+
+import uuid
+from typing import Any, Callable, Optional
+import pandas as pd
+import streamlit as st
+from utils.edit_journal import get_edit_journal
+from utils.cache_stats import record_memo
+
+
+class Dataset:
+    """
+    세션 작업 데이터 핸들
+
+    데이터 자체는 기존과 같이 st.session_state['raw_data']에 보관하고,
+    버전 정보와 파생 결과 캐시를 함께 관리합니다.
+    """
+
+    def __init__(self, state):
+        self._state = state
+        self._state.setdefault('data_version', 0)
+        self._state.setdefault('dataset_id', uuid.uuid4().hex)
+        self._state.setdefault('dataset_cache', {})
+
+    @property
+    def df(self) -> Optional[pd.DataFrame]:
+        """현재 작업 데이터 (읽기 전용으로 사용하고, 수정 후에는 touch/replace 호출)"""
+        return self._state.get('raw_data')
+
+    @property
+    def version(self) -> int:
+        """데이터가 바뀔 때마다 증가하는 버전"""
+        return self._state['data_version']
+
+    @property
+    def token(self) -> str:
+        """캐시 키로 사용할 데이터 토큰 (데이터셋 ID + 버전)"""
+        return f"{self._state['dataset_id']}:{self._state['data_version']}"
+
+    def _bump(self) -> None:
+        self._state['data_version'] += 1
+        self._state['dataset_cache'] = {}
+
+    def load(self, df: Optional[pd.DataFrame]) -> None:
+        """새 데이터를 로드합니다. 데이터셋 ID를 새로 발급하고 실행 취소 저널을 비웁니다."""
+        self._state['raw_data'] = df
+        self._state['dataset_id'] = uuid.uuid4().hex
+        get_edit_journal().clear()
+        self._bump()
+
+    def replace(self, df: pd.DataFrame) -> None:
+        """같은 데이터셋의 새 버전으로 교체합니다. (변환, 행 삭제, 실행 취소 등)"""
+        self._state['raw_data'] = df
+        self._bump()
+
+    def touch(self) -> None:
+        """데이터가 제자리에서 수정된 경우 버전을 올립니다. (셀 수정 등)"""
+        self._bump()
+
+    def restore(self, df: pd.DataFrame) -> None:
+        """
+        저장된 작업 공간의 데이터를 새 데이터셋 ID로 복원합니다.
+
+        같은 작업 공간을 여러 세션에서 열거나, 이미 수정한 세션에서 다시 열어도 토큰이 겹치지 않도록
+        저장 시점의 데이터셋 ID/버전은 매니페스트에만 남기고 다시 사용하지 않습니다.
+        """
+        self.load(df)
+
+    def clear_cache(self) -> None:
+        """파생 결과 캐시를 비웁니다. (데이터와 버전은 유지)"""
+        self._state['dataset_cache'] = {}
+
+    def clear(self) -> None:
+        """작업 데이터를 비웁니다."""
+        self.load(None)
+
+    def memoize(self, name: str, builder: Callable[[], Any], *parts) -> Any:
+        """
+        현재 데이터 버전에 대한 파생 결과를 한 번만 계산하여 재사용합니다.
+
+        Args:
+            name (str): 파생 결과 이름 (예: 'error_index')
+            builder (callable): 결과를 계산하는 함수
+            *parts: 버전 외에 결과에 영향을 주는 값 (설정값 등)
+
+        Returns:
+            파생 결과
+        """
+        key = (self.token, parts)
+        cache = self._state['dataset_cache']
+        cached = cache.get(name)
+        if cached is not None and cached[0] == key:
+            record_memo(name, hit=True)
+            return cached[1]
+
+        record_memo(name, hit=False)
+        value = builder()
+        cache[name] = (key, value)
+        return value
+
+
+def get_dataset() -> Dataset:
+    """현재 세션의 데이터셋 핸들을 반환합니다."""
+    return Dataset(st.session_state)
+
+
+def get_panel_summary(panel_no: str, boolean_columns: list) -> Optional[pd.DataFrame]:
+    """
+    패널별 응답 수와 오류 여부 요약을 반환합니다. (데이터 버전별로 한 번만 계산)
+
+    Args:
+        panel_no (str): 패널 번호 컬럼명
+        boolean_columns (list): 오류/체크 불린 컬럼명 리스트
+
+    Returns:
+        DataFrame: 패널 번호 인덱스, rows(응답 수), has_error(오류 여부) 컬럼 (데이터가 없으면 None)
+    """
+    dataset = get_dataset()
+    df = dataset.df
+    if df is None or panel_no not in df.columns:
+        return None
+
+    def build():
+        existing = [col for col in boolean_columns if col in df.columns]
+        summary = pd.DataFrame(index=pd.Index(df[panel_no].unique(), name=panel_no))
+        summary['rows'] = df.groupby(panel_no, sort=False).size()
+        if existing:
+            has_error = (df[existing] == True).any(axis=1)
+            summary['has_error'] = has_error.groupby(df[panel_no], sort=False).any()
+        else:
+            summary['has_error'] = False
+        return summary
+
+    return dataset.memoize('panel_summary', build, panel_no, tuple(boolean_columns))
@@ -0,0 +1,146 @@
+"""
+Error Check 저장 내역의 실행 취소/다시 실행(Undo/Redo) 저널
+
+저장할 때마다 데이터프레임 전체를 복사하지 않고, 변경된 셀과 삭제된 행 블록만
+델타(delta)로 기록합니다. 행 위치는 저장 시점 데이터프레임의 정수 위치(iloc) 기준입니다.
+
+- 셀 변경: 변경된 행 위치, 컬럼, 변경 전/후 값
+- 행 삭제: 삭제 전 행 위치와 삭제된 행 데이터
+- 로그: 저장 시 기록한 MODIFY/DELETE 로그 행 (UNDO/REDO 로그에 재사용)
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional
+import numpy as np
+import pandas as pd
+import streamlit as st
+from features.setting import get_journal_max_entries
+
+
+@dataclass
+class JournalEntry:
+    """Error Check 저장 1회에 해당하는 델타"""
+    error_type: str
+    updated_date: str
+    panels: list = field(default_factory=list)
+    cell_positions: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.intp))
+    cells_before: Optional[pd.DataFrame] = None
+    cells_after: Optional[pd.DataFrame] = None
+    deleted_positions: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.intp))
+    deleted_rows: Optional[pd.DataFrame] = None
+    log_rows: Optional[pd.DataFrame] = None
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self.cell_positions) == 0 and len(self.deleted_positions) == 0
+
+
+def apply_cells(df: pd.DataFrame, positions: np.ndarray, values: pd.DataFrame) -> None:
+    """지정한 행 위치의 셀 값을 블록 단위로 덮어씁니다 (제자리 수정)."""
+    if len(positions) == 0:
+        return
+    col_positions = [df.columns.get_loc(col) for col in values.columns]
+    df.iloc[positions, col_positions] = values.to_numpy()
+
+
+def delete_rows(df: pd.DataFrame, positions: np.ndarray) -> pd.DataFrame:
+    """지정한 행 위치를 삭제하고 인덱스를 다시 부여합니다."""
+    if len(positions) == 0:
+        return df
+    keep_mask = np.ones(len(df), dtype=bool)
+    keep_mask[positions] = False
+    return df[keep_mask].reset_index(drop=True)
+
+
+def restore_rows(df: pd.DataFrame, positions: np.ndarray, rows: pd.DataFrame) -> pd.DataFrame:
+    """삭제된 행들을 삭제 전 위치에 다시 끼워 넣고 인덱스를 다시 부여합니다."""
+    if len(positions) == 0:
+        return df
+    total = len(df) + len(positions)
+    keep_positions = np.setdiff1d(np.arange(total), positions, assume_unique=True)
+    combined = pd.concat([df, rows], ignore_index=True)
+    order = np.argsort(np.concatenate([keep_positions, positions]), kind='stable')
+    return combined.iloc[order].reset_index(drop=True)
+
+
+class EditJournal:
+    """
+    최근 저장 내역을 max_entries 개까지 보관하는 Undo/Redo 저널
+
+    저널 크기를 넘으면 가장 오래된 항목부터 버려 메모리 사용량을 제한합니다.
+    """
+
+    def __init__(self, max_entries: int = 30):
+        self.max_entries = max_entries
+        self._undo = deque(maxlen=max_entries)
+        self._redo = deque(maxlen=max_entries)
+
+    def record(self, entry: JournalEntry) -> None:
+        """새 저장 내역을 기록합니다. 새 기록이 생기면 Redo 내역은 비웁니다."""
+        if entry.is_empty:
+            return
+        self._undo.append(entry)
+        self._redo.clear()
+
+    def clear(self) -> None:
+        self._undo.clear()
+        self._redo.clear()
+
+    def resize(self, max_entries: int) -> None:
+        """저널 크기를 바꿉니다. 줄어드는 경우 Undo/Redo 모두 가장 오래된 항목부터 버립니다."""
+        self.max_entries = max_entries
+        self._undo = deque(self._undo, maxlen=max_entries)
+        self._redo = deque(self._redo, maxlen=max_entries)
+
+    @property
+    def undo_count(self) -> int:
+        return len(self._undo)
+
+    @property
+    def redo_count(self) -> int:
+        return len(self._redo)
+
+    def undo(self, df: pd.DataFrame):
+        """
+        마지막 저장 내역을 되돌립니다.
+
+        Returns:
+            tuple: (되돌린 데이터프레임, 되돌린 JournalEntry) - 되돌릴 내역이 없으면 (df, None)
+        """
+        if not self._undo:
+            return df, None
+        entry = self._undo.pop()
+        # 저장 시 순서(수정 -> 삭제)의 역순으로 복원
+        df = restore_rows(df, entry.deleted_positions, entry.deleted_rows)
+        apply_cells(df, entry.cell_positions, entry.cells_before)
+        self._redo.append(entry)
+        return df, entry
+
+    def redo(self, df: pd.DataFrame):
+        """
+        되돌린 저장 내역을 다시 적용합니다.
+
+        Returns:
+            tuple: (다시 적용한 데이터프레임, 적용한 JournalEntry) - 적용할 내역이 없으면 (df, None)
+        """
+        if not self._redo:
+            return df, None
+        entry = self._redo.pop()
+        apply_cells(df, entry.cell_positions, entry.cells_after)
+        df = delete_rows(df, entry.deleted_positions)
+        self._undo.append(entry)
+        return df, entry
+
+
+def get_edit_journal() -> EditJournal:
+    """세션별 EditJournal 인스턴스를 반환합니다."""
+    max_entries = get_journal_max_entries()
+    journal = st.session_state.get('edit_journal')
+    if journal is None:
+        journal = EditJournal(max_entries)
+        st.session_state['edit_journal'] = journal
+    elif journal.max_entries != max_entries:
+        # 설정이 바뀌어도 기존 Undo/Redo 내역은 유지
+        journal.resize(max_entries)
+    return journal
@@ -0,0 +1,108 @@
+"""
+Error Check 페이지용 오류/패널 인덱스
+
+Error Check 페이지는 위젯을 조작할 때마다 다시 실행되므로, 매번 전체 데이터에 대해
+오류 조건과 패널 필터를 계산하지 않도록 데이터가 바뀔 때 한 번만 인덱스를 생성합니다.
+
+인덱스 구성:
+- 오류 컬럼 -> 오류가 있는 패널 목록 (정렬)
+- 오류 컬럼 -> 패널 -> 오류 행 위치
+- 패널 -> 전체 행 위치
+- 패널 -> 제품별 응답 수
+"""
+
+from typing import Dict, List
+import numpy as np
+import pandas as pd
+from utils.dataset import get_dataset
+
+
+class ErrorIndex:
+    """
+    오류 유형별 / 패널별 행 위치 인덱스
+
+    행 위치는 원본 데이터프레임 기준의 정수 위치(iloc)입니다.
+    """
+
+    def __init__(self, df: pd.DataFrame, panel_no: str, product_col: str, error_columns: List[str]):
+        """
+        Args:
+            df (DataFrame): 변환이 완료된 데이터프레임
+            panel_no (str): 패널 번호 컬럼명
+            product_col (str): 제품 컬럼명
+            error_columns (list): 인덱스를 만들 오류(불린) 컬럼명 리스트
+        """
+        self.panel_no = panel_no
+        self.product_col = product_col
+
+        # 패널 -> 전체 행 위치
+        self.panel_rows: Dict[object, np.ndarray] = df.groupby(panel_no, sort=True).indices
+
+        # 패널 -> 제품별 응답 수
+        self.panel_product_counts = self._count_products(df)
+
+        # 오류 컬럼 -> 패널 -> 오류 행 위치 / 제품별 오류 응답 수
+        self.error_rows: Dict[str, Dict[object, np.ndarray]] = {}
+        self.error_product_counts: Dict[str, Dict[object, Dict[str, int]]] = {}
+        for error_col in error_columns:
+            if error_col not in df.columns:
+                self.error_rows[error_col] = {}
+                self.error_product_counts[error_col] = {}
+                continue
+
+            positions = np.flatnonzero(df[error_col].to_numpy() == True)
+            error_df = df.iloc[positions]
+            self.error_rows[error_col] = {
+                panel: positions[rows] for panel, rows in error_df.groupby(panel_no, sort=True).indices.items()
+            }
+            self.error_product_counts[error_col] = self._count_products(error_df)
+
+    def _count_products(self, df: pd.DataFrame) -> Dict[object, Dict[str, int]]:
+        """패널 -> 제품 -> 응답 수 딕셔너리를 생성 (제품은 데이터 등장 순서)"""
+        product_counts: Dict[object, Dict[str, int]] = {}
+        if self.product_col not in df.columns:
+            return product_counts
+
+        counts = df.groupby([self.panel_no, self.product_col], sort=False, observed=True).size()
+        for (panel, product), count in counts.items():
+            product_counts.setdefault(panel, {})[product] = int(count)
+        return product_counts
+
+    def get_error_panels(self, error_col: str) -> List[object]:
+        """오류가 있는 패널 목록을 반환"""
+        return [panel.item() if isinstance(panel, np.generic) else panel for panel in self.error_rows.get(error_col, {})]
+
+    def get_error_products(self, error_col: str, panel) -> List[str]:
+        """패널의 오류 행에 해당하는 제품 목록을 반환"""
+        return list(self.error_product_counts.get(error_col, {}).get(panel, {}).keys())
+
+    def get_panel_rows(self, panel) -> np.ndarray:
+        """패널의 전체 행 위치를 반환"""
+        return self.panel_rows.get(panel, np.array([], dtype=np.intp))
+
+    def get_product_counts(self, panel, error_col: str = None) -> Dict[str, int]:
+        """
+        패널의 제품별 응답 수를 많은 순으로 반환
+
+        Args:
+            panel: 패널 번호
+            error_col (str, optional): 지정하면 해당 오류 행만 집계
+        """
+        if error_col is None:
+            counts = self.panel_product_counts.get(panel, {})
+        else:
+            counts = self.error_product_counts.get(error_col, {}).get(panel, {})
+        return dict(sorted(counts.items(), key=lambda item: item[1], reverse=True))
+
+
+def get_error_index(df: pd.DataFrame, panel_no: str, product_col: str, error_columns: List[str]) -> ErrorIndex:
+    """
+    현재 데이터에 대한 ErrorIndex를 반환합니다.
+
+    데이터 버전별로 한 번만 생성하고, 같은 버전에서는 세션에 저장된 인덱스를 재사용합니다.
+    """
+    return get_dataset().memoize(
+        'error_index',
+        lambda: ErrorIndex(df, panel_no, product_col, error_columns),
+        panel_no, product_col, tuple(error_columns)
+    )
@@ -0,0 +1,145 @@
+"""
+파일 내보내기 (CSV / Parquet / xlsx)
+
+데이터프레임 전체를 한 번에 to_excel로 쓰면 느리고 메모리를 많이 사용하므로,
+행을 chunk_rows 단위로 나누어 순서대로 쓰고 chunk마다 진행률을 알립니다.
+
+지원 형식:
+- CSV: 인코딩 지정 (DS Import는 cp949 CSV 사용)
+- Parquet: pyarrow가 설치된 경우에만 사용 가능
+- xlsx: openpyxl write-only 모드 (셀 스타일 없이 값만 스트리밍)
+
+저장 대상은 파일 경로 또는 바이너리 버퍼(io.BytesIO, 다운로드 모드)를 모두 사용할 수 있습니다.
+"""
+
+import io
+import os
+from typing import IO, Callable, Optional, Union
+import pandas as pd
+import openpyxl as xl
+
+FORMAT_XLSX = 'xlsx'
+FORMAT_CSV = 'csv'
+FORMAT_PARQUET = 'parquet'
+
+# 화면 표시명 -> 형식
+EXPORT_FORMATS = {
+    "Excel (xlsx)": FORMAT_XLSX,
+    "CSV": FORMAT_CSV,
+    "Parquet": FORMAT_PARQUET,
+}
+
+CSV_ENCODINGS = ['cp949', 'utf-8-sig', 'utf-8']
+
+
+def is_parquet_available() -> bool:
+    """Parquet 저장에 필요한 pyarrow 설치 여부를 반환합니다."""
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def iter_chunks(df: pd.DataFrame, chunk_rows: int):
+    """(시작 행, chunk) 단위로 데이터프레임을 나눕니다."""
+    chunk_rows = max(int(chunk_rows), 1)
+    for start in range(0, len(df), chunk_rows):
+        yield start, df.iloc[start:start + chunk_rows]
+
+
+ExportTarget = Union[str, IO[bytes]]
+
+
+def write_csv(df: pd.DataFrame, path: ExportTarget, encoding: str, chunk_rows: int,
+              on_progress: Optional[Callable[[int, int], None]] = None) -> None:
+    """CSV 파일을 chunk 단위로 씁니다. (헤더는 첫 chunk에서 한 번만)"""
+    total = len(df)
+    if isinstance(path, str):
+        f = open(path, 'w', encoding=encoding, newline='')
+    else:
+        f = io.TextIOWrapper(path, encoding=encoding, newline='')
+    try:
+        if total == 0:
+            df.to_csv(f, index=False)
+        for start, chunk in iter_chunks(df, chunk_rows):
+            chunk.to_csv(f, index=False, header=(start == 0))
+            if on_progress is not None:
+                on_progress(start + len(chunk), total)
+    finally:
+        if isinstance(path, str):
+            f.close()
+        else:
+            # 버퍼는 닫지 않고 분리만 하여 호출한 쪽에서 계속 사용할 수 있도록 함
+            f.flush()
+            f.detach()
+
+
+def write_parquet(df: pd.DataFrame, path: ExportTarget, chunk_rows: int,
+                  on_progress: Optional[Callable[[int, int], None]] = None) -> None:
+    """Parquet 파일을 chunk 단위 row group으로 씁니다."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    total = len(df)
+    # 전체 데이터 기준으로 스키마를 정해 chunk마다 타입이 달라지지 않도록 함
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    with pq.ParquetWriter(path, schema) as writer:
+        for start, chunk in iter_chunks(df, chunk_rows):
+            table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+            writer.write_table(table)
+            if on_progress is not None:
+                on_progress(start + len(chunk), total)
+
+
+def write_xlsx(df: pd.DataFrame, path: ExportTarget, chunk_rows: int, sheet_name: str = 'Raw Data',
+               on_progress: Optional[Callable[[int, int], None]] = None) -> None:
+    """write-only 모드 워크북에 행을 순서대로 추가하여 xlsx 파일을 씁니다."""
+    total = len(df)
+    workbook = xl.Workbook(write_only=True)
+    sheet = workbook.create_sheet(sheet_name)
+    sheet.append([str(col) for col in df.columns])
+
+    for start, chunk in iter_chunks(df, chunk_rows):
+        # 결측값은 빈 셀로 저장 (to_excel과 동일)
+        values = chunk.astype(object).where(chunk.notna(), None)
+        for row in values.itertuples(index=False, name=None):
+            sheet.append(row)
+        if on_progress is not None:
+            on_progress(start + len(chunk), total)
+
+    workbook.save(path)
+
+
+def export_frame(df: pd.DataFrame, save_path: Optional[str], file_stem: str, export_format: str,
+                 chunk_rows: int, encoding: str = 'cp949',
+                 on_progress: Optional[Callable[[int, int], None]] = None) -> Union[str, tuple]:
+    """
+    데이터프레임을 지정한 형식으로 저장합니다.
+
+    Args:
+        df (DataFrame): 저장할 데이터
+        save_path (str): 저장 폴더 (None이면 메모리 버퍼에 저장 - 다운로드 모드)
+        file_stem (str): 확장자를 제외한 파일명
+        export_format (str): FORMAT_XLSX / FORMAT_CSV / FORMAT_PARQUET
+        chunk_rows (int): 한 번에 쓰는 행 수
+        encoding (str): CSV 인코딩
+        on_progress (callable, optional): chunk마다 (저장한 행 수, 전체 행 수)로 호출할 함수
+
+    Returns:
+        str: 저장된 파일 경로
+            save_path가 None이면 (파일명, 파일 내용) 튜플
+    """
+    file_name = f'{file_stem}.{export_format}'
+    path = io.BytesIO() if save_path is None else os.path.join(save_path, file_name)
+    if export_format == FORMAT_CSV:
+        write_csv(df, path, encoding, chunk_rows, on_progress)
+    elif export_format == FORMAT_PARQUET:
+        write_parquet(df, path, chunk_rows, on_progress)
+    elif export_format == FORMAT_XLSX:
+        write_xlsx(df, path, chunk_rows, on_progress=on_progress)
+    else:
+        raise ValueError(f"지원하지 않는 형식입니다: {export_format}")
+    if save_path is None:
+        return file_name, path.getvalue()
+    return path
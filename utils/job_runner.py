@@ -0,0 +1,261 @@
+"""
+백그라운드 작업 실행기
+
+데이터 변환, 분할 저장, 병합처럼 오래 걸리는 작업을 스크립트 스레드가 아닌 별도 스레드에서 실행합니다.
+작업이 실행되는 동안에도 다른 페이지(Dashboard 등)를 계속 사용할 수 있습니다.
+
+주요 기능:
+- 세션별 작업 목록 (작업 이름당 최근 작업 1개)
+- 단계 목록(PROCESS_STEPS 등) 기반 진행 상태 표시
+- 작업 취소 (단계/파일 단위로 취소 요청 확인)
+- 완료된 작업 결과를 스크립트 스레드에서 세션에 반영 (결과 인계)
+
+작업 함수는 스레드에서 실행되므로 st.session_state나 화면 요소를 사용하지 않고,
+필요한 값은 인자로 받아 결과로 반환해야 합니다.
+"""
+
+import threading
+import time
+import traceback
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+import streamlit as st
+
+JOB_RUNNING = 'running'
+JOB_DONE = 'done'
+JOB_FAILED = 'failed'
+JOB_CANCELLED = 'cancelled'
+
+# 실행 중인 작업 상태를 다시 그리는 주기 (초)
+JOB_POLL_SECONDS = 1
+
+
+class JobCancelled(Exception):
+    """작업 취소 요청 시 작업 스레드에서 발생하는 예외"""
+
+
+class Job:
+    """
+    백그라운드 작업 1건
+
+    작업 함수는 첫 번째 인자로 Job을 받아 step()/update()로 진행 상태를 알리고,
+    그때마다 취소 요청이 있으면 JobCancelled가 발생하여 작업이 중단됩니다.
+    """
+
+    def __init__(self, name: str, target: Callable, args: tuple, kwargs: dict,
+                 steps: Optional[List[str]] = None, on_complete: Optional[Callable[[Any], Optional[str]]] = None):
+        self.id = uuid.uuid4().hex
+        self.name = name
+        self.steps = list(steps or [])
+        self.status = JOB_RUNNING
+        self.step_idx = -1
+        self.progress = 0
+        self.message = ''
+        self.result = None
+        self.error = None
+        self.on_complete = on_complete
+        self.handed_off = False
+        self.started_at = time.time()
+        self.finished_at = None
+        self._cancel_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(target, args, kwargs), name=f'job-{name}', daemon=True
+        )
+
+    # 작업 스레드에서 호출하는 메서드
+    def check_cancelled(self) -> None:
+        """취소 요청이 있으면 JobCancelled를 발생시킵니다."""
+        if self._cancel_event.is_set():
+            raise JobCancelled()
+
+    def step(self, step_idx: int, progress: Optional[int] = None) -> None:
+        """
+        단계 시작을 알립니다.
+
+        Args:
+            step_idx (int): 단계 인덱스 (steps 기준)
+            progress (int, optional): 진행률 (0~100, 생략 시 단계 수 기준으로 계산)
+        """
+        self.check_cancelled()
+        self.step_idx = step_idx
+        if progress is None and self.steps:
+            progress = int((step_idx + 1) / len(self.steps) * 100)
+        if progress is not None:
+            self.progress = progress
+
+    def update(self, progress: int, message: str = '') -> None:
+        """단계 없이 진행률과 메시지를 알립니다. (파일 저장 등 반복 작업)"""
+        self.check_cancelled()
+        self.progress = progress
+        self.message = message
+
+    # 스크립트 스레드에서 호출하는 메서드
+    def start(self) -> None:
+        self._thread.start()
+
+    def cancel(self) -> None:
+        """작업 취소를 요청합니다. 작업은 다음 단계/파일에서 중단됩니다."""
+        self._cancel_event.set()
+
+    @property
+    def is_running(self) -> bool:
+        return self.status == JOB_RUNNING
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel_event.is_set()
+
+    @property
+    def elapsed(self) -> float:
+        """경과 시간 (초)"""
+        end = self.finished_at if self.finished_at is not None else time.time()
+        return end - self.started_at
+
+    def _run(self, target: Callable, args: tuple, kwargs: dict) -> None:
+        try:
+            self.result = target(self, *args, **kwargs)
+            self.progress = 100
+            self.status = JOB_DONE
+        except JobCancelled:
+            self.status = JOB_CANCELLED
+        except Exception as e:
+            self.error = f"{e}\n{traceback.format_exc()}"
+            self.message = str(e)
+            self.status = JOB_FAILED
+        finally:
+            self.finished_at = time.time()
+
+
+class JobRegistry:
+    """세션별 백그라운드 작업 목록 (작업 이름당 최근 작업 1개)"""
+
+    def __init__(self):
+        self._jobs: Dict[str, Job] = {}
+
+    def submit(self, name: str, target: Callable, *args, steps: Optional[List[str]] = None,
+               on_complete: Optional[Callable[[Any], Optional[str]]] = None, **kwargs) -> Job:
+        """
+        작업을 백그라운드 스레드에서 시작합니다.
+
+        Args:
+            name (str): 작업 이름 (같은 이름의 작업은 동시에 하나만 실행)
+            target (callable): 작업 함수 - target(job, *args, **kwargs)
+            steps (list, optional): 진행 상태로 표시할 단계 목록
+            on_complete (callable, optional): 완료 시 스크립트 스레드에서 결과를 받아 호출할 함수
+                (반환한 문자열은 완료 메시지로 표시)
+
+        Returns:
+            Job: 시작된 작업
+
+        Raises:
+            RuntimeError: 같은 이름의 작업이 이미 실행 중인 경우
+        """
+        if self.is_running(name):
+            raise RuntimeError(f"'{name}' 작업이 이미 실행 중입니다.")
+        job = Job(name, target, args, kwargs, steps=steps, on_complete=on_complete)
+        self._jobs[name] = job
+        job.start()
+        return job
+
+    def get(self, name: str) -> Optional[Job]:
+        return self._jobs.get(name)
+
+    def is_running(self, name: str) -> bool:
+        job = self._jobs.get(name)
+        return job is not None and job.is_running
+
+    @property
+    def jobs(self) -> List[Job]:
+        return list(self._jobs.values())
+
+    @property
+    def has_running(self) -> bool:
+        return any(job.is_running for job in self._jobs.values())
+
+    def handoff(self) -> List[Job]:
+        """
+        완료되었지만 아직 세션에 반영하지 않은 작업의 결과를 반영합니다. (스크립트 스레드에서 호출)
+
+        Returns:
+            list: 이번에 반영한 작업 리스트
+        """
+        finished = []
+        for job in self._jobs.values():
+            if job.is_running or job.handed_off:
+                continue
+            job.handed_off = True
+            if job.status == JOB_DONE and job.on_complete is not None:
+                try:
+                    message = job.on_complete(job.result)
+                    if message:
+                        job.message = message
+                except Exception as e:
+                    job.status = JOB_FAILED
+                    job.message = str(e)
+                    job.error = traceback.format_exc()
+            # 결과를 반영한 뒤에는 데이터 참조를 놓아 메모리를 해제
+            job.result = None
+            finished.append(job)
+        return finished
+
+    def dismiss(self, name: str) -> None:
+        """완료된 작업을 목록에서 제거합니다."""
+        job = self._jobs.get(name)
+        if job is not None and not job.is_running:
+            del self._jobs[name]
+
+
+def get_job_registry() -> JobRegistry:
+    """세션별 JobRegistry 인스턴스를 반환합니다."""
+    registry = st.session_state.get('job_registry')
+    if registry is None:
+        registry = JobRegistry()
+        st.session_state['job_registry'] = registry
+    return registry
+
+
+def format_job_steps(job: Job) -> str:
+    """작업 단계 목록을 진행 상태 마크다운으로 변환합니다."""
+    display_text = ""
+    for i, step in enumerate(job.steps):
+        if job.status == JOB_DONE or i < job.step_idx:
+            display_text += f"✅ ~~{step}~~\n\n"
+        elif i == job.step_idx:
+            display_text += f"⏳ **{step}**\n\n"
+        else:
+            display_text += f"⏸️ {step}\n\n"
+    return display_text
+
+
+@st.fragment(run_every=JOB_POLL_SECONDS)
+def show_job_status():
+    """
+    백그라운드 작업 상태를 표시합니다.
+
+    실행 중에는 주기적으로 이 영역만 다시 그리고, 작업이 끝나면 결과를 세션에 반영한 뒤
+    앱 전체를 다시 실행하여 변경된 데이터가 모든 페이지에 반영되도록 합니다.
+    """
+    registry = get_job_registry()
+    if registry.handoff():
+        st.rerun()
+
+    for job in registry.jobs:
+        st.markdown(f"**⚙️ {job.name}** ({job.elapsed:.0f}s)")
+        if job.is_running:
+            st.progress(job.progress, text=job.message or None)
+            if job.steps:
+                st.caption(format_job_steps(job))
+            if job.cancel_requested:
+                st.caption("⏹️ 취소 요청됨")
+            elif st.button("⏹️ 취소", key=f'job_cancel_{job.id}', width='stretch'):
+                job.cancel()
+        else:
+            if job.status == JOB_DONE:
+                st.success(job.message or "✅ 완료")
+            elif job.status == JOB_CANCELLED:
+                st.warning("⏹️ 작업이 취소되었습니다.")
+            else:
+                st.error(f"❌ 작업 중 오류가 발생했습니다: {job.message}")
+            if st.button("닫기", key=f'job_dismiss_{job.id}', width='stretch'):
+                registry.dismiss(job.name)
+                st.rerun()
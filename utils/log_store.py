@@ -0,0 +1,187 @@
+"""
+변경 로그를 로컬 SQLite 파일에 저장하고 조회하는 모듈
+
+일자별 로그 CSV는 그대로 유지하되, 같은 기록을 인덱스가 걸린 SQLite 테이블에도 저장하여
+전체 로그를 메모리에 올리지 않고 패널/응답/오류 유형/수정 일시 기준으로 바로 조회할 수 있게 합니다.
+
+주요 기능:
+- 로그 행 일괄 저장 (행 해시 기준 중복 무시)
+- 필터 + LIMIT/OFFSET 기반 페이지 조회
+- 기존 일자별 로그 CSV 가져오기
+"""
+
+import os
+import glob
+import json
+import sqlite3
+from contextlib import closing
+from typing import Dict, List, Optional, Tuple
+import pandas as pd
+
+LOG_DB_NAME = 'change_log.sqlite'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS change_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    row_hash INTEGER NOT NULL UNIQUE,
+    error_type TEXT,
+    updated_date TEXT,
+    method TEXT,
+    panel_no TEXT,
+    unique_id TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_change_log_panel_no ON change_log (panel_no);
+CREATE INDEX IF NOT EXISTS idx_change_log_unique_id ON change_log (unique_id);
+CREATE INDEX IF NOT EXISTS idx_change_log_error_type ON change_log (error_type);
+CREATE INDEX IF NOT EXISTS idx_change_log_updated_date ON change_log (updated_date);
+"""
+
+
+def _to_text(value) -> Optional[str]:
+    """SQLite에 저장할 문자열 값으로 변환 (결측값은 None)"""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+class LogStore:
+    """
+    SQLite 기반 변경 로그 저장소
+
+    panel_no, unique_id, error_type, updated_date 컬럼에 인덱스를 두고
+    나머지 로그 컬럼은 JSON(data)으로 보관합니다.
+    """
+
+    def __init__(self, db_path: str, panel_no: str, unique_id: str):
+        """
+        Args:
+            db_path (str): SQLite 파일 경로
+            panel_no (str): 패널 번호 컬럼명
+            unique_id (str): 응답 ID 컬럼명
+        """
+        self.db_path = db_path
+        self.panel_no = panel_no
+        self.unique_id = unique_id
+        with closing(self._connect()) as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path)
+
+    def insert(self, log_df: pd.DataFrame, row_hashes) -> int:
+        """
+        로그 행들을 하나의 트랜잭션으로 저장
+
+        Args:
+            log_df (DataFrame): ERROR_TYPE, UPDATED_DATE, METHOD + 로그 컬럼
+            row_hashes (array-like): 행별 uint64 해시 (중복 판단 키)
+
+        Returns:
+            int: 새로 저장된 행 수
+        """
+        if log_df.empty:
+            return 0
+
+        records = []
+        for row_hash, row in zip(pd.Series(row_hashes).astype('uint64').astype('int64'), log_df.to_dict('records')):
+            data = {col: _to_text(value) for col, value in row.items()}
+            records.append((
+                int(row_hash),
+                data.get('ERROR_TYPE'),
+                data.get('UPDATED_DATE'),
+                data.get('METHOD'),
+                data.get(self.panel_no),
+                data.get(self.unique_id),
+                json.dumps(data, ensure_ascii=False),
+            ))
+
+        with closing(self._connect()) as conn, conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO change_log "
+                "(row_hash, error_type, updated_date, method, panel_no, unique_id, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                records,
+            )
+            return conn.total_changes - before
+
+    @staticmethod
+    def _where(filters: Dict[str, object]) -> Tuple[str, List]:
+        """필터 딕셔너리를 WHERE 절과 파라미터로 변환"""
+        clauses, params = [], []
+        for key in ('panel_no', 'unique_id'):
+            value = filters.get(key)
+            if value not in (None, ''):
+                clauses.append(f"{key} = ?")
+                params.append(str(value).strip())
+        for key in ('error_type', 'method'):
+            values = filters.get(key) or []
+            if values:
+                clauses.append(f"{key} IN ({', '.join('?' * len(values))})")
+                params.extend(values)
+        # UPDATED_DATE는 'YYYYMMDD_HHMMSS' 형식이므로 문자열 범위로 비교
+        if filters.get('date_from'):
+            clauses.append("updated_date >= ?")
+            params.append(filters['date_from'])
+        if filters.get('date_to'):
+            clauses.append("updated_date <= ?")
+            params.append(f"{filters['date_to']}_999999")
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def count(self, filters: Dict[str, object] = None) -> int:
+        """필터 조건에 맞는 로그 수를 반환"""
+        where, params = self._where(filters or {})
+        with closing(self._connect()) as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM change_log {where}", params).fetchone()[0]
+
+    def query(self, filters: Dict[str, object] = None, limit: int = 50, offset: int = 0) -> pd.DataFrame:
+        """
+        필터 조건에 맞는 로그를 최신순으로 페이지 단위 조회
+
+        Args:
+            filters (dict): panel_no, unique_id, error_type, method, date_from, date_to
+            limit (int): 페이지 크기
+            offset (int): 건너뛸 행 수
+
+        Returns:
+            DataFrame: 로그 원본 컬럼 형태의 데이터프레임
+        """
+        where, params = self._where(filters or {})
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"SELECT data FROM change_log {where} ORDER BY updated_date DESC, id DESC LIMIT ? OFFSET ?",
+                [*params, int(limit), int(offset)],
+            ).fetchall()
+        return pd.DataFrame([json.loads(data) for (data,) in rows])
+
+    def distinct(self, column: str) -> List[str]:
+        """필터 선택지로 사용할 고유값 목록을 반환 (error_type, method)"""
+        if column not in ('error_type', 'method'):
+            return []
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"SELECT DISTINCT {column} FROM change_log WHERE {column} IS NOT NULL ORDER BY {column}"
+            ).fetchall()
+        return [value for (value,) in rows]
+
+    def import_csv_logs(self, log_dir: str, encoding: str, hash_rows) -> int:
+        """
+        기존 일자별 로그 CSV(log_*.csv)를 저장소로 가져오기
+
+        Args:
+            log_dir (str): 로그 폴더 경로
+            encoding (str): 로그 CSV 인코딩
+            hash_rows (callable): 데이터프레임 -> 행 해시 Series 함수
+
+        Returns:
+            int: 새로 저장된 행 수
+        """
+        imported = 0
+        for log_csv in sorted(glob.glob(os.path.join(log_dir, 'log_*.csv'))):
+            log_df = pd.read_csv(log_csv, encoding=encoding, dtype=str, keep_default_na=False)
+            imported += self.insert(log_df, hash_rows(log_df).to_numpy())
+        return imported
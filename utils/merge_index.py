@@ -0,0 +1,209 @@
+"""
+병합(Merge) 시 파일 간 중복 응답을 찾기 위한 해시 인덱스 유틸리티
+
+지역별 파일이 서로 겹치는 경우 pd.concat 만으로는 같은 응답이 두 번 들어가므로,
+병합 전에 ANSWERID(또는 응답 전체 키)를 해시하여 인덱스를 만들고
+파일 간 충돌을 확인한 뒤 keep-first / keep-latest 방식으로 중복을 제거합니다.
+
+주요 기능:
+- 키 컬럼 해시 계산 (uint64)
+- 해시가 같은 행의 실제 키 값 비교 (해시 충돌로 다른 응답이 제거되지 않도록)
+- 파일 간 중복 키 리포트 생성
+- 변환(convert_data) 이전 단계에서의 중복 제거
+"""
+
+from typing import Dict, List, Tuple
+import pandas as pd
+import numpy as np
+
+
+KEEP_FIRST = 'first'
+KEEP_LATEST = 'latest'
+
+
+def build_key_hash(df: pd.DataFrame, key_columns: List[str]) -> pd.Series:
+    """
+    키 컬럼 값을 uint64 해시로 변환
+
+    파일 형식(xlsx/csv)에 따라 같은 값이 int/str 로 다르게 읽힐 수 있으므로
+    문자열로 정규화한 뒤 해시합니다.
+
+    Args:
+        df (DataFrame): 대상 데이터프레임
+        key_columns (list): 키로 사용할 컬럼명 리스트
+
+    Returns:
+        Series: 행별 해시 값 (uint64, df와 동일한 인덱스)
+    """
+    key_df = df[key_columns].astype(str)
+    return pd.util.hash_pandas_object(key_df, index=False)
+
+
+def build_merge_index(frames: List[Tuple[str, pd.DataFrame]], key_columns: List[str]) -> pd.DataFrame:
+    """
+    병합 대상 파일들의 해시 인덱스를 생성
+
+    Args:
+        frames (list): (파일명, 데이터프레임) 튜플 리스트 (병합 순서)
+        key_columns (list): 키로 사용할 컬럼명 리스트
+
+    Returns:
+        DataFrame: key_hash, file_order, file_name, row 컬럼을 가진 인덱스 테이블
+    """
+    parts = []
+    for order, (file_name, df) in enumerate(frames):
+        if any(col not in df.columns for col in key_columns):
+            continue
+        parts.append(pd.DataFrame({
+            'key_hash': build_key_hash(df, key_columns).to_numpy(),
+            'file_order': order,
+            'file_name': file_name,
+            'row': np.arange(len(df)),
+        }))
+
+    if not parts:
+        return pd.DataFrame(columns=['key_hash', 'file_order', 'file_name', 'row'])
+
+    return pd.concat(parts, ignore_index=True)
+
+
+def find_cross_file_duplicates(merge_index: pd.DataFrame) -> pd.DataFrame:
+    """
+    두 개 이상의 파일에 걸쳐 나타나는 키만 추려 반환
+
+    같은 파일 내부의 중복은 기존 중복 응답 검사에서 처리하므로 제외합니다.
+
+    Args:
+        merge_index (DataFrame): build_merge_index 결과
+
+    Returns:
+        DataFrame: 파일 간 중복 키에 해당하는 인덱스 행들
+    """
+    if merge_index.empty:
+        return merge_index
+
+    file_count = merge_index.groupby('key_hash')['file_order'].transform('nunique')
+    return merge_index[file_count > 1]
+
+
+def confirm_key_matches(duplicates: pd.DataFrame, frames: List[Tuple[str, pd.DataFrame]],
+                        key_columns: List[str]) -> pd.DataFrame:
+    """
+    해시가 같은 행들의 실제 키 값을 비교하여, 키 값까지 같은 파일 간 중복만 남깁니다.
+
+    서로 다른 키가 같은 해시로 충돌해도 별개의 응답으로 처리되도록,
+    key_hash를 (정규화한) 키 값 기준의 그룹 번호로 바꿉니다.
+
+    Args:
+        duplicates (DataFrame): find_cross_file_duplicates 결과
+        frames (list): build_merge_index에 사용한 (파일명, 데이터프레임) 튜플 리스트
+        key_columns (list): 키로 사용할 컬럼명 리스트
+
+    Returns:
+        DataFrame: 키 값이 같은 파일 간 중복 행들 (key_hash는 키 값별 그룹 번호)
+    """
+    if duplicates.empty:
+        return duplicates
+
+    # build_key_hash와 같이 문자열로 정규화한 키 값 (중복 후보 행만)
+    values = pd.DataFrame(index=duplicates.index, columns=key_columns, dtype=object)
+    for order, (_, df) in enumerate(frames):
+        mask = (duplicates['file_order'] == order).to_numpy()
+        if not mask.any():
+            continue
+        rows = duplicates.loc[mask, 'row'].to_numpy()
+        values.loc[mask, key_columns] = df[key_columns].iloc[rows].astype(str).to_numpy()
+
+    confirmed = duplicates.copy()
+    confirmed['key_hash'] = values.groupby(key_columns, sort=False).ngroup().to_numpy()
+    return find_cross_file_duplicates(confirmed)
+
+
+def summarize_collisions(duplicates: pd.DataFrame) -> pd.DataFrame:
+    """
+    파일 간 중복 키를 파일 쌍별로 요약
+
+    Args:
+        duplicates (DataFrame): find_cross_file_duplicates 결과
+
+    Returns:
+        DataFrame: 파일 A, 파일 B, 중복 응답 수 컬럼을 가진 리포트
+    """
+    columns = ['파일 A', '파일 B', '중복 응답 수']
+    if duplicates.empty:
+        return pd.DataFrame(columns=columns)
+
+    files = duplicates[['key_hash', 'file_order', 'file_name']].drop_duplicates(['key_hash', 'file_order'])
+    pairs = files.merge(files, on='key_hash', suffixes=('_a', '_b'))
+    pairs = pairs[pairs['file_order_a'] < pairs['file_order_b']]
+
+    report = (
+        pairs.groupby(['file_order_a', 'file_order_b', 'file_name_a', 'file_name_b'])
+        .size()
+        .reset_index(name='count')
+        .sort_values(['file_order_a', 'file_order_b'])
+    )
+    report = report[['file_name_a', 'file_name_b', 'count']]
+    report.columns = columns
+    return report.reset_index(drop=True)
+
+
+def deduplicate_frames(frames: List[Tuple[str, pd.DataFrame]], key_columns: List[str],
+                       keep: str = KEEP_FIRST, answer_date: str = None) -> Tuple[List[pd.DataFrame], pd.DataFrame]:
+    """
+    파일 간 중복 응답을 제거한 데이터프레임 리스트를 반환
+
+    Args:
+        frames (list): (파일명, 데이터프레임) 튜플 리스트 (병합 순서)
+        key_columns (list): 키로 사용할 컬럼명 리스트
+        keep (str): 'first' - 먼저 병합되는 파일의 응답 유지,
+                    'latest' - 응답 일시(answer_date)가 가장 늦은 응답 유지
+        answer_date (str, optional): keep='latest' 에서 사용할 응답 일시 컬럼명
+
+    Returns:
+        tuple: (중복이 제거된 데이터프레임 리스트, 제거된 행 리포트)
+    """
+    merge_index = build_merge_index(frames, key_columns)
+    duplicates = confirm_key_matches(find_cross_file_duplicates(merge_index), frames, key_columns)
+
+    if duplicates.empty:
+        return [df for _, df in frames], pd.DataFrame(columns=['file_name', 'row'])
+
+    duplicates = duplicates.copy()
+    if keep == KEEP_LATEST and answer_date:
+        answered_at = np.full(len(duplicates), np.datetime64('NaT'), dtype='datetime64[ns]')
+        for order, (_, df) in enumerate(frames):
+            mask = (duplicates['file_order'] == order).to_numpy()
+            if not mask.any() or answer_date not in df.columns:
+                continue
+            rows = duplicates.loc[mask, 'row'].to_numpy()
+            answered_at[mask] = pd.to_datetime(df[answer_date].iloc[rows], errors='coerce').to_numpy()
+        duplicates['answered_at'] = answered_at
+        # 응답 일시가 같거나 없으면 나중에 병합되는 파일을 최신으로 간주
+        ordered = duplicates.sort_values(['answered_at', 'file_order'], na_position='first', kind='stable')
+        keep_rows = ordered.drop_duplicates('key_hash', keep='last')
+    else:
+        ordered = duplicates.sort_values(['file_order', 'row'], kind='stable')
+        keep_file = ordered.drop_duplicates('key_hash', keep='first')[['key_hash', 'file_order']]
+        keep_rows = ordered.merge(keep_file, on=['key_hash', 'file_order'])
+
+    # 유지할 파일 외의 행들만 제거 (같은 파일 내부 중복은 그대로 둠)
+    keep_pairs = keep_rows[['key_hash', 'file_order']].drop_duplicates()
+    flagged = duplicates.merge(keep_pairs, on=['key_hash', 'file_order'], how='left', indicator=True)
+    removed = flagged[flagged['_merge'] == 'left_only']
+
+    drop_rows: Dict[int, np.ndarray] = {
+        order: group['row'].to_numpy() for order, group in removed.groupby('file_order')
+    }
+
+    result = []
+    for order, (_, df) in enumerate(frames):
+        rows = drop_rows.get(order)
+        if rows is None or len(rows) == 0:
+            result.append(df)
+        else:
+            keep_mask = np.ones(len(df), dtype=bool)
+            keep_mask[rows] = False
+            result.append(df[keep_mask])
+
+    return result, removed[['file_name', 'row']].reset_index(drop=True)
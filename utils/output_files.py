@@ -0,0 +1,102 @@
+"""
+메모리 출력(다운로드) 모드
+
+기본 모드(disk)는 변환/분할/병합/Export 결과를 서버 디스크의 base_directory 하위 폴더에 저장하므로,
+앱을 사용자 PC에서 실행할 때만 결과 파일을 받을 수 있습니다.
+다운로드 모드(download)에서는 결과 파일을 메모리 버퍼에 만들고 st.download_button으로 제공하여,
+앱을 여러 사용자가 함께 쓰는 헤드리스 서버로 실행할 수 있습니다.
+
+주요 기능:
+- 출력 모드 확인 (setting.toml [output] mode)
+- 여러 파일 결과(분할 등)를 파일마다 바로 압축하는 zip 버퍼
+- 세션별 다운로드 파일 목록과 다운로드 버튼 표시
+"""
+
+import io
+import zipfile
+from typing import Dict, Tuple
+import streamlit as st
+from features.setting import get_output_mode
+
+OUTPUT_DISK = 'disk'
+OUTPUT_DOWNLOAD = 'download'
+
+MIME_TYPES = {
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'csv': 'text/csv',
+    'parquet': 'application/octet-stream',
+    'zip': 'application/zip',
+}
+
+
+def is_download_mode() -> bool:
+    """결과 파일을 디스크 대신 다운로드로 제공하는지 여부를 반환합니다."""
+    return get_output_mode() == OUTPUT_DOWNLOAD
+
+
+def get_mime_type(file_name: str) -> str:
+    """파일 확장자에 맞는 MIME 타입을 반환합니다."""
+    return MIME_TYPES.get(file_name.rsplit('.', 1)[-1].lower(), 'application/octet-stream')
+
+
+class ZipOutput:
+    """
+    여러 결과 파일을 하나의 zip 버퍼로 묶습니다.
+
+    파일을 하나 만들 때마다 바로 압축하여 추가하므로, 개별 파일 버퍼를 모두 모아둘 필요가 없습니다.
+    """
+
+    def __init__(self):
+        self.buffer = io.BytesIO()
+        self._zip = zipfile.ZipFile(self.buffer, 'w', compression=zipfile.ZIP_DEFLATED)
+        self.file_count = 0
+
+    def add(self, file_name: str, data: bytes) -> None:
+        """파일 하나를 zip에 추가합니다."""
+        self._zip.writestr(file_name, data)
+        self.file_count += 1
+
+    def close(self) -> bytes:
+        """zip을 닫고 전체 내용을 반환합니다."""
+        self._zip.close()
+        return self.buffer.getvalue()
+
+
+def get_downloads() -> Dict[str, Tuple[str, bytes]]:
+    """세션의 다운로드 파일 목록을 반환합니다. ({구분: (파일명, 내용)})"""
+    if 'download_files' not in st.session_state:
+        st.session_state['download_files'] = {}
+    return st.session_state['download_files']
+
+
+def add_download(label: str, file_name: str, data: bytes) -> None:
+    """
+    다운로드 파일을 등록합니다. 같은 구분의 이전 파일은 교체하여 메모리를 제한합니다.
+
+    Args:
+        label (str): 구분 (예: 'Converted Data', 'Split Data')
+        file_name (str): 다운로드 파일명
+        data (bytes): 파일 내용
+    """
+    get_downloads()[label] = (file_name, data)
+
+
+def show_downloads():
+    """등록된 다운로드 파일들의 다운로드 버튼을 표시합니다."""
+    downloads = get_downloads()
+    if not downloads:
+        return
+
+    st.markdown("**📥 Downloads**")
+    for label, (file_name, data) in list(downloads.items()):
+        st.download_button(
+            f"{label} : {file_name} ({len(data) / 1024 / 1024:,.1f}MB)",
+            data=data,
+            file_name=file_name,
+            mime=get_mime_type(file_name),
+            key=f'download_{label}',
+            width='stretch'
+        )
+    if st.button("다운로드 목록 비우기", key='clear_downloads', width='stretch'):
+        downloads.clear()
+        st.rerun()
@@ -1,10 +1,17 @@
 import pandas as pd
 import streamlit as st
 import os
+from contextlib import contextmanager
 from datetime import datetime
 from features.setting import get_column_name
+from utils.log_store import LogStore, LOG_DB_NAME
 
-def save_log_data() :
+LOG_ENCODING = 'cp949'
+LOG_META_COLUMNS = ['ERROR_TYPE', 'UPDATED_DATE', 'METHOD']
+
+
+def get_log_dir() -> str:
+    """로그 저장 경로를 결정하고 폴더를 생성합니다."""
     log_path = st.session_state.get("log_save_path")
     raw_data_path = st.session_state.get("raw_data_path")
 
@@ -22,10 +29,123 @@ def save_log_data() :
     if not os.path.exists(save_path):
         os.makedirs(save_path, exist_ok=True)
 
-    curr_datetime = datetime.now().strftime('%Y%m%d')
-    file_name = f'log_{curr_datetime}.csv'
-    log_csv = os.path.join(save_path, file_name)
-    st.session_state['log_data'].to_csv(log_csv, index=False, encoding='cp949')
+    return save_path
+
+
+_log_stores = {}
+
+
+def get_log_store() -> LogStore:
+    """로그 폴더의 SQLite 로그 저장소를 반환합니다."""
+    db_path = os.path.join(get_log_dir(), LOG_DB_NAME)
+    if db_path not in _log_stores:
+        _log_stores[db_path] = LogStore(db_path, get_column_name('panel_no'), get_column_name('unique_id'))
+    return _log_stores[db_path]
+
+
+class LogWriter:
+    """
+    일자별 로그 CSV에 추가(append) 방식으로 기록하는 클래스
+
+    기록은 버퍼에 모았다가 flush 시 한 번에 파일 끝에 추가합니다.
+    중복 제거는 파일 전체가 아니라 이미 기록된 행의 해시 인덱스에 대해서만 수행합니다.
+    """
+
+    def __init__(self):
+        self._buffer = []
+        self._batch_depth = 0
+        self._key_index = {}   # 로그 파일 경로 -> 기록된 행 해시 set
+        self._headers = {}     # 로그 파일 경로 -> 컬럼 리스트
+
+    def append(self, log_df: pd.DataFrame) -> None:
+        """로그 행을 버퍼에 추가합니다. 배치 중이 아니면 바로 기록합니다."""
+        self._buffer.append(log_df)
+        if self._batch_depth == 0:
+            self.flush()
+
+    @contextmanager
+    def batch(self):
+        """블록 안의 모든 기록을 모아 블록 종료 시 한 번만 파일에 추가합니다."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+
+    def _load_file_state(self, log_csv: str) -> None:
+        """기존 로그 파일의 헤더와 행 해시를 한 번만 읽어 인덱스를 만듭니다."""
+        if log_csv in self._key_index:
+            return
+
+        if os.path.exists(log_csv):
+            existing = pd.read_csv(log_csv, encoding=LOG_ENCODING, dtype=str, keep_default_na=False)
+            self._headers[log_csv] = existing.columns.tolist()
+            self._key_index[log_csv] = set(self.hash_rows(existing))
+        else:
+            self._headers[log_csv] = []
+            self._key_index[log_csv] = set()
+
+    @staticmethod
+    def hash_rows(df: pd.DataFrame) -> pd.Series:
+        """컬럼 순서와 무관하게 행 내용을 해시합니다."""
+        normalized = df[sorted(df.columns)].astype(object).fillna('').astype(str)
+        return pd.util.hash_pandas_object(normalized, index=False)
+
+    def flush(self) -> int:
+        """버퍼의 로그를 일자별 CSV 파일 끝에 추가하고 기록된 행 수를 반환합니다."""
+        if not self._buffer:
+            return 0
+
+        log_df = pd.concat(self._buffer, ignore_index=True)
+        self._buffer = []
+
+        curr_datetime = datetime.now().strftime('%Y%m%d')
+        log_csv = os.path.join(get_log_dir(), f'log_{curr_datetime}.csv')
+        self._load_file_state(log_csv)
+
+        # 이미 기록된 행 및 이번 배치 내 중복 행 제외
+        keys = self.hash_rows(log_df).to_numpy()
+        known = self._key_index[log_csv]
+        new_mask = ~pd.Series(keys).duplicated().to_numpy()
+        new_mask &= [key not in known for key in keys]
+        log_df = log_df[new_mask]
+        if log_df.empty:
+            return 0
+
+        header = self._headers[log_csv]
+        new_columns = [col for col in log_df.columns if col not in header]
+
+        if not header:
+            log_df.to_csv(log_csv, index=False, encoding=LOG_ENCODING)
+            self._headers[log_csv] = log_df.columns.tolist()
+        elif new_columns:
+            # 새로운 컬럼이 생긴 경우에만 헤더를 확장하여 다시 저장
+            existing = pd.read_csv(log_csv, encoding=LOG_ENCODING, dtype=str, keep_default_na=False)
+            merged = pd.concat([existing, log_df], ignore_index=True)
+            merged.to_csv(log_csv, index=False, encoding=LOG_ENCODING)
+            self._headers[log_csv] = merged.columns.tolist()
+        else:
+            log_df.reindex(columns=header).to_csv(log_csv, mode='a', header=False, index=False, encoding=LOG_ENCODING)
+
+        known.update(keys[new_mask].tolist())
+
+        # 조회용 SQLite 저장소에도 같은 행을 저장
+        get_log_store().insert(log_df, keys[new_mask])
+        return len(log_df)
+
+
+def get_log_writer() -> LogWriter:
+    """세션별 LogWriter 인스턴스를 반환합니다."""
+    if 'log_writer' not in st.session_state:
+        st.session_state['log_writer'] = LogWriter()
+    return st.session_state['log_writer']
+
+
+def log_batch():
+    """여러 record_log 호출을 한 번의 파일 추가로 묶는 컨텍스트 매니저를 반환합니다."""
+    return get_log_writer().batch()
 
 
 def record_log(data: pd.DataFrame, date: str, type: str, error_type: str) :
@@ -34,9 +154,7 @@ def record_log(data: pd.DataFrame, date: str, type: str, error_type: str) :
     delete_df['ERROR_TYPE'] = error_type
     delete_df['UPDATED_DATE'] = date
     delete_df['METHOD'] = type
-    delete_df = delete_df[['ERROR_TYPE', 'UPDATED_DATE', 'METHOD', *raw_columns]]
+    delete_df = delete_df[[*LOG_META_COLUMNS, *raw_columns]]
     delete_df.reset_index(drop=True, inplace=True)
-    st.session_state['log_data'] = pd.concat([st.session_state['log_data'], delete_df], ignore_index=True)
-    st.session_state['log_data'].drop_duplicates(inplace=True)
 
-    save_log_data()
\ No newline at end of file
+    get_log_writer().append(delete_df)
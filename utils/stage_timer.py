@@ -0,0 +1,212 @@
+"""
+변환 단계별 소요 시간 / 메모리 측정
+
+convert_data의 단계(PROCESS_STEPS)와 "Review panel data" 단계 안의 검사 규칙별로
+경과 시간(wall), CPU 시간, 최대 메모리 증가량(tracemalloc), 처리 행 수를 기록합니다.
+기록은 변환 결과 파일 옆의 JSONL 로그에 이어 쓰고, 세션에도 최근 실행분을 보관하여 화면에 표시합니다.
+
+- CPU 시간은 측정하는 스레드 기준입니다. (백그라운드 작업 스레드에서도 다른 세션의 실행 시간이 섞이지 않음)
+- tracemalloc은 프로세스 전체에 하나이므로, 여러 변환이 동시에 실행되면 메모리 값은 서로 섞인 근사값입니다.
+- tracemalloc 추적 중에는 변환이 몇 배 느려지므로, 메모리 측정은 [performance] trace_memory = true일 때만 합니다.
+"""
+
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+import pandas as pd
+import streamlit as st
+
+TIMING_LOG_NAME = 'stage_timing.jsonl'
+
+# 세션에 보관하는 최근 실행 수
+RECENT_RUNS = 20
+
+
+class _Stage:
+    """측정 중인 단계"""
+
+    def __init__(self, name: str, parent: Optional[str], rows: Optional[int], start_mem: int):
+        self.name = name
+        self.parent = parent
+        self.rows = rows
+        self.start_wall = time.perf_counter()
+        self.start_cpu = time.thread_time()
+        self.start_mem = start_mem
+        self.peak_mem = start_mem
+
+
+class StageTimer:
+    """
+    단계별 측정기
+
+    상위 단계는 begin()으로 순서대로 시작하고(이전 단계는 자동 종료),
+    상위 단계 안의 세부 단계(검사 규칙 등)는 stage() 컨텍스트로 측정합니다.
+    """
+
+    def __init__(self, run_name: str = '', trace_memory: bool = False):
+        """
+        Args:
+            run_name (str): 실행 이름 (저장 파일명 등)
+            trace_memory (bool): tracemalloc으로 단계별 최대 메모리를 측정할지 여부
+        """
+        self.run_name = run_name
+        self.started_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.records: List[Dict] = []
+        self._stack: List[_Stage] = []
+        self._trace_memory = trace_memory
+        self._owns_tracing = False
+        self._start_wall = time.perf_counter()
+        self._start_cpu = time.thread_time()
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+
+    def _traced(self) -> Optional[tuple]:
+        if self._trace_memory and tracemalloc.is_tracing():
+            return tracemalloc.get_traced_memory()
+        return None
+
+    def _open(self, name: str, rows: Optional[int]) -> None:
+        traced = self._traced()
+        current = 0
+        if traced is not None:
+            current, peak = traced
+            # 세부 단계가 최대값을 다시 측정하므로, 지금까지의 최대값은 열린 상위 단계에 반영
+            for stage in self._stack:
+                stage.peak_mem = max(stage.peak_mem, peak)
+            tracemalloc.reset_peak()
+        parent = self._stack[-1].name if self._stack else None
+        self._stack.append(_Stage(name, parent, rows, current))
+
+    def _close(self) -> None:
+        stage = self._stack.pop()
+        record = {
+            'stage': stage.name,
+            'parent': stage.parent,
+            'rows': stage.rows,
+            'wall_s': round(time.perf_counter() - stage.start_wall, 4),
+            'cpu_s': round(time.thread_time() - stage.start_cpu, 4),
+            'peak_mb': None,
+        }
+        traced = self._traced()
+        if traced is not None:
+            stage.peak_mem = max(stage.peak_mem, traced[1])
+            for parent in self._stack:
+                parent.peak_mem = max(parent.peak_mem, stage.peak_mem)
+            tracemalloc.reset_peak()
+            record['peak_mb'] = round((stage.peak_mem - stage.start_mem) / 2 ** 20, 2)
+        self.records.append(record)
+
+    def begin(self, name: str, rows: Optional[int] = None) -> None:
+        """
+        상위 단계를 시작합니다. (진행 중인 단계는 종료)
+
+        Args:
+            name (str): 단계 이름
+            rows (int, optional): 단계 시작 시 데이터 행 수
+        """
+        while self._stack:
+            self._close()
+        self._open(name, rows)
+
+    @contextmanager
+    def stage(self, name: str, rows: Optional[int] = None):
+        """현재 단계 안의 세부 단계를 측정합니다. (with 문 사용)"""
+        self._open(name, rows)
+        try:
+            yield
+        finally:
+            self._close()
+
+    def finish(self) -> List[Dict]:
+        """
+        진행 중인 단계를 모두 종료하고 전체(Total) 기록을 추가합니다.
+
+        Returns:
+            list: 단계별 기록 (종료 순서 - 세부 단계가 상위 단계보다 먼저)
+        """
+        while self._stack:
+            self._close()
+        top_rows = [record['rows'] for record in self.records if record['parent'] is None]
+        peaks = [record['peak_mb'] for record in self.records if record['parent'] is None and record['peak_mb'] is not None]
+        self.records.append({
+            'stage': 'Total',
+            'parent': None,
+            'rows': top_rows[0] if top_rows else None,
+            'wall_s': round(time.perf_counter() - self._start_wall, 4),
+            'cpu_s': round(time.thread_time() - self._start_cpu, 4),
+            'peak_mb': max(peaks) if peaks else None,
+        })
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+        return self.records
+
+    def to_run(self) -> Dict:
+        """세션 보관/로그 저장용 실행 정보를 반환합니다."""
+        return {'run': self.run_name, 'started_at': self.started_at, 'records': list(self.records)}
+
+
+def write_timing_log(log_dir: str, run: Dict) -> str:
+    """
+    실행 기록을 JSONL 로그에 이어 씁니다. (단계마다 한 줄)
+
+    Args:
+        log_dir (str): 로그를 저장할 폴더 (변환 결과 파일 폴더)
+        run (dict): StageTimer.to_run() 결과
+
+    Returns:
+        str: 로그 파일 경로
+    """
+    log_path = os.path.join(log_dir, TIMING_LOG_NAME)
+    with open(log_path, 'a', encoding='utf-8') as f:
+        for record in run['records']:
+            line = {'run': run['run'], 'started_at': run['started_at'], **record}
+            f.write(json.dumps(line, ensure_ascii=False) + '\n')
+    return log_path
+
+
+def add_recent_timing(run: Dict) -> None:
+    """세션의 최근 실행 기록에 추가합니다. (최신순, RECENT_RUNS개까지)"""
+    runs = st.session_state.get('stage_timings', [])
+    st.session_state['stage_timings'] = [run] + runs[:RECENT_RUNS - 1]
+
+
+def get_recent_timings() -> List[Dict]:
+    """세션의 최근 실행 기록을 반환합니다. (최신순)"""
+    return st.session_state.get('stage_timings', [])
+
+
+def timing_frame(run: Dict) -> pd.DataFrame:
+    """
+    실행 기록을 표시용 데이터프레임으로 변환합니다.
+
+    상위 단계 다음에 그 단계의 세부 단계가 오도록 정렬합니다.
+    """
+    records = run['records']
+    rows = []
+    for record in records:
+        if record['parent'] is not None:
+            continue
+        rows.append(record)
+        rows.extend({**child, 'stage': f"└ {child['stage']}"}
+                    for child in records if child['parent'] == record['stage'])
+    frame = pd.DataFrame(rows, columns=['stage', 'rows', 'wall_s', 'cpu_s', 'peak_mb'])
+    return frame.rename(columns={
+        'stage': 'Stage', 'rows': 'Rows', 'wall_s': 'Wall (s)', 'cpu_s': 'CPU (s)', 'peak_mb': 'Peak Memory (MB)'
+    })
+
+
+def show_stage_timing(run: Dict, expanded: bool = False) -> None:
+    """실행 기록을 펼침 영역의 표로 표시합니다."""
+    total = next((record for record in run['records'] if record['stage'] == 'Total'), None)
+    label = f"⏱️ Stage Timing : {run['run']}"
+    if total is not None:
+        label += f" ({total['wall_s']:.2f}s)"
+    with st.expander(label, expanded=expanded):
+        st.caption(f"{run['started_at']}")
+        st.dataframe(timing_frame(run), hide_index=True, width='stretch')
@@ -0,0 +1,133 @@
+"""
+대용량 CSV 스트리밍 변환
+
+수백만 행 이상의 데이터는 세션 메모리에 올린 뒤 convert_data가 만드는 복사본까지 더하면 메모리가 부족합니다.
+모든 검사 규칙은 패널 단위이므로, 이 모듈은 패널 번호로 정렬된 CSV를 chunk 단위로 읽어
+패널이 나뉘지 않도록 패널 경계에서 자른 뒤 chunk마다 변환/검사하고, 결과 행을 CSV 파일에 바로 이어 씁니다.
+최대 메모리 사용량은 파일 전체가 아니라 chunk 크기(또는 가장 큰 패널)에 비례합니다.
+
+스트리밍 변환 결과는 세션 작업 데이터로 로드하지 않으며, 엑셀 스타일도 적용하지 않습니다.
+"""
+
+import os
+from typing import Iterable, Iterator
+import numpy as np
+import pandas as pd
+import streamlit as st
+from features.setting import get_stream_chunk_rows, get_export_csv_encoding
+from utils.csv_reader import iter_csv_typed, count_csv_rows
+from utils.data_convert import process_data, resolve_convert_path
+from utils.job_runner import get_job_registry
+from utils.column_manager import get_column, get_all_boolean_columns
+
+
+def iter_panel_batches(chunks: Iterable[pd.DataFrame], panel_no: str) -> Iterator[pd.DataFrame]:
+    """
+    chunk를 패널 경계에서 잘라, 패널이 나뉘지 않은 배치로 다시 묶습니다.
+
+    chunk 끝의 마지막 패널 행은 다음 chunk 앞에 붙여 함께 처리합니다.
+
+    Args:
+        chunks (iterable): 패널 번호로 정렬(그룹화)된 데이터의 chunk들
+        panel_no (str): 패널 번호 컬럼명
+
+    Yields:
+        DataFrame: 패널 단위로 완결된 배치
+
+    Raises:
+        ValueError: 같은 패널의 행이 떨어져 있는 경우 (패널 번호로 정렬되지 않은 입력)
+    """
+    finished = set()
+    carry = None
+
+    def check_grouped(batch):
+        values = batch[panel_no].to_numpy()
+        run_starts = np.flatnonzero(np.r_[True, values[1:] != values[:-1]])
+        panels = values[run_starts]
+        if len(set(panels.tolist())) != len(panels) or not finished.isdisjoint(panels.tolist()):
+            raise ValueError("입력 데이터가 패널 번호로 정렬되어 있지 않습니다. 패널별로 정렬된 CSV만 스트리밍 변환할 수 있습니다.")
+        finished.update(panels.tolist())
+
+    for chunk in chunks:
+        if carry is not None:
+            chunk = pd.concat([carry, chunk], ignore_index=True)
+        values = chunk[panel_no].to_numpy()
+        changes = np.flatnonzero(values[1:] != values[:-1])
+        # 마지막 패널의 시작 위치 (chunk 전체가 한 패널이면 0 - 다음 chunk와 계속 이어 붙임)
+        cut = changes[-1] + 1 if len(changes) else 0
+        carry = chunk.iloc[cut:]
+        if cut:
+            batch = chunk.iloc[:cut]
+            check_grouped(batch)
+            yield batch
+
+    if carry is not None and len(carry):
+        check_grouped(carry)
+        yield carry
+
+
+def stream_convert(job, file_path: str, out_path: str, chunk_rows: int, encoding: str) -> dict:
+    """
+    CSV를 패널 단위 배치로 변환/검사하여 결과 CSV에 이어 씁니다. (백그라운드 작업 함수)
+
+    Args:
+        job (Job): 진행 상태 / 취소 확인용 작업
+        file_path (str): 패널 번호로 정렬된 원시 데이터 CSV
+        out_path (str): 결과 CSV 경로
+        chunk_rows (int): 한 번에 읽는 행 수
+        encoding (str): 결과 CSV 인코딩
+
+    Returns:
+        dict: path(결과 경로), rows(행 수), panels(패널 수), error_rows(오류 행 수)
+    """
+    # data_loader가 이 모듈을 사용하므로 순환 import를 피하기 위해 함수 안에서 import
+    from utils.data_loader import sort_data
+
+    panel_no = get_column('panel_no')
+    index_col = get_column('index_col')
+    boolean_columns = get_all_boolean_columns()
+    total = count_csv_rows(file_path)
+
+    rows = panels = error_rows = 0
+    with open(out_path, 'w', encoding=encoding, newline='') as f:
+        for batch in iter_panel_batches(iter_csv_typed(file_path, chunk_rows), panel_no):
+            job.update(min(int(rows / total * 100), 99) if total else 0,
+                       f"{rows:,}/{total:,} rows ({panels:,} panels)")
+
+            # 배치 안에서 정렬하고 IndexNum은 파일 전체 기준으로 이어서 부여
+            batch = sort_data(batch)
+            batch[index_col] += rows
+            checked = process_data(batch)
+
+            existing = [col for col in boolean_columns if col in checked.columns]
+            if existing:
+                error_rows += int((checked[existing] == True).any(axis=1).sum())
+            checked.to_csv(f, index=False, header=(rows == 0))
+
+            rows += len(checked)
+            panels += checked[panel_no].nunique()
+
+    job.update(100, f"{rows:,} rows ({panels:,} panels)")
+    return {'path': out_path, 'rows': rows, 'panels': panels, 'error_rows': error_rows}
+
+
+def submit_stream_convert(file_path: str) -> None:
+    """원시 데이터 CSV의 스트리밍 변환을 백그라운드 작업으로 시작합니다."""
+    registry = get_job_registry()
+    if registry.is_running('Streaming Conversion'):
+        st.warning("⚠️ 이미 스트리밍 변환이 진행 중입니다.")
+        return
+
+    new_path, _, _ = resolve_convert_path('stream_converted_data')
+    out_path = os.path.splitext(new_path)[0] + '.csv'
+
+    def on_complete(result):
+        return (f"✅ {os.path.basename(result['path'])} : {result['rows']:,} rows / "
+                f"{result['panels']:,} panels / 오류 행 {result['error_rows']:,}")
+
+    registry.submit(
+        'Streaming Conversion', stream_convert,
+        file_path, out_path, get_stream_chunk_rows(), get_export_csv_encoding(),
+        on_complete=on_complete
+    )
+    st.info("⏳ 백그라운드에서 스트리밍 변환을 시작했습니다. 결과는 convert 폴더에 CSV로 저장됩니다.")
@@ -0,0 +1,231 @@
+"""
+합성 다이어리 데이터 생성
+
+벤치마크와 검증기 비교에 사용할 원시 데이터를 setting.toml의 컬럼 구성([column_names], [problem_columns])으로 만듭니다.
+같은 seed이면 항상 같은 데이터가 생성되며, 수백만 행도 반복문 없이 배열 연산으로 생성합니다.
+
+- 패널마다 날짜별로 1~n건의 응답을 시간 순서대로 생성 (응답 간 시간은 겹치지 않음)
+- 검사 유형별 오류 비율만큼 오류를 주입 (한 행에는 최대 한 가지 오류)
+- 제품당 사용 수 오류는 패널 단위 비율 (해당 패널의 응답을 한 제품으로 max_answers보다 많이 생성)
+
+사용 예:
+    python -m utils.synthetic_data --rows 100000 --out raw.csv
+"""
+
+import argparse
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from features.setting import (
+    get_column_name, get_problem_columns, get_product_list, get_max_answers, get_duration_max
+)
+
+# 행 단위 오류 유형과 기본 비율 (행 수 대비)
+#   order           : 순번 건너뜀 (제품 순서 오류)
+#   duplicate_order : 같은 날짜의 직전 순번 반복 (착용 순서 중복 오류)
+#   day_order       : 입력 날짜를 하루 앞으로 기록 (날짜 순서 오류)
+#   duplicate_time  : 직전 응답과 날짜/순번/제품/시간이 같은 응답 (중복 응답)
+#   previous_time   : 직전 응답 종료 전에 시작 (직전 응답 시간 확인)
+#   duration        : 착용 시간이 duration_max 초과 (자정을 넘길 수 있음)
+ROW_ERROR_TYPES = ['order', 'duplicate_order', 'day_order', 'duplicate_time', 'previous_time', 'duration']
+
+# 패널 단위 오류 유형 (패널 수 대비)
+#   answer_count    : 한 제품 응답 수가 max_answers 초과 (제품당 사용 수 오류)
+PANEL_ERROR_TYPES = ['answer_count']
+
+DEFAULT_ERROR_RATES = {
+    'order': 0.01,
+    'duplicate_order': 0.01,
+    'day_order': 0.01,
+    'duplicate_time': 0.005,
+    'previous_time': 0.01,
+    'duration': 0.005,
+    'answer_count': 0.02,
+}
+
+AREAS = ['서울', '경기', '인천', '부산', '대구', '광주', '대전']
+AGE_GROUPS = ['20대 초반', '20대 후반', '30대 초반', '30대 후반', '40대 초반', '40대 후반']
+
+# 하루 첫 응답 시작 시각 (분)
+DAY_START_MINUTE = 6 * 60
+
+
+def _group_cumsum(values: np.ndarray, group_sizes: np.ndarray) -> np.ndarray:
+    """연속된 그룹(크기 group_sizes)마다 누적합을 계산합니다."""
+    total = np.cumsum(values)
+    group_starts = np.cumsum(group_sizes) - group_sizes
+    base = np.r_[0, total][group_starts]
+    return total - np.repeat(base, group_sizes)
+
+
+def _join_numbers(left: np.ndarray, right: np.ndarray) -> pd.Series:
+    """두 정수 배열을 'a|b' 형식 문자열로 결합합니다. (Q1 날짜 / Q4, Q5 시간 형식)"""
+    return pd.Series(left).astype(str) + '|' + pd.Series(right).astype(str)
+
+
+def generate_diary_data(panels: int = 100, days: int = 14, products: Optional[List[str]] = None,
+                        answers_per_day: Tuple[int, int] = (1, 3), error_rates: Optional[Dict[str, float]] = None,
+                        seed: int = 0, start_date: str = '2024-03-01', label_col: Optional[str] = None) -> pd.DataFrame:
+    """
+    합성 다이어리 원시 데이터를 생성합니다.
+
+    Args:
+        panels (int): 패널 수
+        days (int): 패널별 응답 일수
+        products (list, optional): 제품 리스트 (생략 시 설정의 product_list)
+        answers_per_day (tuple): 날짜별 응답 수 범위 (최소, 최대)
+        error_rates (dict, optional): 오류 유형별 비율 (DEFAULT_ERROR_RATES 중 바꿀 값만 지정, 0이면 주입 안 함)
+        seed (int): 난수 seed
+        start_date (str): 첫 응답 날짜
+        label_col (str, optional): 주입한 오류 유형을 기록할 컬럼명 (생략 시 추가 안 함)
+
+    Returns:
+        DataFrame: 원시 데이터 (패널 / 응답 시간 순)
+
+    Raises:
+        ValueError: 알 수 없는 오류 유형이거나 행 단위 오류 비율의 합이 1을 넘는 경우
+    """
+    rates = {**DEFAULT_ERROR_RATES, **(error_rates or {})}
+    unknown = set(rates) - set(DEFAULT_ERROR_RATES)
+    if unknown:
+        raise ValueError(f"알 수 없는 오류 유형입니다: {', '.join(sorted(unknown))}")
+    if sum(rates[key] for key in ROW_ERROR_TYPES) > 1:
+        raise ValueError("행 단위 오류 비율의 합은 1 이하여야 합니다.")
+
+    rng = np.random.default_rng(seed)
+    products = list(products or get_product_list())
+    max_answers = get_max_answers()
+    duration_max = get_duration_max()
+
+    # 패널 x 날짜별 응답 수 (제품당 사용 수 오류 패널은 max_answers를 넘도록 늘림)
+    low, high = answers_per_day
+    day_counts = rng.integers(low, high + 1, size=(panels, days))
+    count_panels = rng.random(panels) < rates['answer_count']
+    day_counts[count_panels] = np.maximum(day_counts[count_panels], -(-(max_answers + 1) // days))
+    group_sizes = day_counts.ravel()
+    n = int(group_sizes.sum())
+
+    panel_idx = np.repeat(np.repeat(np.arange(panels), days), group_sizes)
+    day_idx = np.repeat(np.tile(np.arange(days), panels), group_sizes)
+    group_size = np.repeat(group_sizes, group_sizes)
+    order = _group_cumsum(np.ones(n, dtype=np.int64), group_sizes)
+
+    # 하루 응답이 많은 패널도 자정 전에 끝나도록 간격/착용 시간을 줄임
+    scale = np.minimum(1.0, 4 / group_size)
+    duration = (rng.integers(10, 150, n) * scale).astype(np.int64) + 1
+    gap = (rng.integers(5, 60, n) * scale).astype(np.int64) + 1
+    end = DAY_START_MINUTE + _group_cumsum(gap + duration, group_sizes)
+    start = end - duration
+
+    product_idx = rng.integers(0, len(products), n)
+    product_idx[count_panels[panel_idx]] = 0
+    input_day = day_idx.copy()
+
+    # 행 단위 오류 주입 (직전 응답이 필요한 오류는 같은 날짜의 두 번째 응답부터)
+    labels = np.full(n, '', dtype=object)
+    draw = rng.random(n)
+    has_prev = order > 1
+    lower = 0.0
+    for error_type in ROW_ERROR_TYPES:
+        upper = lower + rates[error_type]
+        mask = (draw >= lower) & (draw < upper)
+        lower = upper
+        if error_type in ('order', 'duplicate_order', 'duplicate_time', 'previous_time'):
+            mask &= has_prev
+        elif error_type == 'day_order':
+            mask &= day_idx > 0
+        rows = np.flatnonzero(mask)
+        if len(rows) == 0:
+            continue
+        labels[rows] = error_type
+
+        if error_type == 'order':
+            order[rows] += group_size[rows]
+        elif error_type == 'duplicate_order':
+            order[rows] -= 1
+        elif error_type == 'day_order':
+            input_day[rows] -= 1
+        elif error_type == 'duplicate_time':
+            prev = rows - 1
+            order[rows] = order[prev]
+            product_idx[rows] = product_idx[prev]
+            start[rows] = start[prev]
+            end[rows] = end[prev]
+        elif error_type == 'previous_time':
+            start[rows] = end[rows - 1] - rng.integers(1, 31, len(rows))
+            end[rows] = start[rows] + duration[rows]
+        elif error_type == 'duration':
+            end[rows] = start[rows] + duration_max + rng.integers(1, 121, len(rows))
+
+    start_date = pd.Timestamp(start_date)
+    answer_dates = start_date + pd.to_timedelta(day_idx, unit='D')
+    input_dates = start_date + pd.to_timedelta(input_day, unit='D')
+    finished_at = answer_dates + pd.to_timedelta(end + rng.integers(1, 31, n), unit='min')
+
+    panel_areas = rng.choice(AREAS, panels)
+    panel_ages = rng.choice(AGE_GROUPS, panels)
+    panel_no = 100001 + panel_idx
+
+    data = {
+        get_column_name('unique_id'): np.arange(1, n + 1),
+        get_column_name('panel_code'): pd.Series(panel_no).map('P{:06d}'.format),
+        get_column_name('panel_no'): panel_no,
+        get_column_name('input_col'): _join_numbers(input_dates.month, input_dates.day),
+        get_column_name('order_col'): order,
+        get_column_name('product_col'): np.asarray(products, dtype=object)[product_idx],
+        get_column_name('start_col'): _join_numbers(start // 60 % 24, start % 60),
+        get_column_name('end_col'): _join_numbers(end // 60 % 24, end % 60),
+        get_column_name('answer_date'): pd.Series(finished_at).dt.strftime('%Y-%m-%d %H:%M:%S'),
+        get_column_name('area'): panel_areas[panel_idx],
+        get_column_name('age_5'): panel_ages[panel_idx],
+    }
+    problem_columns = get_problem_columns()
+    problems = (rng.random((n, len(problem_columns))) < 0.2).astype(np.int64)
+    data.update({col: problems[:, i] for i, col in enumerate(problem_columns)})
+    if label_col:
+        data[label_col] = labels
+
+    return pd.DataFrame({col: values for col, values in data.items() if col})
+
+
+def generate_rows(rows: int, seed: int = 0, days: int = 14, **kwargs) -> pd.DataFrame:
+    """
+    대략 지정한 행 수가 되도록 패널 수를 정해 합성 데이터를 생성합니다. (패널은 나누지 않음)
+
+    Args:
+        rows (int): 목표 행 수
+        seed (int): 난수 seed
+        days (int): 패널별 응답 일수
+        **kwargs: generate_diary_data 인자
+
+    Returns:
+        DataFrame: 합성 원시 데이터
+    """
+    low, high = kwargs.get('answers_per_day', (1, 3))
+    panels = max(int(round(rows / (days * (low + high) / 2))), 1)
+    return generate_diary_data(panels=panels, days=days, seed=seed, **kwargs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 다이어리 원시 데이터 CSV를 생성합니다.")
+    parser.add_argument('--rows', type=int, default=10000, help="목표 행 수")
+    parser.add_argument('--days', type=int, default=14, help="패널별 응답 일수")
+    parser.add_argument('--seed', type=int, default=0, help="난수 seed")
+    parser.add_argument('--error-rate', action='append', default=[], metavar='TYPE=RATE',
+                        help=f"오류 유형별 비율 ({', '.join(DEFAULT_ERROR_RATES)})")
+    parser.add_argument('--label-col', default=None, help="주입한 오류 유형을 기록할 컬럼명")
+    parser.add_argument('--out', default='synthetic_data.csv', help="저장할 CSV 경로")
+    args = parser.parse_args()
+
+    error_rates = {}
+    for item in args.error_rate:
+        key, _, value = item.partition('=')
+        error_rates[key.strip()] = float(value)
+
+    df = generate_rows(args.rows, seed=args.seed, days=args.days, error_rates=error_rates, label_col=args.label_col)
+    df.to_csv(args.out, index=False, encoding='utf-8-sig')
+    print(f"{len(df):,} rows / {df[get_column_name('panel_no')].nunique():,} panels -> {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,236 @@
+"""
+검사 함수 동치성 비교 (기존 구현 vs 새 엔진)
+
+check_order_errors, check_count_errors, check_duplicate_times, compare_previous_response_and_time을
+더 빠르게 다시 구현한 경우, 기존 구현과 정확히 같은 행을 찾는지 무작위 데이터로 확인합니다.
+같은 이름의 함수를 가진 모듈을 새 엔진으로 지정하면, 합성 데이터(utils.synthetic_data)에
+아래 경우를 섞어 두 구현을 나란히 실행하고 오류 행 인덱스 차이와 속도 배율을 보고합니다.
+
+- base       : 변환과 같이 정렬 후 RangeIndex
+- midnight   : 자정을 넘기는 착용 시간 (23시 시작 / 0~1시 종료)
+- duplicates : 중복 순번 / 중복 응답이 많은 데이터
+- unsorted   : 행 순서를 섞은 데이터 (인덱스가 정렬되지 않음)
+- deleted    : 일부 행을 삭제한 데이터 (중간이 빠진 인덱스)
+
+오류 행 목록은 add_error_columns와 같이 집합으로 비교합니다. (순서/중복 무시)
+새 엔진을 지정하지 않으면 기존 구현끼리 비교합니다. (비교 환경 확인용)
+
+사용 예:
+    python -m utils.validator_diff --engine my_package.fast_validators --iterations 10
+"""
+
+import argparse
+import importlib
+import sys
+import time
+from types import ModuleType
+from typing import Callable, Dict, List, Optional
+import numpy as np
+import pandas as pd
+import utils.data_processing as legacy
+from utils.synthetic_data import generate_diary_data
+from utils.data_loader import sort_data
+from utils.column_manager import get_column_manager, get_derived_column_names
+
+VALIDATORS = ['check_order_errors', 'check_count_errors', 'check_duplicate_times', 'compare_previous_response_and_time']
+
+VARIANTS = ['base', 'midnight', 'duplicates', 'unsorted', 'deleted']
+
+# 검사 함수별 반환 값 이름 (여러 목록을 반환하는 경우 순서대로)
+RESULT_NAMES = {
+    'check_order_errors': ['order_errors', 'day_order_errors', 'dup_errors'],
+    'check_count_errors': ['count_errors'],
+    'check_duplicate_times': ['duplicate_time_errors'],
+    'compare_previous_response_and_time': ['time_error_errors'],
+}
+
+# 보고서에 표시할 불일치 인덱스 수
+MAX_REPORTED_INDICES = 10
+
+
+def build_calls() -> Dict[str, Callable[[ModuleType, pd.DataFrame], tuple]]:
+    """검사 함수 이름별로 엔진 모듈의 함수를 설정 컬럼명으로 호출하는 함수를 만듭니다."""
+    column_manager = get_column_manager()
+    derived = get_derived_column_names()
+    panel_no = column_manager.get_column('panel_no')
+    product_col = column_manager.get_column('product_col')
+    order_col = column_manager.get_column('order_col')
+    input_col = column_manager.get_column('input_col')
+    index_col = column_manager.get_column('index_col')
+    answer_combine = column_manager.get_error_column('answer_combine')
+
+    return {
+        'check_order_errors': lambda engine, df: engine.check_order_errors(df, panel_no, order_col, input_col),
+        'check_count_errors': lambda engine, df: (engine.check_count_errors(df, panel_no, product_col, index_col),),
+        'check_duplicate_times': lambda engine, df: (engine.check_duplicate_times(df, panel_no, answer_combine),),
+        'compare_previous_response_and_time': lambda engine, df: (engine.compare_previous_response_and_time(
+            df, panel_no, derived['input_month'], derived['input_day'], derived['start_time'], derived['end_time']
+        ),),
+    }
+
+
+def prepare_frame(raw: pd.DataFrame) -> pd.DataFrame:
+    """원시 데이터를 변환 6단계(패널 데이터 검토) 직전 상태로 만듭니다. (process_data와 같은 순서)"""
+    column_manager = get_column_manager()
+    derived = get_derived_column_names()
+    input_col = column_manager.get_column('input_col')
+    order_col = column_manager.get_column('order_col')
+    product_col = column_manager.get_column('product_col')
+    start_col = column_manager.get_column('start_col')
+    end_col = column_manager.get_column('end_col')
+
+    df = sort_data(raw).reset_index(drop=True)
+    df = legacy.split_date_columns(df, input_col)
+    df, time_data = legacy.split_time_columns(df, [start_col, end_col])
+    df = legacy.add_duration_column(df, time_data, start_col, end_col,
+                                    column_manager.get_error_column('total_duration'), derived['end_min'])
+    return legacy.add_answer_combine_column(df, input_col, order_col, product_col, start_col, end_col,
+                                            column_manager.get_error_column('answer_combine'))
+
+
+def make_dataset(variant: str, seed: int, panels: int) -> pd.DataFrame:
+    """
+    비교용 데이터를 생성합니다.
+
+    Args:
+        variant (str): VARIANTS 중 하나
+        seed (int): 난수 seed
+        panels (int): 패널 수
+
+    Returns:
+        DataFrame: 검사 함수 입력 데이터
+    """
+    rng = np.random.default_rng(seed)
+    error_rates = {key: 0.03 for key in ['order', 'duplicate_order', 'day_order', 'duplicate_time', 'previous_time', 'duration']}
+    error_rates['answer_count'] = 0.1
+    if variant == 'duplicates':
+        error_rates.update({'duplicate_order': 0.15, 'duplicate_time': 0.15})
+
+    raw = generate_diary_data(panels=panels, days=int(rng.integers(3, 15)), answers_per_day=(1, 4),
+                              error_rates=error_rates, seed=seed)
+
+    if variant == 'midnight':
+        column_manager = get_column_manager()
+        rows = rng.random(len(raw)) < 0.15
+        count = int(rows.sum())
+        raw.loc[rows, column_manager.get_column('start_col')] = [f'23|{m}' for m in rng.integers(0, 60, count)]
+        raw.loc[rows, column_manager.get_column('end_col')] = [f'{h}|{m}' for h, m in zip(rng.integers(0, 2, count), rng.integers(0, 60, count))]
+
+    df = prepare_frame(raw)
+
+    if variant == 'unsorted':
+        df = df.sample(frac=1, random_state=seed)
+    elif variant == 'deleted':
+        df = df.drop(index=df.index[rng.random(len(df)) < 0.1])
+    return df
+
+
+def load_engine(module_name: Optional[str]) -> ModuleType:
+    """비교할 엔진 모듈을 가져옵니다. (생략 시 기존 구현)"""
+    return importlib.import_module(module_name) if module_name else legacy
+
+
+def run_timed(call: Callable, engine: ModuleType, df: pd.DataFrame) -> tuple:
+    """검사 함수를 데이터 복사본으로 실행하고 (결과, 소요 시간)을 반환합니다."""
+    frame = df.copy()
+    started = time.perf_counter()
+    result = call(engine, frame)
+    return result, time.perf_counter() - started
+
+
+def compare_validators(engine: ModuleType, iterations: int = 5, seed: int = 0, panels: tuple = (10, 40),
+                       validators: Optional[List[str]] = None, variants: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    기존 구현과 엔진의 검사 결과를 무작위 데이터로 비교합니다.
+
+    Args:
+        engine (module): 비교할 엔진 모듈 (검사 함수와 같은 이름/인자의 함수)
+        iterations (int): 경우(variant)별 데이터 수
+        seed (int): 시작 seed
+        panels (tuple): 데이터별 패널 수 범위 (최소, 최대)
+        validators (list, optional): 비교할 검사 함수 이름 (생략 시 VALIDATORS 중 엔진에 있는 것)
+        variants (list, optional): 비교할 경우 (생략 시 VARIANTS 전체)
+
+    Returns:
+        DataFrame: 데이터/검사 함수/결과 목록별 비교 결과
+            (variant, seed, panels, rows, validator, result, flagged, legacy_s, engine_s, missing, extra)
+    """
+    calls = build_calls()
+    validators = [name for name in (validators or VALIDATORS) if hasattr(engine, name)]
+    rng = np.random.default_rng(seed)
+    records = []
+
+    for variant in variants or VARIANTS:
+        for _ in range(iterations):
+            data_seed = int(rng.integers(0, 2 ** 31))
+            panel_count = int(rng.integers(panels[0], panels[1] + 1))
+            df = make_dataset(variant, data_seed, panel_count)
+            for name in validators:
+                legacy_result, legacy_s = run_timed(calls[name], legacy, df)
+                engine_result, engine_s = run_timed(calls[name], engine, df)
+                for result_name, expected, actual in zip(RESULT_NAMES[name], legacy_result, engine_result):
+                    expected, actual = set(expected), set(actual)
+                    records.append({
+                        'variant': variant, 'seed': data_seed, 'panels': panel_count, 'rows': len(df), 'validator': name,
+                        'result': result_name, 'flagged': len(expected),
+                        'legacy_s': legacy_s, 'engine_s': engine_s,
+                        'missing': sorted(expected - actual), 'extra': sorted(actual - expected),
+                    })
+    return pd.DataFrame(records)
+
+
+def summarize(results: pd.DataFrame) -> pd.DataFrame:
+    """
+    검사 함수별 불일치 데이터 수와 속도 배율을 요약합니다.
+
+    속도 배율은 검사 함수 호출 단위 시간의 합계 비율입니다. (기존 / 엔진, 1보다 크면 엔진이 빠름)
+    """
+    results = results.assign(mismatch=(results['missing'].str.len() + results['extra'].str.len()) > 0)
+    # 한 번의 호출이 여러 결과 목록을 반환하므로 시간은 호출(데이터)당 한 번만 합산
+    calls = results.drop_duplicates(['variant', 'seed', 'validator'])
+    summary = results.groupby('validator', sort=False).agg(
+        datasets=('seed', 'nunique'), flagged=('flagged', 'sum'), mismatched=('mismatch', 'sum')
+    )
+    timing = calls.groupby('validator', sort=False)[['legacy_s', 'engine_s']].sum()
+    summary = summary.join(timing)
+    summary['speedup'] = (summary['legacy_s'] / summary['engine_s']).round(2)
+    return summary.round({'legacy_s': 3, 'engine_s': 3}).reset_index()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기존 검사 함수와 새 엔진의 오류 행이 같은지 무작위 데이터로 비교합니다.")
+    parser.add_argument('--engine', default=None, help="비교할 엔진 모듈 (예: my_package.fast_validators, 생략 시 기존 구현)")
+    parser.add_argument('--iterations', type=int, default=5, help="경우별 데이터 수")
+    parser.add_argument('--seed', type=int, default=0, help="시작 seed")
+    parser.add_argument('--panels', type=int, nargs=2, default=[10, 40], metavar=('MIN', 'MAX'), help="데이터별 패널 수 범위")
+    parser.add_argument('--validator', action='append', choices=VALIDATORS, help="비교할 검사 함수 (여러 번 지정 가능)")
+    parser.add_argument('--variant', action='append', choices=VARIANTS, help="비교할 경우 (여러 번 지정 가능)")
+    args = parser.parse_args()
+
+    engine = load_engine(args.engine)
+    missing_functions = [name for name in (args.validator or VALIDATORS) if not hasattr(engine, name)]
+    if missing_functions:
+        print(f"엔진에 없는 검사 함수는 건너뜁니다: {', '.join(missing_functions)}")
+
+    results = compare_validators(engine, args.iterations, args.seed, tuple(args.panels), args.validator, args.variant)
+    if results.empty:
+        print("비교할 검사 함수가 없습니다.")
+        sys.exit(2)
+
+    print(f"\n[{engine.__name__} vs {legacy.__name__}]")
+    print(summarize(results).to_string(index=False))
+
+    mismatches = results[(results['missing'].str.len() + results['extra'].str.len()) > 0]
+    if mismatches.empty:
+        print("\n✅ 모든 데이터에서 오류 행이 같습니다.")
+        return
+
+    print(f"\n❌ 불일치 {len(mismatches)}건 (make_dataset(variant, seed, panels)로 같은 데이터를 다시 만들 수 있습니다)")
+    for row in mismatches.itertuples():
+        print(f"- {row.validator} / {row.result} / {row.variant} seed={row.seed} panels={row.panels} rows={row.rows}: "
+              f"missing={row.missing[:MAX_REPORTED_INDICES]} extra={row.extra[:MAX_REPORTED_INDICES]}")
+    sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
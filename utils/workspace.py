@@ -0,0 +1,221 @@
+"""
+작업 공간(workspace) 스냅샷
+
+브라우저를 닫거나 Streamlit을 다시 시작하면 세션의 작업 데이터와 수정 내역이 사라져,
+원본 엑셀을 다시 읽고 convert_data를 다시 실행해야 합니다.
+이 모듈은 작업 데이터와 세션 정보를 base_directory/workspace 폴더에 저장하고,
+저장된 작업 공간을 메모리 맵으로 읽어 세션을 바로 복원합니다.
+
+작업 공간 구성:
+- data.feather: 작업 데이터 (비압축 Feather - 메모리 맵으로 읽기)
+- data_extra.pkl: Arrow로 저장할 수 없는 컬럼 (문자/숫자가 섞인 컬럼 등, 있는 경우만)
+- settings.toml: 저장 시점의 설정 스냅샷
+- manifest.json: 저장 시점의 데이터셋 ID/버전(기록용), 파일명, 저장 경로, 변경 로그 폴더 등 세션 정보
+
+변경 로그는 이미 로그 폴더(CSV/SQLite)에 저장되므로 복사하지 않고,
+로그 폴더 경로를 기록해 두었다가 복원 시 같은 로그에 이어서 기록합니다.
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import pandas as pd
+import streamlit as st
+import toml
+from features.setting import get_setting_manager
+from utils.dataset import get_dataset
+from utils.column_store import get_full_frame, project_frame, set_side_columns
+from utils.record_log import get_log_dir
+
+WORKSPACE_DIR_NAME = 'workspace'
+WORKSPACE_FORMAT_VERSION = 1
+
+DATA_FILE = 'data.feather'
+EXTRA_FILE = 'data_extra.pkl'
+SETTINGS_FILE = 'settings.toml'
+MANIFEST_FILE = 'manifest.json'
+
+# 작업 공간과 함께 저장/복원하는 세션 값
+SESSION_KEYS = ['curr_file_name', 'raw_data_path', 'base_directory', 'convert_data_path', 'updated_data']
+
+
+def get_workspace_dir(base_dir: str) -> str:
+    """기준 폴더의 작업 공간 폴더 경로를 반환합니다."""
+    return os.path.join(base_dir, WORKSPACE_DIR_NAME)
+
+
+def is_workspace(path: str) -> bool:
+    """폴더가 작업 공간인지(매니페스트와 데이터 파일이 있는지) 확인합니다."""
+    return bool(path) and all(os.path.exists(os.path.join(path, name)) for name in [MANIFEST_FILE, DATA_FILE])
+
+
+def find_workspace(path: str) -> Optional[str]:
+    """선택한 폴더 또는 그 하위 workspace 폴더 중 작업 공간 경로를 반환합니다. (없으면 None)"""
+    for candidate in [path, get_workspace_dir(path) if path else '']:
+        if is_workspace(candidate):
+            return candidate
+    return None
+
+
+def split_arrow_columns(df: pd.DataFrame) -> List[str]:
+    """
+    Arrow 테이블로 변환할 수 없는 컬럼명을 반환합니다.
+
+    엑셀에서 읽은 응답 컬럼은 문자와 숫자가 섞여 있는 경우가 있어,
+    object 컬럼만 하나씩 변환해 보고 실패한 컬럼은 pickle로 따로 저장합니다.
+    """
+    import pyarrow as pa
+
+    unsupported = []
+    for col in df.columns[df.dtypes == object]:
+        try:
+            pa.array(df[col], from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            unsupported.append(col)
+    return unsupported
+
+
+def save_workspace(df: pd.DataFrame, workspace_dir: str, manifest: Dict[str, Any], settings: Dict[str, Any]) -> str:
+    """
+    작업 데이터와 세션 정보를 작업 공간 폴더에 저장합니다. (화면/세션 접근 없음)
+
+    Args:
+        df (DataFrame): 작업 데이터
+        workspace_dir (str): 작업 공간 폴더
+        manifest (dict): 세션 정보 (데이터셋 ID/버전, 세션 값 등)
+        settings (dict): 설정 스냅샷
+
+    Returns:
+        str: 작업 공간 폴더 경로
+    """
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    os.makedirs(workspace_dir, exist_ok=True)
+
+    # Arrow로 저장할 수 없는 컬럼은 따로 저장하고, 원래 컬럼 순서는 매니페스트에 기록
+    extra_columns = split_arrow_columns(df)
+    arrow_df = df.drop(columns=extra_columns) if extra_columns else df
+    table = pa.Table.from_pandas(arrow_df)
+
+    # 임시 파일에 쓴 뒤 교체하여 저장 중 오류가 나도 이전 작업 공간을 유지
+    data_path = os.path.join(workspace_dir, DATA_FILE)
+    feather.write_feather(table, data_path + '.tmp', compression='uncompressed')
+    os.replace(data_path + '.tmp', data_path)
+
+    extra_path = os.path.join(workspace_dir, EXTRA_FILE)
+    if extra_columns:
+        df[extra_columns].to_pickle(extra_path + '.tmp')
+        os.replace(extra_path + '.tmp', extra_path)
+    elif os.path.exists(extra_path):
+        os.remove(extra_path)
+
+    settings_path = os.path.join(workspace_dir, SETTINGS_FILE)
+    with open(settings_path, 'w', encoding='utf-8') as f:
+        toml.dump(settings, f)
+
+    manifest = {
+        **manifest,
+        'format_version': WORKSPACE_FORMAT_VERSION,
+        'saved_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'rows': len(df),
+        'columns': [str(col) for col in df.columns],
+        'extra_columns': [str(col) for col in extra_columns],
+    }
+    manifest_path = os.path.join(workspace_dir, MANIFEST_FILE)
+    with open(manifest_path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(manifest_path + '.tmp', manifest_path)
+    return workspace_dir
+
+
+def read_workspace(workspace_dir: str) -> tuple:
+    """
+    작업 공간을 읽습니다. 데이터 파일은 메모리 맵으로 열어 디스크 읽기 없이 바로 변환합니다.
+
+    Args:
+        workspace_dir (str): 작업 공간 폴더
+
+    Returns:
+        tuple: (작업 데이터, 매니페스트, 설정 스냅샷)
+
+    Raises:
+        ValueError: 지원하지 않는 작업 공간 형식인 경우
+    """
+    import pyarrow.feather as feather
+
+    with open(os.path.join(workspace_dir, MANIFEST_FILE), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('format_version') != WORKSPACE_FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 작업 공간 형식입니다: {manifest.get('format_version')}")
+
+    table = feather.read_table(os.path.join(workspace_dir, DATA_FILE), memory_map=True)
+    df = table.to_pandas()
+
+    extra_columns = manifest.get('extra_columns', [])
+    if extra_columns:
+        extra = pd.read_pickle(os.path.join(workspace_dir, EXTRA_FILE))
+        df = pd.concat([df, extra], axis=1)[manifest['columns']]
+
+    settings = {}
+    settings_path = os.path.join(workspace_dir, SETTINGS_FILE)
+    if os.path.exists(settings_path):
+        with open(settings_path, 'r', encoding='utf-8') as f:
+            settings = toml.load(f)
+    return df, manifest, settings
+
+
+def get_changed_setting_sections(settings: Dict[str, Any]) -> List[str]:
+    """현재 설정과 스냅샷 설정이 다른 섹션명을 반환합니다."""
+    current = get_setting_manager().get_setting()
+    sections = set(current) | set(settings)
+    return sorted(section for section in sections if current.get(section) != settings.get(section))
+
+
+def save_session_workspace() -> Optional[str]:
+    """
+    현재 세션을 base_directory/workspace에 저장합니다.
+
+    Returns:
+        str: 작업 공간 폴더 경로 (저장할 데이터가 없으면 None)
+    """
+    dataset = get_dataset()
+    base_dir = st.session_state.get("base_directory")
+    if dataset.df is None or base_dir is None:
+        return None
+
+    manifest = {
+        'dataset_id': st.session_state.get('dataset_id'),
+        'data_version': dataset.version,
+        'log_save_path': get_log_dir(),
+        'session': {key: st.session_state.get(key) for key in SESSION_KEYS},
+    }
+    # 분리 보관한 컬럼도 함께 저장하고, 열 때 설정에 따라 다시 분리
+    return save_workspace(get_full_frame(), get_workspace_dir(base_dir), manifest, get_setting_manager().get_setting())
+
+
+def open_session_workspace(workspace_dir: str) -> Dict[str, Any]:
+    """
+    작업 공간을 읽어 현재 세션을 복원합니다.
+
+    데이터는 새 데이터셋 ID로 복원하며, 저장 시점의 데이터셋 ID/버전은 매니페스트 정보로만 남습니다.
+    실행 취소 저널은 복원하지 않습니다.
+
+    Returns:
+        dict: 매니페스트 (changed_sections - 현재 설정과 다른 설정 섹션 포함)
+    """
+    df, manifest, settings = read_workspace(workspace_dir)
+
+    session = manifest.get('session', {})
+    for key in SESSION_KEYS:
+        if key in session:
+            st.session_state[key] = session[key]
+    if manifest.get('log_save_path'):
+        st.session_state['log_save_path'] = manifest['log_save_path']
+
+    working, side = project_frame(df)
+    get_dataset().restore(working)
+    set_side_columns(side)
+    manifest['changed_sections'] = get_changed_setting_sections(settings) if settings else []
+    return manifest
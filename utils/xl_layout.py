@@ -20,6 +20,9 @@ def set_xl_layout(xl_path, df, error_columns, check_columns, do_not_modify_colum
 
     df.to_excel(xl_path, sheet_name='Raw data', index=False)
 
+    # 파일 경로 대신 메모리 버퍼(BytesIO)를 받은 경우 처음부터 다시 읽음
+    if hasattr(xl_path, 'seek'):
+        xl_path.seek(0)
     load_xl = xl.load_workbook(xl_path)
     sheet = load_xl.active
 
@@ -164,4 +167,7 @@ def set_xl_layout(xl_path, df, error_columns, check_columns, do_not_modify_colum
     sheet.add_table(table)
 
     # 워크북 저장
+    if hasattr(xl_path, 'seek'):
+        xl_path.seek(0)
+        xl_path.truncate()
     load_xl.save(xl_path)
\ No newline at end of file